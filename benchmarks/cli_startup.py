@@ -0,0 +1,109 @@
+"""Measure the startup time of Rotest's command line interface.
+
+* Use ``python -X importtime`` to list the modules that take most of the time
+  to import when loading ``rotest.cli.main``.
+* Time ``rotest --version`` and ``rotest --list``, and print the best and
+  median of several runs of each.
+
+The commands are run through ``python -c``, so the entry point script wrapper
+(which imports pkg_resources in develop installs) doesn't skew the results.
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+RUN_CLI_CODE = "import sys; from rotest.cli.main import main; " \
+               "sys.argv[0] = 'rotest'; main()"
+IMPORT_CLI_CODE = "import rotest.cli.main"
+COMMANDS = (["--version"], ["--list"])
+TEST_FILE_CONTENT = """from rotest.core import TestCase
+
+
+class StartupCase(TestCase):
+    def test_method(self):
+        pass
+"""
+
+
+def run_command(arguments, cwd=None):
+    """Run Rotest's command line interface and return the time it took.
+
+    Args:
+        arguments (list): arguments to pass to the rotest command.
+        cwd (str): working directory to run the command in.
+
+    Returns:
+        number. the duration of the run, in seconds.
+    """
+    start_time = time.time()
+    subprocess.check_call([sys.executable, "-c", RUN_CLI_CODE] + arguments,
+                          cwd=cwd,
+                          stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE)
+    return time.time() - start_time
+
+
+def get_import_times(count):
+    """Return the modules that take most of the time to import.
+
+    Args:
+        count (number): number of modules to return.
+
+    Returns:
+        list. the (cumulative microseconds, module name) of the slowest
+            modules to import, by descending order.
+    """
+    process = subprocess.Popen([sys.executable, "-X", "importtime", "-c",
+                                IMPORT_CLI_CODE],
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+    _, output = process.communicate()
+
+    import_times = []
+    for line in output.decode("utf-8").splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative_time, module_name = line[len("import time:"):].split("|")
+        import_times.append((int(cumulative_time), module_name.strip()))
+
+    return sorted(import_times, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=7,
+                        help="number of runs of each command")
+    parser.add_argument("--modules", type=int, default=20,
+                        help="number of slowest imported modules to show")
+    arguments = parser.parse_args()
+
+    print("Slowest imports of rotest.cli.main (cumulative):")
+    for cumulative_time, module_name in get_import_times(arguments.modules):
+        print("  %8.3fs  %s" % (cumulative_time / 1e6, module_name))
+
+    # Listing a single test measures mostly the startup
+    work_dir = tempfile.mkdtemp()
+    with open(os.path.join(work_dir, "startup_test.py"), "w") as test_file:
+        test_file.write(TEST_FILE_CONTENT)
+
+    print("\nCommand times (best / median of %d runs):" % arguments.runs)
+    try:
+        for command in COMMANDS:
+            durations = sorted(run_command(command, cwd=work_dir)
+                               for _ in range(arguments.runs))
+            print("  rotest %-10s %.2fs / %.2fs" %
+                  (" ".join(command), durations[0],
+                   durations[len(durations) // 2]))
+
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -53,6 +53,7 @@ setup(
     ],
     extras_require={
         ':python_version=="2.7"': ['statistics'],
+        ':python_version<"3.8"': ['importlib_metadata'],
         "dev": [
             "pytest",
             "pytest-django",
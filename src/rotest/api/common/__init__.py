@@ -4,4 +4,5 @@ from .models import (TestModel,
                      ResourceDescriptorModel,
                      UpdateFieldsParamsModel,
                      LockResourcesParamsModel,
-                     StatisticsRequestModel)
+                     StatisticsRequestModel,
+                     BatchStatisticsRequestModel)
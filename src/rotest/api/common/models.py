@@ -33,6 +33,18 @@ class StatisticsRequestModel(AbstractAPIModel):
     ]
 
 
+class BatchStatisticsRequestModel(AbstractAPIModel):
+    """Model that contains names of many tests or components."""
+    PROPERTIES = [
+        ArrayField(name="test_names", items_type=StringField("test_name"),
+                   example=["MyTest.test_method", "MyFlow"], required=True),
+        NumberField(name="max_sample_size", required=False),
+        NumberField(name="min_duration_cut", required=False),
+        NumberField(name="max_iterations", required=False),
+        NumberField(name="acceptable_ratio", required=False)
+    ]
+
+
 class ResourceDescriptorModel(AbstractAPIModel):
     """Descriptor of a resource.
 
@@ -151,13 +163,56 @@ class AddTestResultParamsModel(AbstractAPIModel):
     ]
 
 
+class TestEventModel(AbstractAPIModel):
+    """Describes a single event of a test, reported as part of a batch.
+
+    Args:
+        event (str): type of the event, e.g. "start_test" or "add_result".
+        test_id (number): the identifier of the test the event refers to.
+        age (number): seconds passed from the event until its batch was
+            sent, so the server doesn't depend on the client's clock.
+        result_code (number): code of the result, for result events.
+        info (str): additional info of the result, for result events.
+        descriptors (list): list of ResourceDescriptorModel. The resources
+            the test used, for resources update events.
+    """
+    TITLE = "Test Event"
+    PROPERTIES = [
+        StringField(name="event", required=True, example="start_test"),
+        NumberField(name="test_id", required=True),
+        NumberField(name="age", required=False),
+        NumberField(name="result_code", required=False),
+        StringField(name="info", required=False),
+        ArrayField(name="descriptors", items_type=ResourceDescriptorModel,
+                   required=False)
+    ]
+
+
+class ReportTestEventsParamsModel(AbstractAPIModel):
+    """Report a batch of test events of a run session.
+
+    Args:
+        token (str): the session token of the current test run.
+        events (list): list of TestEventModel, in the order they occurred.
+        batch_id (number): identifier of the batch in the session, so a
+            resent batch isn't applied twice.
+    """
+    PROPERTIES = [
+        StringField(name="token", required=True),
+        ArrayField(name="events", items_type=TestEventModel, required=True),
+        NumberField(name="batch_id", required=False)
+    ]
+
+
 class TestModel(AbstractAPIModel):
     """Test model structure.
 
     Args:
         id (number): the id of the test.
         name (str): the name of the test.
-        class (str): the classname of the test.
+        class (str): index of the test's data class in the run's classes
+            table, as a number or a string (older clients send the encoded
+            class itself).
         subtests (list): list of TestModel. Sub-tests of the current test.
     """
     TITLE = "Test"
@@ -202,11 +257,14 @@ class StartTestRunParamsModel(AbstractAPIModel):
     Args:
         tests (TestModel): the main test to build the run suite from.
         run_data (RunDataModel): the run data details of the current run.
+        classes (list): the encoded test data classes used in the tests
+            tree, each appearing once.
     """
     PROPERTIES = [
         StringField(name="token", required=True),
         ModelField(name="tests", model=TestModel, required=True),
-        ModelField(name="run_data", model=RunDataModel, required=True)
+        ModelField(name="run_data", model=RunDataModel, required=True),
+        ArrayField(name="classes", items_type=GenericModel, required=False)
     ]
 
 
@@ -219,3 +277,15 @@ class SignatureControlParamsModel(AbstractAPIModel):
     PROPERTIES = [
         StringField(name="error", required=True),
     ]
+
+
+class BatchSignatureControlParamsModel(AbstractAPIModel):
+    """Model structure of signature control operation on many errors.
+
+    Args:
+        errors (list): error messages.
+    """
+    PROPERTIES = [
+        ArrayField(name="errors", items_type=StringField("error"),
+                   required=True),
+    ]
@@ -33,6 +33,27 @@ class TestStatisticsResponse(AbstractResponse):
     ]
 
 
+class BatchTestStatisticsResponse(AbstractResponse):
+    """Returns statistics of many tests, mapped by the tests' names.
+
+    Tests with no usable history are omitted from the statistics.
+    """
+    PROPERTIES = [
+        ModelField(name="statistics", model=GenericModel, required=True)
+    ]
+
+
+class ReportTestEventsResponse(AbstractResponse):
+    """Returns the events of a reported batch that couldn't be applied.
+
+    Each failure contains the index of the event in the batch and the reason
+    it failed. The other events of the batch were applied.
+    """
+    PROPERTIES = [
+        ArrayField(name="failures", items_type=GenericModel, required=True)
+    ]
+
+
 class FailureResponseModel(AbstractResponse):
     """Returns when an invalid request is received."""
     PROPERTIES = [
@@ -57,6 +78,14 @@ class ShouldSkipResponse(AbstractResponse):
     ]
 
 
+class PassedTestsResponse(AbstractResponse):
+    """Returns the names of the tests that passed in the last run."""
+    PROPERTIES = [
+        ArrayField(name="test_names", items_type=StringField("test_name"),
+                   required=True)
+    ]
+
+
 class SignatureResponse(AbstractResponse):
     """Returns in response to get or create signature data action.
 
@@ -67,3 +96,14 @@ class SignatureResponse(AbstractResponse):
         NumberField(name="id", required=True),
         StringField(name="link", required=True)
     ]
+
+
+class BatchSignatureResponse(AbstractResponse):
+    """Returns in response to get or create signatures of many errors.
+
+    The response contains the signature data of each error, in the order of
+    the errors in the request.
+    """
+    PROPERTIES = [
+        ArrayField(name="signatures", items_type=GenericModel, required=True)
+    ]
@@ -88,7 +88,8 @@ class LockResources(DjangoRequestView):
                  (Q(group__isnull=True) | Q(group__in=groups)))
         try:
             matches = descriptor.type.objects.select_for_update() \
-                .filter(query).order_by('-reserved')
+                .filter(query).order_by('-reserved') \
+                .prefetch_related(*descriptor.type.get_related_lookups())
 
         except FieldError as e:
             raise BadRequest(str(e))
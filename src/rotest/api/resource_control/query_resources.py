@@ -51,7 +51,9 @@ class QueryResources(DjangoRequestView):
         query = (Q(is_usable=True, **descriptor.properties))
         query_result = []
         with transaction.atomic():
-            matches = descriptor.type.objects.select_for_update().filter(query)
+            matches = descriptor.type.objects.select_for_update() \
+                .filter(query) \
+                .prefetch_related(*descriptor.type.get_related_lookups())
 
             if matches.count() == 0:
                 raise BadRequest("No existing resource meets "
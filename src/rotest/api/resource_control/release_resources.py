@@ -1,4 +1,4 @@
-# pylint: disable=unused-argument, no-self-use
+# pylint: disable=unused-argument, no-self-use, ungrouped-imports
 from __future__ import absolute_import
 
 from six.moves import http_client
@@ -22,6 +22,17 @@ from rotest.management.common.errors import (ResourceAlreadyAvailableError,
                                              ResourceReleaseError,
                                              ServerError)
 
+try:
+    from django.db.models import prefetch_related_objects
+
+except ImportError:
+    from django.db.models.query import prefetch_related_objects as \
+        _prefetch_related_objects
+
+    def prefetch_related_objects(model_instances, *related_lookups):
+        """Prefetch the lookups of the instances, on Django < 1.10."""
+        _prefetch_related_objects(model_instances, related_lookups)
+
 
 class ReleaseResources(DjangoRequestView):
     """Release the given resources one by one.
@@ -109,6 +120,9 @@ class ReleaseResources(DjangoRequestView):
                     continue
 
                 resource = get_sub_model(resource_data)
+                if resource is not None:
+                    prefetch_related_objects(
+                        [resource], *resource.get_related_lookups())
 
                 try:
                     self.release_resource(resource, username)
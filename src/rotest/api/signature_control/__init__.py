@@ -1 +1,2 @@
 from .get_or_create import GetOrCreate
+from .get_or_create_batch import GetOrCreateBatch
@@ -1,18 +1,66 @@
-# pylint: disable=unused-argument
+# pylint: disable=unused-argument, no-self-use
 from __future__ import absolute_import
 
-import re
-
 from six.moves import http_client
 
 from swaggapi.api.builder.server.response import Response
 from swaggapi.api.builder.server.request import DjangoRequestView
 
 from rotest.core.models import SignatureData
+from rotest.core.utils.signature_index import SIGNATURE_INDEX
 from rotest.api.common.responses import SignatureResponse
 from rotest.api.common.models import SignatureControlParamsModel
 
 
+def match_signatures(error_str, fingerprint):
+    """Return the data of the matched signature.
+
+    The error is matched against the patterns first, so editing the
+    signatures' patterns always takes effect. Errors that no pattern
+    matches are looked up by the fingerprint of the error their signature
+    was created from.
+
+    Args:
+        error_str (str): exception traceback string.
+        fingerprint (str): fingerprint of the exception traceback.
+
+    Returns:
+        SignatureData. the signature of the given exception.
+    """
+    match = SIGNATURE_INDEX.match(error_str)
+    if match is not None:
+        return match
+
+    return SignatureData.objects.filter(
+                        fingerprint=fingerprint).order_by("id").first()
+
+
+def get_or_create_signature(error_message):
+    """Get the signature data of an error, creating one if there is none.
+
+    Args:
+        error_message (str): string of the error.
+
+    Returns:
+        dict. whether the signature was created, its id and its link.
+    """
+    # Normalize newline char
+    error_message = error_message.replace("\r\n", "\n")
+    fingerprint = SignatureData.create_fingerprint(error_message)
+
+    match = match_signatures(error_message, fingerprint)
+
+    is_new = False
+    if match is None:
+        is_new = True
+        pattern = SignatureData.create_pattern(error_message)
+        match = SignatureData.objects.create(link="",
+                                             pattern=pattern,
+                                             fingerprint=fingerprint)
+
+    return {"is_new": is_new, "id": match.id, "link": match.link}
+
+
 class GetOrCreate(DjangoRequestView):
     """Get or create error signature in the DB.
 
@@ -28,41 +76,7 @@ class GetOrCreate(DjangoRequestView):
         "post": ["Signatures"]
     }
 
-    @staticmethod
-    def _match_signatures(error_str):
-        """Return the data of the matched signature.
-
-        Args:
-            error_str (str): exception traceback string.
-
-        Returns:
-            SignatureData. the signature of the given exception.
-        """
-        for signature in SignatureData.objects.all():
-            signature_reg = re.compile(signature.pattern,
-                                       re.MULTILINE)
-            if signature_reg.match(error_str):
-                return signature
-
-        return None
-
     def post(self, request, *args, **kwargs):
         """Get signature data for an error or create a new one."""
-        error_message = request.model.error
-        # Normalize newline char
-        error_message = error_message.replace("\r\n", "\n")
-
-        match = self._match_signatures(error_message)
-
-        is_new = False
-        if match is None:
-            is_new = True
-            pattern = SignatureData.create_pattern(error_message)
-            match = SignatureData.objects.create(link="",
-                                                 pattern=pattern)
-
-        return Response({
-            "is_new": is_new,
-            "id": match.id,
-            "link": match.link
-        }, status=http_client.OK)
+        return Response(get_or_create_signature(request.model.error),
+                        status=http_client.OK)
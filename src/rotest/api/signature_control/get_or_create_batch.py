@@ -0,0 +1,34 @@
+# pylint: disable=unused-argument, no-self-use
+from __future__ import absolute_import
+
+from six.moves import http_client
+
+from swaggapi.api.builder.server.response import Response
+from swaggapi.api.builder.server.request import DjangoRequestView
+
+from rotest.api.common.responses import BatchSignatureResponse
+from rotest.api.common.models import BatchSignatureControlParamsModel
+from rotest.api.signature_control.get_or_create import get_or_create_signature
+
+
+class GetOrCreateBatch(DjangoRequestView):
+    """Get or create the signatures of many errors in a single request.
+
+    Args:
+        errors (list): strings of the errors.
+    """
+    URI = "signatures/batch_get_or_create"
+    DEFAULT_MODEL = BatchSignatureControlParamsModel
+    DEFAULT_RESPONSES = {
+        http_client.OK: BatchSignatureResponse,
+    }
+    TAGS = {
+        "post": ["Signatures"]
+    }
+
+    def post(self, request, *args, **kwargs):
+        """Get signature data for each error, creating the missing ones."""
+        return Response({
+            "signatures": [get_or_create_signature(error_message)
+                           for error_message in request.model.errors]
+        }, status=http_client.OK)
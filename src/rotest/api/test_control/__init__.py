@@ -3,8 +3,11 @@ from .start_test import StartTest
 from .should_skip import ShouldSkip
 from .start_test_run import StartTestRun
 from .stop_composite import StopComposite
+from .get_passed_tests import GetPassedTests
 from .add_test_result import AddTestResult
 from .update_run_data import UpdateRunData
 from .start_composite import StartComposite
 from .get_statistics import GetTestStatistics
 from .update_resources import UpdateResources
+from .get_batch_statistics import GetBatchTestStatistics
+from .report_test_events import ReportTestEvents
@@ -0,0 +1,61 @@
+# pylint: disable=unused-argument, no-self-use
+from __future__ import absolute_import
+
+from six.moves import http_client
+from swaggapi.api.builder.server.response import Response
+from swaggapi.api.builder.server.request import DjangoRequestView
+
+from rotest.api.common.models import BatchStatisticsRequestModel
+from rotest.api.test_control.middleware import session_middleware
+from rotest.core.utils.test_statistics import (clean_data,
+                                               summarize_durations,
+                                               collect_batch_durations)
+from rotest.api.common.responses import (BatchTestStatisticsResponse,
+                                         FailureResponseModel)
+
+
+class GetBatchTestStatistics(DjangoRequestView):
+    """Get statistics for many tests or components in a single request."""
+    URI = "tests/get_batch_statistics"
+    DEFAULT_MODEL = BatchStatisticsRequestModel
+    DEFAULT_RESPONSES = {
+        http_client.OK: BatchTestStatisticsResponse,
+        http_client.BAD_REQUEST: FailureResponseModel
+    }
+    TAGS = {
+        "post": ["Tests"]
+    }
+
+    @session_middleware
+    def post(self, request, sessions, *args, **kwargs):
+        """Return the statistics of all the requested tests.
+
+        Tests with no history, or whose history is too disparate, are left
+        out of the response instead of failing the whole request.
+        """
+        parameters = {"test_names": request.model.test_names}
+        if request.model.max_sample_size is not None:
+            parameters["max_size"] = request.model.max_sample_size
+
+        all_durations = collect_batch_durations(**parameters)
+
+        parameters = {}
+        if request.model.min_duration_cut is not None:
+            parameters["min_duration_cut"] = request.model.min_duration_cut
+        if request.model.max_iterations is not None:
+            parameters["max_iterations"] = request.model.max_iterations
+        if request.model.acceptable_ratio is not None:
+            parameters["acceptable_ratio"] = request.model.acceptable_ratio
+
+        statistics = {}
+        for test_name, test_durations in all_durations.items():
+            if len(test_durations) < 1:
+                continue
+
+            test_durations = clean_data(test_durations, **parameters)
+            if len(test_durations) < 1:
+                continue
+
+            statistics[test_name] = summarize_durations(test_durations)
+
+        return Response({"statistics": statistics}, status=http_client.OK)
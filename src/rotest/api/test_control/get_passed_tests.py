@@ -0,0 +1,49 @@
+# pylint: disable=unused-argument,no-self-use
+from __future__ import absolute_import
+
+from six.moves import http_client
+from swaggapi.api.builder.server.response import Response
+from swaggapi.api.builder.server.exceptions import BadRequest
+from swaggapi.api.builder.server.request import DjangoRequestView
+
+from rotest.api.common.models import TokenModel
+from rotest.api.test_control.middleware import session_middleware
+from rotest.api.common.responses import (PassedTestsResponse,
+                                         FailureResponseModel)
+
+
+class GetPassedTests(DjangoRequestView):
+    """Get the names of the tests that passed in the last run.
+
+    Used by delta runs to decide which tests to skip with a single request,
+    instead of asking about each test separately.
+
+    Args:
+        token (str): token of the session.
+    """
+    URI = "tests/get_passed_tests"
+    DEFAULT_MODEL = TokenModel
+    DEFAULT_RESPONSES = {
+        http_client.OK: PassedTestsResponse,
+        http_client.BAD_REQUEST: FailureResponseModel
+    }
+    TAGS = {
+        "get": ["Tests"]
+    }
+
+    @session_middleware
+    def get(self, request, sessions, *args, **kwargs):
+        """Get the names of the tests that passed in the last run.
+
+        Args:
+            token (str): token of the session.
+        """
+        try:
+            session_data = sessions[request.model.token]
+
+        except KeyError:
+            raise BadRequest("Invalid token provided!")
+
+        return Response({
+            "test_names": sorted(session_data.get_passed_tests())
+        }, status=http_client.OK)
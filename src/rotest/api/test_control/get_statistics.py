@@ -8,7 +8,9 @@ from swaggapi.api.builder.server.request import DjangoRequestView
 
 from rotest.api.common.models import StatisticsRequestModel
 from rotest.api.test_control.middleware import session_middleware
-from rotest.core.utils.test_statistics import clean_data, collect_durations
+from rotest.core.utils.test_statistics import (clean_data,
+                                               collect_durations,
+                                               summarize_durations)
 from rotest.api.common.responses import (TestStatisticsResponse,
                                          FailureResponseModel)
 
@@ -48,10 +50,5 @@ class GetTestStatistics(DjangoRequestView):
         if len(test_durations) < 1:
             raise BadRequest("Test history disparity too wide!")
 
-        response = {
-            "min": min(test_durations),
-            "avg": sum(test_durations) / len(test_durations),
-            "max": max(test_durations)
-        }
-
-        return Response(response, status=http_client.OK)
+        return Response(summarize_durations(test_durations),
+                        status=http_client.OK)
@@ -2,6 +2,8 @@
 # pylint: disable=unused-argument,no-self-use
 from future.builtins import object
 
+from rotest.core.models.case_data import CaseData
+
 SESSIONS = {}
 
 
@@ -26,9 +28,30 @@ class SessionData(object):
         run_data (RunData): run data object that describes the test run.
         main_test (GeneralData): the main test of the run suite.
         resources (list): resources locked in the session.
+        passed_tests (set): names of the tests that passed in the last run
+            with the same run name, or None if they weren't queried yet.
+        reported_batches (dict): maps the identifiers of the events batches
+            already applied to the failures of their events.
     """
     def __init__(self):
         self.all_tests = {}
         self.run_data = None
         self.main_test = None
         self.resources = []
+        self.passed_tests = None
+        self.reported_batches = {}
+
+    def get_passed_tests(self):
+        """Return the names of the session's tests that passed in the last run.
+
+        The names are queried once per session and cached for later calls.
+
+        Returns:
+            set. names of the tests whose last run was successful.
+        """
+        if self.passed_tests is None:
+            self.passed_tests = CaseData.get_passed_names(
+                (test_data.name for test_data in self.all_tests.values()),
+                self.run_data)
+
+        return self.passed_tests
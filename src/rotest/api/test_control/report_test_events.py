@@ -0,0 +1,171 @@
+# pylint: disable=unused-argument, no-self-use, broad-except
+from __future__ import absolute_import
+
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from six.moves import http_client
+from swaggapi.api.builder.server.response import Response
+from swaggapi.api.builder.server.exceptions import BadRequest
+from swaggapi.api.builder.server.request import DjangoRequestView
+
+from rotest.core.models import CaseData
+from rotest.core.utils.test_statistics import update_statistics
+from rotest.api.common.models import ReportTestEventsParamsModel
+from rotest.api.test_control.middleware import session_middleware
+from rotest.management.common.resource_descriptor import ResourceDescriptor
+from rotest.api.common.responses import (ReportTestEventsResponse,
+                                         FailureResponseModel)
+from rotest.management.common.utils import (START_TEST_EVENT,
+                                            STOP_TEST_EVENT,
+                                            ADD_RESULT_EVENT,
+                                            START_COMPOSITE_EVENT,
+                                            STOP_COMPOSITE_EVENT,
+                                            UPDATE_RESOURCES_EVENT)
+
+
+def _get_event_time(event, receive_time):
+    """Return the time of the event, according to the server's clock.
+
+    Args:
+        event (AttrDict): the reported event.
+        receive_time (datetime): the time the events batch was received.
+
+    Returns:
+        datetime. the time the event occurred, or None if it wasn't sent.
+    """
+    event_age = event.get("age")
+    if event_age is None:
+        return None
+
+    return receive_time - timedelta(seconds=event_age)
+
+
+def _start_test(test_data, event, receive_time):
+    """Update the test data to 'in progress' state and set the start time."""
+    test_data.start()
+    test_data.start_time = (_get_event_time(event, receive_time) or
+                            test_data.start_time)
+
+
+def _stop_test(test_data, event, receive_time):
+    """Update the test data to 'finished' state and set the end time."""
+    test_data.end()
+    test_data.end_time = (_get_event_time(event, receive_time) or
+                          test_data.end_time)
+
+
+def _stop_composite(test_data, event, receive_time):
+    """End the composite test according to its sub tests."""
+    test_data.success = all(sub_test.success for sub_test in test_data)
+    _stop_test(test_data, event, receive_time)
+
+
+def _add_result(test_data, event, receive_time):
+    """Add a result to the test."""
+    test_data.update_result(event.result_code, event.get("info") or "")
+
+
+def _update_resources(test_data, event, receive_time):
+    """Update the resources list for the test data."""
+    test_data.resources.clear()
+
+    for resource_descriptor in event.get("descriptors", ()):
+        resource_dict = ResourceDescriptor.decode(resource_descriptor)
+        test_data.resources.add(resource_dict.type.objects.get(
+            **resource_dict.properties))
+
+
+class ReportTestEvents(DjangoRequestView):
+    """Apply a batch of test events, in the order they occurred.
+
+    Each event is applied in its own savepoint, so an invalid event is
+    reported back in the response without discarding the rest of the batch.
+    A batch sent with an identifier is applied once per session, resending
+    it (e.g. after the reply to the first attempt was lost) only returns the
+    failures of the first attempt.
+    The events' times are given relative to the time the batch was sent, and
+    are rebased on the time it was received, so the saved times don't
+    depend on the client's clock.
+
+    Args:
+        token (str): token of the session.
+        events (list): the events to apply.
+        batch_id (number): identifier of the batch in the session.
+    """
+    URI = "tests/report_events"
+    DEFAULT_MODEL = ReportTestEventsParamsModel
+    DEFAULT_RESPONSES = {
+        http_client.OK: ReportTestEventsResponse,
+        http_client.BAD_REQUEST: FailureResponseModel
+    }
+    TAGS = {
+        "post": ["Tests"]
+    }
+
+    EVENT_HANDLERS = {
+        START_TEST_EVENT: _start_test,
+        STOP_TEST_EVENT: _stop_test,
+        START_COMPOSITE_EVENT: _start_test,
+        STOP_COMPOSITE_EVENT: _stop_composite,
+        ADD_RESULT_EVENT: _add_result,
+        UPDATE_RESOURCES_EVENT: _update_resources
+    }
+
+    def _apply_event(self, session_data, event, receive_time):
+        """Apply a single event to its test's data.
+
+        Args:
+            session_data (SessionData): the session the event belongs to.
+            event (AttrDict): the event to apply.
+            receive_time (datetime): the time the events batch was received.
+
+        Raises:
+            ValueError: the event's type or test are unknown.
+        """
+        try:
+            test_data = session_data.all_tests[event.get("test_id")]
+            handler = self.EVENT_HANDLERS[event.get("event")]
+
+        except KeyError:
+            raise ValueError("Invalid event %r provided (Test timed out?)" %
+                             event.get("event"))
+
+        handler(test_data, event, receive_time)
+        test_data.save()
+        if (event.event == STOP_TEST_EVENT and
+                isinstance(test_data, CaseData)):
+
+            update_statistics(test_data)
+
+    @session_middleware
+    def post(self, request, sessions, *args, **kwargs):
+        """Apply a batch of test events, in the order they occurred."""
+        receive_time = datetime.now()
+        try:
+            session_data = sessions[request.model.token]
+
+        except KeyError:
+            raise BadRequest("Invalid token provided!")
+
+        batch_id = getattr(request.model, "batch_id", None)
+        if batch_id in session_data.reported_batches:
+            return Response({
+                "failures": session_data.reported_batches[batch_id]
+            }, status=http_client.OK)
+
+        failures = []
+        with transaction.atomic():
+            for index, event in enumerate(request.model.events):
+                try:
+                    with transaction.atomic():
+                        self._apply_event(session_data, event, receive_time)
+
+                except Exception as error:
+                    failures.append({"index": index,
+                                     "details": str(error)})
+
+        if batch_id is not None:
+            session_data.reported_batches[batch_id] = failures
+
+        return Response({"failures": failures}, status=http_client.OK)
@@ -6,6 +6,7 @@ from swaggapi.api.builder.server.response import Response
 from swaggapi.api.builder.server.exceptions import BadRequest
 from swaggapi.api.builder.server.request import DjangoRequestView
 
+from rotest.core.models.case_data import CaseData
 from rotest.api.test_control.middleware import session_middleware
 from rotest.api.common.models import TestControlOperationParamsModel
 from rotest.api.common.responses import (ShouldSkipResponse,
@@ -49,11 +50,8 @@ class ShouldSkip(DjangoRequestView):
             raise BadRequest("Invalid token/test_id provided "
                              "(Test timed out?)")
 
-        run_data = session_data.run_data
-
-        test_should_skip = test_data.should_skip(test_name=test_data.name,
-                                                 run_data=run_data,
-                                                 exclude_pk=test_data.pk)
+        test_should_skip = (isinstance(test_data, CaseData) and
+                            test_data.name in session_data.get_passed_tests())
         reason = SKIP_DELTA_MESSAGE if test_should_skip else ""
 
         return Response({
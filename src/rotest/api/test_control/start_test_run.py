@@ -1,7 +1,11 @@
-# pylint: disable=unused-argument, no-self-use
+# pylint: disable=unused-argument, no-self-use, too-many-arguments
 from __future__ import absolute_import
 
+from numbers import Number
+
+import six
 from six.moves import http_client
+from django.db import transaction
 from swaggapi.api.builder.server.response import Response
 from swaggapi.api.builder.server.exceptions import BadRequest
 from swaggapi.api.builder.server.request import DjangoRequestView
@@ -37,17 +41,43 @@ class StartTestRun(DjangoRequestView):
         "post": ["Tests"]
     }
 
-    def _create_test_data(self, test_dict, run_data, all_tests):
+    @staticmethod
+    def _get_data_type(class_code, data_types, parser):
+        """Return the test data class described by the class code.
+
+        Args:
+            class_code (object): index of the class in the run's classes
+                table (a number or a string), or the encoded class itself.
+            data_types (list): the run's decoded classes table.
+            parser (JSONParser): the request's parser.
+
+        Returns:
+            type. the test data class.
+        """
+        if isinstance(class_code, (Number, six.string_types)):
+            return data_types[int(class_code)]
+
+        return parser.recursive_decode(class_code)
+
+    def _create_test_data(self, test_dict, run_data, all_tests, data_types,
+                          parser, parent=None):
         """Recursively create the test's datas and add them to 'all_tests'.
 
+        Each data is saved once, after its parent was already saved.
+
         Args:
-            tests_tree (dict): contains the hierarchy of the tests in the run.
+            test_dict (dict): contains the hierarchy of the test.
+            run_data (RunData): the run data of the tests.
+            all_tests (dict): maps the tests' identifiers to their datas.
+            data_types (list): the run's decoded classes table.
+            parser (JSONParser): the request's parser.
+            parent (GeneralData): the data of the containing test.
 
         Returns:
             GeneralData. the created test data object.
         """
-        parser = JSONParser()
-        data_type = parser.recursive_decode(test_dict[TEST_CLASS_CODE_KEY])
+        data_type = self._get_data_type(test_dict[TEST_CLASS_CODE_KEY],
+                                        data_types, parser)
         try:
             test_data = data_type(name=test_dict[TEST_NAME_KEY])
 
@@ -55,16 +85,19 @@ class StartTestRun(DjangoRequestView):
             raise BadRequest("Invalid type provided: {}".format(data_type))
 
         test_data.run_data = run_data
+        if parent is not None:
+            parent.add_sub_test_data(test_data)
+
         test_data.save()
         all_tests[test_dict[TEST_ID_KEY]] = test_data
 
-        if TEST_SUBTESTS_KEY in test_dict:
-            for sub_test_dict in test_dict[TEST_SUBTESTS_KEY]:
-                sub_test = self._create_test_data(sub_test_dict,
-                                                  run_data,
-                                                  all_tests)
-                test_data.add_sub_test_data(sub_test)
-                sub_test.save()
+        for sub_test_dict in test_dict.get(TEST_SUBTESTS_KEY, ()):
+            self._create_test_data(sub_test_dict,
+                                   run_data,
+                                   all_tests,
+                                   data_types,
+                                   parser,
+                                   parent=test_data)
 
         return test_data
 
@@ -75,24 +108,38 @@ class StartTestRun(DjangoRequestView):
         Args:
             tests_tree (dict): contains the hierarchy of the tests in the run.
             run_data (dict): contains additional data about the run.
+            classes (list): encoded test data classes, referred to by index
+                from the tests tree.
         """
-        try:
-            run_data = RunData.objects.create(**request.model.run_data)
+        # The parser fills its type caches on use, so concurrent requests
+        # don't share one
+        parser = JSONParser()
 
-        except TypeError:
-            raise BadRequest("Invalid run data provided!")
+        # Old clients send the encoded class in each node of the tree
+        classes = getattr(request.model, "classes", None) or ()
+        data_types = [parser.recursive_decode(class_code)
+                      for class_code in classes]
 
         all_tests = {}
         tests_tree = request.model.tests
-        try:
-            main_test = self._create_test_data(tests_tree, run_data, all_tests)
+        with transaction.atomic():
+            try:
+                run_data = RunData.objects.create(**request.model.run_data)
+
+            except TypeError:
+                raise BadRequest("Invalid run data provided!")
+
+            try:
+                main_test = self._create_test_data(tests_tree, run_data,
+                                                   all_tests, data_types,
+                                                   parser)
 
-        except KeyError:
-            raise BadRequest("Invalid tests tree provided!")
+            except (KeyError, IndexError, ValueError):
+                raise BadRequest("Invalid tests tree provided!")
 
-        run_data.main_test = main_test
-        run_data.user_name = request.get_host()
-        run_data.save()
+            run_data.main_test = main_test
+            run_data.user_name = request.get_host()
+            run_data.save()
 
         session = sessions[request.model.token]
         session.all_tests = all_tests
@@ -6,6 +6,8 @@ from swaggapi.api.builder.server.response import Response
 from swaggapi.api.builder.server.exceptions import BadRequest
 from swaggapi.api.builder.server.request import DjangoRequestView
 
+from rotest.core.models import CaseData
+from rotest.core.utils.test_statistics import update_statistics
 from rotest.api.test_control.middleware import session_middleware
 from rotest.api.common.models import TestControlOperationParamsModel
 from rotest.api.common.responses import SuccessResponse, FailureResponseModel
@@ -46,5 +48,7 @@ class StopTest(DjangoRequestView):
 
         test_data.end()
         test_data.save()
+        if isinstance(test_data, CaseData):
+            update_statistics(test_data)
 
         return Response({}, status=http_client.NO_CONTENT)
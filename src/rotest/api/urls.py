@@ -6,7 +6,7 @@ from swaggapi.build import Swagger
 from swaggapi.api.openapi.models import Info, License, Tag
 
 from rotest.api.request_token import RequestToken
-from rotest.api.signature_control import GetOrCreate
+from rotest.api.signature_control import GetOrCreate, GetOrCreateBatch
 from rotest.api.resource_control import (CleanupUser,
                                          LockResources,
                                          ReleaseResources,
@@ -19,9 +19,12 @@ from rotest.api.test_control import (StartTestRun,
                                      StopComposite,
                                      StartComposite,
                                      ShouldSkip,
+                                     GetPassedTests,
                                      AddTestResult,
                                      UpdateResources,
-                                     GetTestStatistics)
+                                     GetTestStatistics,
+                                     GetBatchTestStatistics,
+                                     ReportTestEvents)
 
 requests = [
     RequestToken,
@@ -41,12 +44,16 @@ requests = [
     StopComposite,
     StartComposite,
     ShouldSkip,
+    GetPassedTests,
     AddTestResult,
     UpdateResources,
     GetTestStatistics,
+    GetBatchTestStatistics,
+    ReportTestEvents,
 
     # Signatures
-    GetOrCreate
+    GetOrCreate,
+    GetOrCreateBatch
 ]
 
 info = Info(title="Rotest OpenAPI",
@@ -51,18 +51,18 @@ from itertools import chain
 
 import six
 import django
-import pkg_resources
 from attrdict import AttrDict
 
 django.setup()  # noqa
 
 from rotest.common import core_log
 from rotest.core.suite import TestSuite
-from rotest.core.filter import match_tags
+from rotest.core.filter import compile_tags_filter
 from rotest.common.utils import parse_config_file
 from rotest.core.utils.common import print_test_hierarchy
-from rotest.core.result.result import get_result_handlers
-from rotest.cli.discover import discover_tests_under_paths
+from rotest.core.result.result import get_result_handler_names
+from rotest.common.entry_points import get_version, load_entry_points
+from rotest.cli.discover import discover_tests_under_paths, load_tests
 from rotest.common.constants import (DEFAULT_CONFIG_PATH, DEFAULT_SCHEMA_PATH,
                                      default_config)
 from rotest.core.runner import (update_resource_requests, run as rotest_runner,
@@ -83,7 +83,7 @@ def parse_outputs_option(outputs):
 
     requested_handlers = outputs.split(",")
 
-    available_handlers = get_result_handlers()
+    available_handlers = get_result_handler_names()
 
     non_existing_handlers = set(requested_handlers) - set(available_handlers)
 
@@ -142,14 +142,12 @@ def create_client_options_parser():
     Returns:
         argparse.ArgumentParser: parser for CLI options.
     """
-    version = pkg_resources.get_distribution("rotest").version
-
     parser = argparse.ArgumentParser(
         description="Run tests in a module or directory.")
 
     parser.add_argument("paths", nargs="*", default=(".",))
     parser.add_argument("--version", action="version",
-                        version="rotest {}".format(version))
+                        version="rotest {}".format(get_version()))
     parser.add_argument("--config", "-c", dest="config_path", metavar="path",
                         default=DEFAULT_CONFIG_PATH,
                         help="Test configuration file path")
@@ -165,7 +163,7 @@ def create_client_options_parser():
     parser.add_argument("--outputs", "-o",
                         type=parse_outputs_option,
                         help="Output handlers separated by comma. Options: {}"
-                        .format(", ".join(get_result_handlers())))
+                        .format(", ".join(get_result_handler_names())))
     parser.add_argument("--filter", "-f", metavar="query",
                         help="Run only tests that match the filter "
                              "expression, e.g. 'Tag1* and not Tag13'")
@@ -191,10 +189,9 @@ def create_client_options_parser():
                         help="Specify resources to request be attributes, "
                              "e.g. '-r res1.group=QA,res2.comment=CI'")
 
-    for entry_point in \
-            pkg_resources.iter_entry_points("rotest.cli_client_parsers"):
-        core_log.debug("Applying client entry point %s", entry_point.name)
-        extension_parser = entry_point.load()
+    for name, extension_parser in \
+            load_entry_points("rotest.cli_client_parsers").items():
+        core_log.debug("Applying client entry point %s", name)
         extension_parser(parser)
 
     return parser
@@ -223,22 +220,29 @@ def main(*tests):
         config.paths = (main_module,)
 
     if len(tests) == 0:
-        tests = list(discover_tests_under_paths(config.paths))
+        tests = list(discover_tests_under_paths(config.paths,
+                                                tags_filter=config.filter,
+                                                lazy=True))
 
     if config.filter is not None:
+        tests_filter = compile_tags_filter(config.filter)
         tests = [test for test in tests
-                 if match_tags(get_tags_by_class(test), config.filter)]
+                 if tests_filter(get_tags_by_class(test))]
 
     for tag in reversed(config.order):
+        tag_filter = compile_tags_filter(tag)
         tests.sort(
             reverse=True,
-            key=lambda test_class: match_tags(get_tags_by_class(test_class),
-                                              tag))
+            key=lambda test_class: tag_filter(get_tags_by_class(test_class)))
+
+    extension_actions = load_entry_points("rotest.cli_client_actions")
+    # Listing uses the hierarchies of the indexed tests, and runs import only
+    # the files of the selected tests
+    if not config.list or len(extension_actions) > 0:
+        tests = load_tests(tests)
 
-    for entry_point in \
-            pkg_resources.iter_entry_points("rotest.cli_client_actions"):
-        core_log.debug("Applying entry point %s", entry_point.name)
-        extension_action = entry_point.load()
+    for name, extension_action in extension_actions.items():
+        core_log.debug("Applying entry point %s", name)
         extension_action(tests, config)
 
     if len(tests) == 0:
@@ -1,19 +1,30 @@
 # pylint: disable=protected-access
 from __future__ import absolute_import
 import os
+import sys
+import json
+import inspect
 import unittest
 from fnmatch import fnmatch
 from collections import OrderedDict
 
 import py
+from future.builtins import object, zip
 
 from rotest.common import core_log
 from rotest.core.case import TestCase
 from rotest.core.flow import TestFlow
-from rotest.common.config import DISCOVERER_BLACKLIST
+from rotest.core.filter import compile_tags_filter
+from rotest.core.utils.common import get_test_hierarchy
+from rotest.cli.source_scan import scan_files, find_test_candidates
+from rotest.common.config import (DISCOVERER_BLACKLIST, DISCOVERY_INDEX,
+                                  ROTEST_WORK_DIR)
 
 
 WHITE_LIST = ["*.py"]
+DISCOVERY_INDEX_PATH = os.path.join(ROTEST_WORK_DIR, "discovery_index.json")
+ROTEST_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__)))
 
 
 def is_test_class(test):
@@ -62,32 +73,389 @@ def get_test_files(paths):
                 yield sub_file
 
 
-def discover_tests_under_paths(paths):
-    """Search recursively for every test class under the given paths.
+def get_source_file(cls):
+    """Return the path of the source file of the class's module.
 
     Args:
-        paths (iterable): list of filesystem paths to be searched.
+        cls (type): class to get the file of.
 
     Returns:
-        set: all discovered tests.
+        str: path of the source file, or None if it's unknown.
+    """
+    module = sys.modules.get(cls.__module__)
+    file_path = getattr(module, "__file__", None)
+    if file_path is None:
+        return None
+
+    if file_path.endswith((".pyc", ".pyo")):
+        file_path = file_path[:-1]
+
+    return os.path.abspath(file_path)
+
+
+def get_test_source(path, test):
+    """Return the path of the file that defines the test.
+
+    Tests that are imported by several test files are discovered once, by
+    the file that defines them.
+
+    Args:
+        path (str): path of the test file the test was found in.
+        test (type): test class.
+
+    Returns:
+        str: path of the file of the test's module, or the given path for
+            tests that were created by Rotest (e.g. using create_flow).
+    """
+    source_file = get_source_file(test)
+    if source_file is None or source_file.startswith(ROTEST_PACKAGE_DIR):
+        return path
+
+    return source_file
+
+
+def get_sub_test_classes(test):
+    """Yield the test class and the classes of its sub tests.
+
+    Args:
+        test (type): test class.
+
+    Yields:
+        type: the test class, and for flows, the classes of their blocks
+            and sub flows.
+    """
+    yield test
+    if issubclass(test, TestFlow):
+        for block in test.blocks:
+            for sub_test in get_sub_test_classes(block):
+                yield sub_test
+
+
+def import_test_file(path):
+    """Import the file and find the test classes in it.
+
+    Args:
+        path (str): path of the test file.
+
+    Returns:
+        tuple: all the test classes found in the file, and its runnable
+            tests, without repetitions.
     """
     loader = unittest.TestLoader()
     loader.suiteClass = list
     loader.loadTestsFromTestCase = lambda test: test
 
+    module = py.path.local(path).pyimport()
+    test_classes = loader.loadTestsFromModule(module)
+    tests = OrderedDict((test, test) for test in test_classes
+                        if is_test_class(test))
+
+    return test_classes, list(tests)
+
+
+class IndexedTest(object):
+    """A test of an indexed file, whose file is imported only when loaded.
+
+    It has the name and tags of its test class, so it can be filtered and
+    ordered like one, and the hierarchy of the test, so it can be listed.
+
+    Args:
+        path (str): path of the file the test was found in.
+        indexed_test (list): the name, tags, hierarchy and source file of the
+            test, as kept by :class:`DiscoveryIndex`.
+
+    Attributes:
+        path (str): path of the file the test was found in.
+        source (str): path of the file that defines the test.
+        TAGS (list): tags of the test class.
+        hierarchy (dict): the test's hierarchy, see
+            :func:`rotest.core.utils.common.get_test_hierarchy`.
+    """
+    def __init__(self, path, indexed_test):
+        self.path = path
+        self.__name__, self.TAGS, self.hierarchy, self.source = indexed_test
+
+    def __repr__(self):
+        return "%s(%r, %r)" % (self.__class__.__name__, self.path,
+                               self.__name__)
+
+    def load(self):
+        """Import the test's file and return the test class.
+
+        Returns:
+            type: the test class.
+
+        Raises:
+            LookupError: the file doesn't define the test anymore.
+        """
+        core_log.debug("Loading %r", self)
+        _, tests = import_test_file(self.path)
+        for test in tests:
+            if test.__name__ == self.__name__:
+                return test
+
+        raise LookupError("%s doesn't define the test %r anymore" %
+                          (self.path, self.__name__))
+
+
+def load_tests(tests):
+    """Return the classes of the discovered tests, loading indexed tests.
+
+    Only the files of the indexed tests among the given ones are imported.
+
+    Args:
+        tests (list): test classes and indexed tests.
+
+    Returns:
+        list: the test classes.
+    """
+    return [test.load() if isinstance(test, IndexedTest) else test
+            for test in tests]
+
+
+class DiscoveryIndex(object):
+    """On-disk index of the tests in the discovered files.
+
+    For each file, the index keeps the names, tags and hierarchies of its
+    tests, and the modification times and sizes of the file and of the
+    files of its test classes' bases and sub tests, which decide whether the
+    entry is still valid. It also
+    keeps the static scans of the files, which are valid as long as the
+    files don't change.
+
+    Attributes:
+        path (str): path of the index file.
+        files (dict): entries of the indexed files, by their paths.
+        scans (dict): scans of the files and their signatures, by the
+            files' paths.
+        signatures (dict): modification times and sizes of the files that
+            were checked, by their paths.
+        changed (bool): whether the index should be saved.
+    """
+    VERSION = 4
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        self.scans = {}
+        self.signatures = {}
+        self.changed = False
+
+    def load(self):
+        """Read the index file, if it exists and is valid."""
+        try:
+            with open(self.path, "r") as index_file:
+                content = json.load(index_file)
+
+        except (IOError, OSError, ValueError):
+            return
+
+        if content.get("version") == self.VERSION:
+            self.files = content["files"]
+            self.scans = content["scans"]
+
+    def save(self):
+        """Write the index file, if it was changed."""
+        if not self.changed:
+            return
+
+        temp_path = "%s.temp" % self.path
+        try:
+            with open(temp_path, "w") as index_file:
+                json.dump({"version": self.VERSION,
+                           "files": self.files,
+                           "scans": self.scans},
+                          index_file)
+
+            os.rename(temp_path, self.path)
+
+        except (IOError, OSError) as error:
+            core_log.debug("Couldn't save the discovery index: %s", error)
+
+    def get_signature(self, path):
+        """Return the modification time and size of the file.
+
+        Args:
+            path (str): path of the file.
+
+        Returns:
+            list: modification time and size, or None if the file is missing.
+        """
+        if path not in self.signatures:
+            try:
+                stat = os.stat(path)
+                self.signatures[path] = [stat.st_mtime, stat.st_size]
+
+            except OSError:
+                self.signatures[path] = None
+
+        return self.signatures[path]
+
+    def get_tests(self, path):
+        """Return the indexed tests of the file, if its entry is valid.
+
+        Args:
+            path (str): path of the test file.
+
+        Returns:
+            list: the names, tags, hierarchies and source files of the tests
+                in the file, or None if the file should be imported to find
+                them.
+        """
+        entry = self.files.get(path)
+        if entry is None:
+            return None
+
+        for dependency, signature in entry["dependencies"].items():
+            if self.get_signature(dependency) != signature:
+                return None
+
+        return entry["tests"]
+
+    def scan(self, paths):
+        """Return the static scans of the files, scanning the changed ones.
+
+        Args:
+            paths (list): paths of the test files.
+
+        Returns:
+            dict: results of :func:`rotest.cli.source_scan.scan_file`, by
+                the files' paths.
+        """
+        scans = {}
+        changed_paths = []
+        for path in paths:
+            entry = self.scans.get(path)
+            if entry is not None and \
+                    entry["signature"] == self.get_signature(path):
+
+                scans[path] = entry["scan"]
+
+            else:
+                changed_paths.append(path)
+
+        for path, scan in zip(changed_paths, scan_files(changed_paths)):
+            scans[path] = scan
+            signature = self.get_signature(path)
+            if scan is not None and signature is not None:
+                self.scans[path] = {"signature": signature, "scan": scan}
+                self.changed = True
+
+        return scans
+
+    def update(self, path, test_classes, tests):
+        """Index the tests of the file.
+
+        Args:
+            path (str): path of the test file.
+            test_classes (list): all the test classes found in the file.
+            tests (list): the runnable tests in the file.
+        """
+        dependencies = {path: self.get_signature(path)}
+        classes = list(test_classes) + [sub_test for test in tests
+                                        for sub_test in
+                                        get_sub_test_classes(test)]
+        for test_class in classes:
+            for cls in inspect.getmro(test_class):
+                source_file = get_source_file(cls)
+                if source_file is not None and \
+                        self.get_signature(source_file) is not None:
+
+                    dependencies[source_file] = \
+                        self.get_signature(source_file)
+
+        self.files[path] = {
+            "dependencies": dependencies,
+            "tests": [(test.__name__, list(test.TAGS),
+                       get_test_hierarchy(test), get_test_source(path, test))
+                      for test in tests]}
+        self.changed = True
+
+
+def has_tests_to_run(indexed_tests, tags_filter):
+    """Return whether any of the indexed tests should be run.
+
+    Args:
+        indexed_tests (list): the names, tags, hierarchies and source files
+            of the tests.
+        tags_filter (str): boolean expression of the tags of the tests to
+            run, or None to run all the tests.
+
+    Returns:
+        bool: whether any of the tests should be run.
+    """
+    if tags_filter is None:
+        return len(indexed_tests) > 0
+
+    tests_filter = compile_tags_filter(tags_filter)
+    return any(tests_filter(tags + [name])
+               for name, tags, _, _ in indexed_tests)
+
+
+def discover_tests_under_paths(paths, tags_filter=None, lazy=False):
+    """Search recursively for every test class under the given paths.
+
+    The files are scanned statically first, and only files that define
+    classes that may be tests are imported. When the discovery index is
+    enabled, files that weren't changed since they were indexed, and don't
+    contain tests to run, aren't imported either.
+
+    Args:
+        paths (iterable): list of filesystem paths to be searched.
+        tags_filter (str): boolean expression of the tags of the tests to
+            run, used to skip indexed files that don't contain such tests.
+            Note that tests of imported files aren't filtered.
+        lazy (bool): whether to return the tests of unchanged indexed files
+            as :class:`IndexedTest`, without importing the files. Use
+            :func:`load_tests` to get their classes.
+
+    Returns:
+        list: all discovered tests.
+    """
     tests = OrderedDict()
 
-    for path in get_test_files(paths):
-        core_log.debug("Discovering tests in %s", path)
+    index = DiscoveryIndex(DISCOVERY_INDEX_PATH)
+    if DISCOVERY_INDEX:
+        index.load()
+
+    test_files = list(get_test_files(paths))
+    candidates = find_test_candidates(index.scan(test_files))
+
+    for path in test_files:
+        if path not in candidates:
+            core_log.debug("Skipping %s, which defines no tests", path)
+            continue
+
+        indexed_tests = index.get_tests(path)
+        if indexed_tests is not None:
+            if not has_tests_to_run(indexed_tests, tags_filter):
+                core_log.debug("Skipping %s, which has no tests to run",
+                               path)
+                continue
 
-        module = py.path.local(path).pyimport()
-        tests_discovered = loader.loadTestsFromModule(module)
-        tests_discovered = {test: test
-                            for test in tests_discovered
-                            if is_test_class(test)}
+            if lazy:
+                core_log.debug("Using the indexed tests of %s", path)
+                for indexed_test in indexed_tests:
+                    test = IndexedTest(path, indexed_test)
+                    tests.setdefault((test.source, test.__name__), test)
 
+                continue
+
+        core_log.debug("Discovering tests in %s", path)
+
+        test_classes, tests_discovered = import_test_file(path)
         core_log.debug("Discovered %d tests in %s",
                        len(tests_discovered), path)
-        tests.update(tests_discovered)
+        for test in tests_discovered:
+            tests.setdefault((get_test_source(path, test), test.__name__),
+                             test)
+
+        if DISCOVERY_INDEX and indexed_tests is None and \
+                index.get_signature(path) is not None:
+
+            index.update(path, test_classes, tests_discovered)
+
+    if DISCOVERY_INDEX:
+        index.save()
 
     return list(tests.values())
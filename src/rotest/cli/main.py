@@ -9,20 +9,22 @@ if not hasattr(django, 'apps'):  # noqa
     django.setup()
 
 from rotest import DEFAULT_SETTINGS_PATH
-from rotest.cli.client import main as run
-from rotest.cli.server import start_server
-from rotest.management.utils.shell import main as shell
 
 
 def main():
     if django.conf.settings.SETTINGS_MODULE == DEFAULT_SETTINGS_PATH:
         warnings.warn("Using default DJANGO_SETTINGS_MODULE")
 
+    # Import only the requested command, the shell loads IPython's embedding
+    # and the server loads Django's management commands.
     if len(sys.argv) > 1 and sys.argv[1] == "shell":
+        from rotest.management.utils.shell import main as shell
         shell()
 
     elif len(sys.argv) > 1 and sys.argv[1] == "server":
+        from rotest.cli.server import start_server
         start_server()
 
     else:
+        from rotest.cli.client import main as run
         run()
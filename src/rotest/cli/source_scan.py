@@ -0,0 +1,352 @@
+"""Static scan of test files, to find the files that may contain tests.
+
+The files are parsed without being imported, and their classes' bases are
+resolved through the imports of each file: a class may be a test if one of
+its bases is Rotest's TestCase or TestFlow, a class that may be a test, or
+a class whose origin is unknown (e.g. imported from a package outside the
+searched paths). Files that define no classes, or that create classes at
+import time (using create_flow or type), are always imported.
+"""
+# pylint: disable=broad-except
+from __future__ import absolute_import
+
+import os
+import ast
+import multiprocessing
+
+from six.moves import builtins
+from future.builtins import object, range
+
+from rotest.common import core_log
+
+
+TEST_BASE_NAMES = frozenset(["TestCase", "TestFlow"])
+BUILTIN_CLASS_NAMES = frozenset(name for name, value in vars(builtins).items()
+                                if isinstance(value, type))
+CLASS_FACTORY_NAMES = frozenset(["create_flow", "type"])
+KNOWN_PACKAGES = ("rotest",)
+PARALLEL_SCAN_THRESHOLD = 64
+
+
+def get_name(node):
+    """Return the dotted name of a name or attribute expression.
+
+    Args:
+        node (ast.AST): expression node, e.g. of 'TestCase' or
+            'rotest.core.TestCase'.
+
+    Returns:
+        str: the dotted name, or None if the expression isn't a name.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        value_name = get_name(node.value)
+        if value_name is not None:
+            return "%s.%s" % (value_name, node.attr)
+
+    return None
+
+
+def get_module_statements(statements):
+    """Yield the statements that run when the module is imported.
+
+    Goes into conditions, loops and exception handling blocks, but not
+    into the bodies of functions and classes.
+
+    Args:
+        statements (list): statements of the module's body.
+
+    Yields:
+        ast.stmt: the module-level statements.
+    """
+    for statement in statements:
+        yield statement
+
+        if isinstance(statement, (ast.FunctionDef, ast.ClassDef)):
+            continue
+
+        for field_name in ("body", "orelse", "finalbody", "handlers"):
+            for sub_statement in getattr(statement, field_name, ()):
+                if isinstance(sub_statement, ast.ExceptHandler):
+                    sub_statement = sub_statement.body
+
+                else:
+                    sub_statement = [sub_statement]
+
+                for module_statement in get_module_statements(sub_statement):
+                    yield module_statement
+
+
+def is_class_factory_call(node):
+    """Return whether the expression creates a class.
+
+    Args:
+        node (ast.AST): expression node.
+
+    Returns:
+        bool: whether it's a call of create_flow, or of type with the
+            name, bases and attributes of a new class.
+    """
+    if not isinstance(node, ast.Call):
+        return False
+
+    function_name = get_name(node.func)
+    if function_name is None:
+        return False
+
+    function_name = function_name.split(".")[-1]
+    if function_name == "type":
+        return len(node.args) > 1
+
+    return function_name in CLASS_FACTORY_NAMES
+
+
+def scan_file(path):
+    """Find the classes, imports and class factory calls of the file.
+
+    Args:
+        path (str): path of the Python file.
+
+    Returns:
+        dict: the module-level classes, as pairs of a name and its bases'
+            dotted names (None for bases that aren't names), the imported
+            names, mapped to their module, original name (None for imported
+            modules) and relative import level, and whether the file creates
+            classes at import time. None if the file couldn't be parsed.
+    """
+    try:
+        with open(path, "rb") as source_file:
+            tree = ast.parse(source_file.read(), path)
+
+    except Exception as error:
+        core_log.debug("Couldn't scan %s: %s", path, error)
+        return None
+
+    classes = []
+    imports = {}
+    creates_classes = False
+    for statement in get_module_statements(tree.body):
+        if isinstance(statement, ast.ClassDef):
+            classes.append((statement.name,
+                            [get_name(base) for base in statement.bases]))
+
+        elif isinstance(statement, ast.Import):
+            for alias in statement.names:
+                if alias.asname is None:
+                    module_name = alias.name.split(".")[0]
+                    imports[module_name] = (module_name, None, 0)
+
+                else:
+                    imports[alias.asname] = (alias.name, None, 0)
+
+        elif isinstance(statement, ast.ImportFrom):
+            for alias in statement.names:
+                imports[alias.asname or alias.name] = \
+                    (statement.module or "", alias.name, statement.level)
+
+        elif not hasattr(statement, "body") and \
+                any(is_class_factory_call(node)
+                    for node in ast.walk(statement)):
+
+            creates_classes = True
+
+    return {"classes": classes,
+            "imports": imports,
+            "creates_classes": creates_classes}
+
+
+def scan_files(paths):
+    """Scan the files, in parallel processes if there are many of them.
+
+    Args:
+        paths (list): paths of the Python files.
+
+    Returns:
+        list: the results of :func:`scan_file` for the files, by their order.
+    """
+    if len(paths) < PARALLEL_SCAN_THRESHOLD:
+        return [scan_file(path) for path in paths]
+
+    try:
+        pool = multiprocessing.Pool()
+
+    except (OSError, ImportError) as error:
+        core_log.debug("Scanning files serially: %s", error)
+        return [scan_file(path) for path in paths]
+
+    try:
+        return pool.map(scan_file, paths,
+                        chunksize=PARALLEL_SCAN_THRESHOLD // 4)
+
+    finally:
+        pool.close()
+        pool.join()
+
+
+class TestCandidatesFinder(object):
+    """Resolve the bases of the scanned classes, to find possible tests.
+
+    Attributes:
+        scans (dict): results of :func:`scan_file`, by the files' paths.
+        modules (dict): paths of the scanned files, by their module paths
+            (the paths without the extension, or the package directories).
+        results (dict): whether a class may be a test, by its file and name.
+    """
+    def __init__(self, scans):
+        self.scans = scans
+        self.results = {}
+        self.modules = {}
+        for path in scans:
+            module_path, _ = os.path.splitext(os.path.normpath(path))
+            if os.path.basename(module_path) == "__init__":
+                module_path = os.path.dirname(module_path)
+
+            self.modules[module_path] = path
+
+    def find_module(self, path, module_name, level):
+        """Find the scanned files of an imported module.
+
+        Args:
+            path (str): path of the importing file.
+            module_name (str): dotted name of the imported module.
+            level (number): level of a relative import, 0 for absolute ones.
+
+        Returns:
+            list: paths of the scanned files that may be the module.
+        """
+        module_parts = [part for part in module_name.split(".") if part]
+        if level > 0:
+            base_path = os.path.dirname(os.path.normpath(path))
+            for _ in range(level - 1):
+                base_path = os.path.dirname(base_path)
+
+            module_path = os.path.join(base_path, *module_parts)
+            return [self.modules[module_path]] \
+                if module_path in self.modules else []
+
+        suffix = os.path.join("", *module_parts)
+        return [file_path for module_path, file_path in self.modules.items()
+                if module_path == suffix or
+                module_path.endswith(os.sep + suffix)]
+
+    def is_test_import(self, path, module_name, names, level):
+        """Return whether an imported name may be a test class.
+
+        Args:
+            path (str): path of the importing file.
+            module_name (str): dotted name of the imported module.
+            names (list): the names accessed on the module.
+            level (number): level of a relative import, 0 for absolute ones.
+
+        Returns:
+            bool: whether the name may be a test class.
+        """
+        if level == 0 and module_name.split(".")[0] in KNOWN_PACKAGES:
+            return len(names) > 0 and names[-1] in TEST_BASE_NAMES
+
+        # Look for the longest sub module, e.g. for 'package.module.Class'
+        for index in range(len(names), -1, -1):
+            sub_module_name = ".".join([module_name] + names[:index])
+            module_files = self.find_module(path, sub_module_name, level)
+            if len(module_files) > 0:
+                attribute_names = names[index:]
+                return len(attribute_names) == 0 or \
+                    any(self.is_test_base(module_file,
+                                          ".".join(attribute_names))
+                        for module_file in module_files)
+
+        # The module isn't one of the scanned files
+        return True
+
+    def is_test_base(self, path, base_name):
+        """Return whether a base of a class of the file may be a test class.
+
+        Args:
+            path (str): path of the file of the class.
+            base_name (str): dotted name of the base, or None if it isn't a
+                name.
+
+        Returns:
+            bool: whether the base may be a test class.
+        """
+        if base_name is None:
+            return True
+
+        scan = self.scans[path]
+        if scan is None:
+            return True
+
+        names = base_name.split(".")
+        first_name = names[0]
+        if any(name == first_name for name, _ in scan["classes"]):
+            return len(names) > 1 or self.is_test_class(path, first_name)
+
+        if first_name in scan["imports"]:
+            module_name, imported_name, level = scan["imports"][first_name]
+            if imported_name is not None:
+                names[0] = imported_name
+
+            else:
+                names = names[1:]
+
+            return self.is_test_import(path, module_name, names, level)
+
+        return first_name not in BUILTIN_CLASS_NAMES
+
+    def is_test_class(self, path, class_name):
+        """Return whether a class of the file may be a test class.
+
+        Args:
+            path (str): path of the file of the class.
+            class_name (str): name of the class.
+
+        Returns:
+            bool: whether the class may be a test class.
+        """
+        key = (path, class_name)
+        if key not in self.results:
+            # Classes that are still being resolved are in an inheritance
+            # cycle, and can't make their sub classes tests
+            self.results[key] = False
+            self.results[key] = any(
+                any(self.is_test_base(path, base) for base in bases)
+                for name, bases in self.scans[path]["classes"]
+                if name == class_name)
+
+        return self.results[key]
+
+    def may_contain_tests(self, path):
+        """Return whether the file may contain tests.
+
+        Args:
+            path (str): path of the file.
+
+        Returns:
+            bool: whether the file couldn't be scanned, defines no classes
+                (so it may import tests, or fail being imported), creates
+                classes at import time or defines classes that may be tests.
+        """
+        scan = self.scans[path]
+        if scan is None or scan["creates_classes"] or \
+                len(scan["classes"]) == 0:
+
+            return True
+
+        return any(self.is_test_class(path, name)
+                   for name, _ in scan["classes"])
+
+
+def find_test_candidates(scans):
+    """Return the files that may contain tests.
+
+    Args:
+        scans (dict): results of :func:`scan_file`, by the files' paths.
+
+    Returns:
+        set: paths of the files that may contain tests, including the files
+            that couldn't be scanned.
+    """
+    finder = TestCandidatesFinder(scans)
+    return set(path for path in scans if finder.may_contain_tests(path))
@@ -241,6 +241,10 @@ CONFIGURATION_SCHEMA = {
         config_file_options=["discoverer_blacklist"],
         environment_variables=["DISCOVERER_BLACKLIST"],
         default_value=[]),
+    "discovery_index": Option(
+        config_file_options=["discovery_index"],
+        environment_variables=["ROTEST_DISCOVERY_INDEX"],
+        default_value=True),
     "smart_client": Option(
         config_file_options=["smart_client"],
         environment_variables=["ROTEST_SMART_CLIENT"],
@@ -264,6 +268,18 @@ CONFIGURATION_SCHEMA = {
         environment_variables=["ARTIFACTS_DIR"],
         config_file_options=["artifacts_dir"],
         default_value=os.path.expanduser("~/.rotest/artifacts")),
+    "artifacts_compression": Option(
+        environment_variables=["ARTIFACTS_COMPRESSION"],
+        config_file_options=["artifacts_compression"],
+        default_value="deflated"),
+    "artifacts_compression_level": Option(
+        environment_variables=["ARTIFACTS_COMPRESSION_LEVEL"],
+        config_file_options=["artifacts_compression_level"],
+        default_value=None),
+    "db_flush_interval": Option(
+        environment_variables=["ROTEST_DB_FLUSH_INTERVAL"],
+        config_file_options=["db_flush_interval"],
+        default_value=0),
 }
 
 config_path = search_config_file()
@@ -300,10 +316,14 @@ DJANGO_MANAGER_PORT = int(CONFIGURATION.port)
 API_BASE_URL = CONFIGURATION.api_base_url
 RESOURCE_REQUEST_TIMEOUT = int(CONFIGURATION.resource_request_timeout)
 ARTIFACTS_DIR = os.path.expanduser(CONFIGURATION.artifacts_dir)
+ARTIFACTS_COMPRESSION = CONFIGURATION.artifacts_compression
+ARTIFACTS_COMPRESSION_LEVEL = CONFIGURATION.artifacts_compression_level
+DB_FLUSH_INTERVAL = float(CONFIGURATION.db_flush_interval)
 SHELL_STARTUP_COMMANDS = CONFIGURATION.shell_startup_commands
 SHELL_OUTPUT_HANDLERS = CONFIGURATION.shell_output_handlers
 DISCOVERER_BLACKLIST = list(CONFIGURATION.discoverer_blacklist) + \
                        DEFAULT_DISCOVERY_BLACKLIST
+DISCOVERY_INDEX = CONFIGURATION.discovery_index in (True, "True", "true")
 
 if os.path.isfile(ROTEST_WORK_DIR):
     raise ValueError("Path {} for the working directory is a file, you should "
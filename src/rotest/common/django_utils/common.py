@@ -27,6 +27,23 @@ def get_fields(model_object, ignore_fields=()):
     return dict(fields)
 
 
+def get_remote_field(field):
+    """Return the description of the relation of a related field.
+
+    Args:
+        field (django.db.models.Field): related field.
+
+    Returns:
+        django.db.models.ForeignObjectRel. the relation, e.g. to check
+            whether the field links to a parent model.
+    """
+    # Django < 1.9 has only the 'rel' attribute, which was later removed
+    if hasattr(field, "remote_field"):
+        return field.remote_field
+
+    return field.rel
+
+
 def get_sub_model(model_object):
     """Return the model inherited sub class instance.
 
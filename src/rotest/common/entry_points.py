@@ -0,0 +1,80 @@
+"""Cached registry of the installed distributions' entry points.
+
+The installed distributions are scanned once per process, and each entry
+point is loaded (i.e. its module is imported) only when it's requested.
+"""
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+try:
+    from importlib import metadata
+
+except ImportError:
+    import importlib_metadata as metadata
+
+
+VERSIONS_CACHE = {}
+ENTRY_POINTS_CACHE = {}
+LOADED_ENTRY_POINTS_CACHE = {}
+
+
+def get_entry_points(group):
+    """Return the entry points of the group, without loading them.
+
+    Args:
+        group (str): entry points group, e.g. 'rotest.result_handlers'.
+
+    Returns:
+        OrderedDict: the group's entry points, by their names.
+    """
+    if group not in ENTRY_POINTS_CACHE:
+        if not ENTRY_POINTS_CACHE:
+            all_entry_points = metadata.entry_points()
+            if hasattr(all_entry_points, "select"):
+                all_entry_points = {
+                    name: all_entry_points.select(group=name)
+                    for name in all_entry_points.groups}
+
+            for name, entry_points in all_entry_points.items():
+                ENTRY_POINTS_CACHE[name] = OrderedDict()
+                for entry_point in entry_points:
+                    # A distribution may be found more than once on the path
+                    ENTRY_POINTS_CACHE[name].setdefault(entry_point.name,
+                                                        entry_point)
+
+        ENTRY_POINTS_CACHE.setdefault(group, OrderedDict())
+
+    return ENTRY_POINTS_CACHE[group]
+
+
+def load_entry_points(group):
+    """Load the entry points of the group.
+
+    Args:
+        group (str): entry points group, e.g. 'rotest.result_handlers'.
+
+    Returns:
+        OrderedDict: the loaded objects of the group, by their names.
+    """
+    if group not in LOADED_ENTRY_POINTS_CACHE:
+        LOADED_ENTRY_POINTS_CACHE[group] = OrderedDict(
+            (name, entry_point.load())
+            for name, entry_point in get_entry_points(group).items())
+
+    return LOADED_ENTRY_POINTS_CACHE[group]
+
+
+def get_version(distribution="rotest"):
+    """Return the installed version of the distribution.
+
+    Args:
+        distribution (str): name of the distribution.
+
+    Returns:
+        str: the distribution's version.
+    """
+    if distribution not in VERSIONS_CACHE:
+        VERSIONS_CACHE[distribution] = metadata.version(distribution)
+
+    return VERSIONS_CACHE[distribution]
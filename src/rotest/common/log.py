@@ -4,15 +4,21 @@ core_logger inherits from the system logger,
 test logger inherits from core_logger
 and resource_logger inherits from test_logger.
 """
-# pylint: disable=too-many-arguments
+# pylint: disable=too-many-arguments,broad-except,too-many-instance-attributes
 from __future__ import absolute_import
 
 import os
+import sys
+import atexit
+import threading
+import traceback
 import logging
 from logging.handlers import RotatingFileHandler
+from collections import OrderedDict
 
+from six.moves import queue
 from termcolor import colored
-from future.builtins import str
+from future.builtins import str, object
 
 from rotest.common.config import ROTEST_WORK_DIR
 from rotest.common.constants import WHITE, BOLD, CYAN, YELLOW, RED, MAGENTA
@@ -27,6 +33,10 @@ CORE_LOG_NAME = 'core_logger'
 CORE_LOG_MAX_BYTES = 1024 * 1024 * 20  # 20M
 CORE_LOG_DIR = os.path.join(ROTEST_WORK_DIR, CORE_LOG_NAME)
 
+# Log writer properties
+MAX_OPEN_LOG_FILES = 64
+MAX_PENDING_RECORDS = 10000
+
 
 class ColoredFormatter(logging.Formatter):
     """Define a colored log formatter.
@@ -76,18 +86,320 @@ class LoggerWrapper(logging.Logger):
 logging.setLoggerClass(LoggerWrapper)
 
 
+class LogWriter(object):
+    """Writer of the log files, running in a background thread.
+
+    The loggers enqueue their records, and the writer formats them and
+    routes them to the files of their targets, so the logging threads don't
+    wait for formatting and I/O. Files are opened on their first record,
+    and at most MAX_OPEN_LOG_FILES of them are kept open, closing the least
+    recently used ones (they are reopened for appending when needed).
+
+    The writer is paused and its files are flushed while the process forks,
+    so the forked process doesn't inherit handlers locked or half written by
+    the writer thread, which doesn't exist in it.
+
+    Attributes:
+        targets (dict): file path and handler options, by the target names.
+        open_handlers (OrderedDict): open file handlers, by the target names,
+            from the least recently used.
+        inherited_handlers (list): handlers copied from the parent process
+            when it forked without pausing the writer, kept untouched.
+        pending_records (Queue): actions for the writer thread to do.
+        writing_lock (threading.Lock): held by the writer thread while it
+            uses the handlers.
+    """
+    _WRITE = "write"
+    _CLOSE = "close"
+    _UNREGISTER = "unregister"
+    _FLUSH = "flush"
+
+    def __init__(self):
+        self.pid = None
+        self.targets = {}
+        self.open_handlers = OrderedDict()
+        self.inherited_handlers = []
+        self.pending_records = None
+        self.writing_thread = None
+        self.lock = threading.Lock()
+        self.writing_lock = threading.Lock()
+
+    def _start(self):
+        """Start the writer thread, if it's not running in this process.
+
+        The thread is restarted in forked processes, since threads aren't
+        copied by fork. The targets are kept, and the files are reopened by
+        the new thread.
+        """
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+
+            if self.pid is not None:
+                # The process forked without pausing the writer, so the
+                # copied handlers may be locked or half written by the
+                # parent's writer thread, and closing them may block forever
+                self.inherited_handlers.extend(self.open_handlers.values())
+
+            self.open_handlers = OrderedDict()
+            self.pending_records = queue.Queue(maxsize=MAX_PENDING_RECORDS)
+            self.writing_thread = threading.Thread(target=self._write_loop)
+            self.writing_thread.daemon = True
+            self.writing_thread.start()
+            self.pid = os.getpid()
+
+    def _put(self, action, target_name, value=None):
+        """Queue an action for the writer thread.
+
+        Args:
+            action (str): name of the action to do.
+            target_name (str): name of the log target.
+            value (object): value of the action.
+        """
+        if self.pid != os.getpid():
+            self._start()
+
+        self.pending_records.put((action, target_name, value))
+
+    def register(self, target_name, file_path, log_level, formatter,
+                 rotating, max_bytes, backup_count):
+        """Define a log file to write records to.
+
+        Args:
+            target_name (str): name of the log target.
+            file_path (str): path of the log file.
+            log_level (number): level of the file handler.
+            formatter (logging.Formatter): formatter of the records.
+            rotating (bool): whether to use RotatingFileHandler.
+            max_bytes (int): max length for log file.
+            backup_count (int) : number of old log files to save.
+        """
+        self.targets[target_name] = (file_path, log_level, formatter,
+                                     rotating, max_bytes, backup_count)
+
+    def write(self, target_name, record):
+        """Queue a record to be written to the target's file.
+
+        Args:
+            target_name (str): name of the log target.
+            record (logging.LogRecord): record to write.
+        """
+        self._put(self._WRITE, target_name, record)
+
+    def close(self, target_name):
+        """Close the target's file, to be reopened by its next record.
+
+        Args:
+            target_name (str): name of the log target.
+        """
+        self._put(self._CLOSE, target_name)
+
+    def unregister(self, target_name):
+        """Close the target's file and forget it.
+
+        Args:
+            target_name (str): name of the log target.
+        """
+        self._put(self._UNREGISTER, target_name,
+                  self.targets.get(target_name))
+
+    def flush(self):
+        """Wait until all the queued records are written."""
+        if self.pid != os.getpid():
+            return
+
+        flushed = threading.Event()
+        self._put(self._FLUSH, None, flushed)
+        flushed.wait()
+
+    def _get_handler(self, target_name):
+        """Return the open file handler of the target, opening it if needed.
+
+        Args:
+            target_name (str): name of the log target.
+
+        Returns:
+            logging.Handler. the file handler of the target.
+        """
+        handler = self.open_handlers.pop(target_name, None)
+        if handler is None:
+            (file_path, log_level, formatter, rotating, max_bytes,
+             backup_count) = self.targets[target_name]
+
+            if rotating:
+                handler = RotatingFileHandler(filename=file_path,
+                                              maxBytes=max_bytes,
+                                              backupCount=backup_count)
+
+            else:
+                handler = logging.FileHandler(file_path)
+
+            handler.setLevel(log_level)
+            handler.setFormatter(formatter)
+
+            while len(self.open_handlers) >= MAX_OPEN_LOG_FILES:
+                _, old_handler = self.open_handlers.popitem(last=False)
+                old_handler.close()
+
+        self.open_handlers[target_name] = handler
+        return handler
+
+    def _close_handler(self, target_name):
+        """Close the target's file handler, if it's open.
+
+        Args:
+            target_name (str): name of the log target.
+        """
+        handler = self.open_handlers.pop(target_name, None)
+        if handler is not None:
+            handler.close()
+
+    def before_fork(self):
+        """Pause the writer and flush its files before the process forks.
+
+        While the writing lock is held the writer thread doesn't use the
+        handlers, so they are copied unlocked and with nothing buffered.
+        """
+        self.lock.acquire()
+        self.writing_lock.acquire()
+        for handler in self.open_handlers.values():
+            handler.flush()
+
+    def after_fork_in_parent(self):
+        """Resume the writer after the process forked."""
+        self.writing_lock.release()
+        self.lock.release()
+
+    def after_fork_in_child(self):
+        """Close the files copied by fork, a new writer will reopen them."""
+        for handler in self.open_handlers.values():
+            handler.close()
+
+        self.open_handlers = OrderedDict()
+        self.pid = None
+        self.writing_lock.release()
+        self.lock.release()
+
+    def _write_loop(self):
+        """Do the queued actions, for as long as the process runs."""
+        while True:
+            action, target_name, value = self.pending_records.get()
+            with self.writing_lock:
+                self._do_action(action, target_name, value)
+
+    def _do_action(self, action, target_name, value):
+        """Do a queued action.
+
+        Args:
+            action (str): name of the action to do.
+            target_name (str): name of the log target.
+            value (object): value of the action.
+        """
+        try:
+            if action == self._WRITE:
+                if target_name in self.targets:
+                    self._get_handler(target_name).handle(value)
+
+            elif action == self._CLOSE:
+                self._close_handler(target_name)
+
+            elif action == self._UNREGISTER:
+                self._close_handler(target_name)
+                # Keep the target if it was registered again since
+                if self.targets.get(target_name) is value:
+                    self.targets.pop(target_name)
+
+            elif action == self._FLUSH:
+                for handler in self.open_handlers.values():
+                    handler.flush()
+
+                value.set()
+
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+
+
+LOG_WRITER = LogWriter()
+atexit.register(LOG_WRITER.flush)
+# Not available before Python 3.7, where a forked process keeps the copied
+# handlers untouched instead
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=LOG_WRITER.before_fork,
+                        after_in_parent=LOG_WRITER.after_fork_in_parent,
+                        after_in_child=LOG_WRITER.after_fork_in_child)
+
+
+class QueueHandler(logging.Handler):
+    """Log handler that passes the records to the log writer.
+
+    The records are prepared for formatting in another thread: their
+    message is merged with its arguments and the exception is rendered,
+    since both may change or be released after the call.
+
+    Attributes:
+        target_name (str): name of the target in the log writer.
+        baseFilename (str): path of the target's log file.
+    """
+    EXCEPTION_FORMATTER = logging.Formatter()
+
+    def __init__(self, target_name, file_path, level=logging.NOTSET):
+        super(QueueHandler, self).__init__(level)
+        self.target_name = target_name
+        self.baseFilename = os.path.abspath(file_path)
+
+    def prepare(self, record):
+        """Render the parts of the record that can't wait for the writer.
+
+        Args:
+            record (logging.LogRecord): record to prepare.
+        """
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+
+        if record.exc_info:
+            record.exc_text = \
+                self.EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+
+    def emit(self, record):
+        """Queue the record to be written by the log writer.
+
+        Args:
+            record (logging.LogRecord): record to write.
+        """
+        try:
+            self.prepare(record)
+            LOG_WRITER.write(self.target_name, record)
+
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        """Close the target's file, to be reopened by the next record."""
+        LOG_WRITER.close(self.target_name)
+        super(QueueHandler, self).close()
+
+
+def flush_logs():
+    """Wait until all the logged records are written to their files."""
+    LOG_WRITER.flush()
+
+
 def define_logger(log_name, log_dir, log_level=logging.DEBUG,
                   log_format=LOG_FORMAT, rotating=True,
                   max_bytes=0, backup_count=0, is_colored=True):
     """Define logger.
 
+    The records of the logger are written to its file by the log writer.
+
     Args:
         log_name (str): logger name
         log_dir (str): logger output directory
         log_filename (str): logger output filename
         log_level (str): logger level
         log_format (str): logger format
-        rotating (bool): if True - use RotatingFileHnadler as log_stream
+        rotating (bool): if True - use RotatingFileHandler as log_stream
                             else - use FileHandler as log_stream
         max_bytes (int): max length for log file
         backup_count (int) : number of old log files to save
@@ -104,16 +416,14 @@ def define_logger(log_name, log_dir, log_level=logging.DEBUG,
         os.mkdir(log_dir)
 
     file_path = os.path.join(log_dir, '%s.log' % log_name)
-    if rotating:
-        current_log_stream = RotatingFileHandler(filename=file_path,
-                                                 maxBytes=max_bytes,
-                                                 backupCount=backup_count)
-    else:
-        current_log_stream = logging.FileHandler(file_path)
-
-    current_log_stream.setLevel(log_level)
+    # Create the file right away, so it exists before the first record
+    open(file_path, 'a').close()
+
     formatter = colored_to_formatters[is_colored](log_format)
-    current_log_stream.setFormatter(formatter)
+    LOG_WRITER.register(file_path, file_path, log_level, formatter,
+                        rotating, max_bytes, backup_count)
+
+    current_log_stream = QueueHandler(file_path, file_path, log_level)
     logger.addHandler(current_log_stream)
 
     return logger
@@ -177,3 +487,21 @@ def get_test_logger(logger_basename, log_dir):
                            backup_count=CORE_LOG_BACKUP_COUNT)
 
     return logger
+
+
+def release_test_logger(logger):
+    """Close the file of the test logger and remove it from the loggers.
+
+    The logger is removed from the registry of the logging module, so
+    loggers of finished tests don't stay in memory for the rest of the run.
+
+    Args:
+        logger (logging.Logger): test logger to release.
+    """
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+        if isinstance(handler, QueueHandler):
+            LOG_WRITER.unregister(handler.target_name)
+
+    logging.Logger.manager.loggerDict.pop(logger.name, None)
@@ -4,9 +4,11 @@ from __future__ import absolute_import
 
 import os
 import json
+from abc import ABCMeta
 from shutil import copy
 from itertools import count
 from datetime import datetime
+from weakref import WeakKeyDictionary
 
 from attrdict import AttrDict
 from jsonschema import validate
@@ -42,34 +44,68 @@ def get_test_index(test):
     return test.parent._tests.index(test) + 1
 
 
-def get_work_dir(base_dir, test_name, test_item):
-    """Get the working directory for the given test.
+def _get_sub_test_index(test):
+    """Get the position of the test under its parent or None if it's the top.
 
-    Creates a work directory for by joining the given base directory,
-    the test name and the current date time string. If the work directory
-    already exists the new one will get the copy number extension.
+    Unlike get_test_index, the test is looked up by identity, since tests
+    compare equal to other instances of the same test, and repeated sub tests
+    must get different working directories.
+
+    Returns:
+        number. test's index under its parent, starting at 1.
+    """
+    if test.parent is None:
+        return None
+
+    sibling_tests = test.parent._tests
+    # Tests get their working directory name right after being added
+    if len(sibling_tests) > 0 and sibling_tests[-1] is test:
+        return len(sibling_tests)
+
+    for index, sibling_test in enumerate(sibling_tests, 1):
+        if sibling_test is test:
+            return index
+
+    raise ValueError("%r is not a sub test of %r" % (test, test.parent))
+
+
+def get_work_dir_name(test_name, test_item):
+    """Get the name of the working directory for the given test.
+
+    The name is the test's index under its parent and its name, or the
+    current date time string for top level tests.
 
     Args:
-        base_dir (str): base directory path.
         test_name (str): test name.
         test_item (object): test instance.
 
     Returns:
-        str. path of the working directory.
+        str. name of the working directory.
     """
     if test_item is None:
-        basic_work_dir = test_name
+        return test_name
 
-    else:
-        test_index = get_test_index(test_item)
-        if test_index is None:
-            basic_work_dir = datetime.strftime(datetime.now(),
-                                               DATE_TIME_FORMAT)
+    test_index = _get_sub_test_index(test_item)
+    if test_index is None:
+        return datetime.strftime(datetime.now(), DATE_TIME_FORMAT)
 
-        else:
-            basic_work_dir = "%d_%s" % (test_index, test_name)
+    return "%d_%s" % (test_index, test_name)
+
+
+def create_work_dir(base_dir, work_dir_name):
+    """Create a working directory with the given name.
+
+    If the work directory already exists the new one will get the copy
+    number extension.
+
+    Args:
+        base_dir (str): base directory path.
+        work_dir_name (str): name of the working directory.
 
-    basic_work_dir = os.path.join(base_dir, basic_work_dir)
+    Returns:
+        str. path of the working directory.
+    """
+    basic_work_dir = os.path.join(base_dir, work_dir_name)
     work_dir = basic_work_dir
 
     copy_count = count()
@@ -80,12 +116,88 @@ def get_work_dir(base_dir, test_name, test_item):
     return work_dir
 
 
-def get_class_fields(cls, field_type):
-    """Get all fields of the class that inherit from the given type.
+def create_sub_work_dir(parent_work_dir, work_dir_name):
+    """Create the working directory of a sub item, unless it already exists.
 
-    * This method searches also in the parent classes.
-    * Fields of sons override fields of parents.
-    * Ignores fields starting with '_'.
+    Sub items' names are unique under their parent, so the path is the same
+    in every process, and processes may create it concurrently.
+
+    Args:
+        parent_work_dir (str): the parent's working directory path.
+        work_dir_name (str): name of the working directory.
+
+    Returns:
+        str. path of the working directory.
+    """
+    work_dir = os.path.join(parent_work_dir, work_dir_name)
+    try:
+        os.makedirs(work_dir)
+
+    except OSError:
+        if not os.path.isdir(work_dir):
+            raise
+
+    return work_dir
+
+
+def get_work_dir(base_dir, test_name, test_item):
+    """Get the working directory for the given test.
+
+    Creates a work directory for by joining the given base directory,
+    the test name and the current date time string. If the work directory
+    already exists the new one will get the copy number extension.
+
+    Args:
+        base_dir (str): base directory path.
+        test_name (str): test name.
+        test_item (object): test instance.
+
+    Returns:
+        str. path of the working directory.
+    """
+    return create_work_dir(base_dir, get_work_dir_name(test_name, test_item))
+
+
+CLASS_VERSIONS = WeakKeyDictionary()
+CLASS_FIELDS_CACHE = WeakKeyDictionary()
+VERSIONS_COUNTER = count(1)
+
+
+class ClassFieldsMeta(ABCMeta):
+    """Metaclass of classes whose fields are cached by get_class_fields.
+
+    Setting or deleting an attribute of such a class gives it and its sub
+    classes a new version, since their fields may change, and the fields
+    cached for older versions are searched again.
+
+    It derives from ABCMeta, so these classes may also inherit from abstract
+    mixins.
+    """
+    def __setattr__(cls, name, value):
+        super(ClassFieldsMeta, cls).__setattr__(name, value)
+        _bump_class_version(cls)
+
+    def __delattr__(cls, name):
+        super(ClassFieldsMeta, cls).__delattr__(name)
+        _bump_class_version(cls)
+
+
+def _bump_class_version(cls):
+    """Give the class and all of its sub classes a new version.
+
+    Args:
+        cls (type): class whose attributes were changed.
+    """
+    version = next(VERSIONS_COUNTER)
+    classes = [cls]
+    while len(classes) > 0:
+        klass = classes.pop()
+        CLASS_VERSIONS[klass] = version
+        classes.extend(type.__subclasses__(klass))
+
+
+def _find_class_fields(cls, field_type):
+    """Find all fields of the class that inherit from the given type.
 
     Args:
         cls (type): class to search.
@@ -98,7 +210,8 @@ def get_class_fields(cls, field_type):
         return
 
     for parent_class in cls.__bases__:
-        for (field_name, field) in get_class_fields(parent_class, field_type):
+        for (field_name, field) in _find_class_fields(parent_class,
+                                                      field_type):
             yield (field_name, field)
 
     for field_name in cls.__dict__:
@@ -108,6 +221,37 @@ def get_class_fields(cls, field_type):
                 yield (field_name, field)
 
 
+def get_class_fields(cls, field_type):
+    """Get all fields of the class that inherit from the given type.
+
+    * This method searches also in the parent classes.
+    * Fields of sons override fields of parents.
+    * Ignores fields starting with '_'.
+
+    The fields of classes of :class:`ClassFieldsMeta` are cached per class
+    and field type, until an attribute of the class or of its parents is set
+    or deleted.
+
+    Args:
+        cls (type): class to search.
+        field_type (type): field type to find.
+
+    Returns:
+        iterator. all found (field name, field value).
+    """
+    if not isinstance(cls, ClassFieldsMeta):
+        return _find_class_fields(cls, field_type)
+
+    version = CLASS_VERSIONS.get(cls, 0)
+    class_cache = CLASS_FIELDS_CACHE.setdefault(cls, {})
+    cached_version, fields = class_cache.get(field_type, (None, None))
+    if cached_version != version:
+        fields = tuple(_find_class_fields(cls, field_type))
+        class_cache[field_type] = (version, fields)
+
+    return iter(fields)
+
+
 def parse_json(json_path, schema_path=None):
     """Parse the Json file into attribute dictionary.
 
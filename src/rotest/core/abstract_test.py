@@ -14,14 +14,16 @@ from bdb import BdbQuit
 from functools import wraps
 from itertools import count
 
-from ipdbugger import debug
 from attrdict import AttrDict
 from cached_property import cached_property
 from future.builtins import next, str, object
-from future.utils import iteritems, itervalues
+from future.utils import iteritems, itervalues, with_metaclass
 
 from rotest.core.result.result import Result
-from rotest.common.utils import get_class_fields
+from rotest.common.utils import (get_class_fields,
+                                 ClassFieldsMeta,
+                                 create_work_dir,
+                                 create_sub_work_dir)
 from rotest.core.models.case_data import TestOutcome
 from rotest.management.base_resource import ResourceRequest
 from rotest.common.log import get_test_logger, get_tree_path
@@ -30,7 +32,7 @@ from rotest.management.client.manager import ClientResourceManager
 request = ResourceRequest
 
 
-class AbstractTest(unittest.TestCase):
+class AbstractTest(with_metaclass(ClassFieldsMeta, unittest.TestCase)):
     """Base class for all runnable Rotest tests.
 
     Attributes:
@@ -69,6 +71,8 @@ class AbstractTest(unittest.TestCase):
                  resource_manager=None, skip_init=False):
 
         if enable_debug:
+            # Importing the debugger loads IPython, which is slow
+            from ipdbugger import debug
             for method_name in (methodName, self.SETUP_METHOD_NAME,
                                 self.TEARDOWN_METHOD_NAME):
 
@@ -288,6 +292,22 @@ class AbstractTest(unittest.TestCase):
 
         return self.parent.parents_count + 1
 
+    @cached_property
+    def work_dir(self):
+        """Create the work directory of the test on its first use.
+
+        The work directory of a sub test is named by its index under its
+        parent, so each process creates the same directory for it.
+
+        Returns:
+            str. path of the test's work directory.
+        """
+        if self._base_work_dir is None:
+            return create_sub_work_dir(self.parent.work_dir,
+                                       self._work_dir_name)
+
+        return create_work_dir(self._base_work_dir, self._work_dir_name)
+
     @cached_property
     def logger(self):
         """Create logger instance for the test."""
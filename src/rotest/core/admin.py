@@ -6,7 +6,8 @@ Used in order to modify the appearance of tables in the admin site.
 from __future__ import absolute_import
 from django.contrib import admin
 
-from rotest.core.models import RunData, SuiteData, CaseData, SignatureData
+from rotest.core.models import (RunData, SuiteData, CaseData, SignatureData,
+                                StatisticsData)
 
 
 class TestDataAdmin(admin.ModelAdmin):
@@ -40,7 +41,15 @@ class CaseDataAdmin(TestDataAdmin):
 
 class SignatureDataAdmin(admin.ModelAdmin):
     """ModelAdmin for :class:`rotest.core.models.SignatureData` model."""
-    fields = ['link', 'pattern']
+    fields = ['link', 'pattern', 'fingerprint']
+    readonly_fields = ['fingerprint']
+
+
+class StatisticsDataAdmin(admin.ModelAdmin):
+    """ModelAdmin for :class:`rotest.core.models.StatisticsData` model."""
+    list_display = ['name']
+    fields = ['name', 'durations']
+    readonly_fields = fields
 
 
 class CaseInline(TestDataInline):
@@ -71,6 +80,7 @@ class RunDataAdmin(admin.ModelAdmin):
 
 # Register the Models & corresponding AdminModels to Django admin site
 admin.site.register(SignatureData, SignatureDataAdmin)
+admin.site.register(StatisticsData, StatisticsDataAdmin)
 admin.site.register(SuiteData, SuiteDataAdmin)
 admin.site.register(CaseData, CaseDataAdmin)
 admin.site.register(RunData, RunDataAdmin)
@@ -8,7 +8,7 @@ from functools import wraps
 from itertools import count
 
 from rotest.common import core_log
-from rotest.common.utils import get_work_dir
+from rotest.common.utils import get_work_dir_name
 from rotest.core.result.result import Result
 from rotest.common.config import ROTEST_WORK_DIR
 from rotest.core.models.case_data import CaseData
@@ -71,7 +71,8 @@ class TestCase(AbstractTest):
         core_log.debug("Initializing %r test-case", name)
 
         core_log.debug("Creating database entry for %r test-case", name)
-        self.work_dir = get_work_dir(base_work_dir, name, self)
+        self._base_work_dir = base_work_dir
+        self._work_dir_name = get_work_dir_name(name, self)
         self.data = CaseData(name=name, run_data=run_data)
 
         core_log.debug("Initialized %r test-case successfully", name)
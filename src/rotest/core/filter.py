@@ -1,10 +1,11 @@
 """Test trimming utilities by filtering of tags."""
-# pylint: disable=protected-access,eval-used
+# pylint: disable=protected-access
 from __future__ import absolute_import
 
-from fnmatch import fnmatch
+import re
+from fnmatch import translate
 
-from future.builtins import str
+from future.builtins import object
 
 
 VALID_LITERALS = ["and", "or", "not", "(", ")", "True", "False"]
@@ -27,50 +28,170 @@ def validate_boolean_expression(expression):
             raise ValueError("Illegal boolean expression %r" % expression)
 
 
-def match_tags(tags_list, tags_filter):
-    """Check whether a tags list answers a condition expressed in tags_filter.
+class _ExpressionParser(object):
+    """Parser of a tokenized tags filter into a predicate.
+
+    The grammar follows Python's boolean operators precedence:
+    'or' binds loosest, then 'and', then 'not'.
+
+    Attributes:
+        tokens (list): the literals and tags of the expression.
+        position (number): index of the next token to parse.
+    """
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def _peek(self):
+        """Return the next token, or None at the end of the expression."""
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+
+        return None
+
+    def _next(self):
+        """Consume and return the next token.
+
+        Raises:
+            SyntaxError. in case the expression ended.
+        """
+        token = self._peek()
+        if token is None:
+            raise SyntaxError("Unexpected end of expression")
+
+        self.position += 1
+        return token
+
+    def parse(self):
+        """Parse the whole expression.
+
+        Returns:
+            function. predicate of a list of lower case tags.
+
+        Raises:
+            SyntaxError. in case the expression is illegal.
+        """
+        predicate = self._parse_or()
+        if self._peek() is not None:
+            raise SyntaxError("Unexpected %r" % self._peek())
+
+        return predicate
+
+    def _parse_or(self):
+        """Parse a disjunction of conjunctions."""
+        operands = [self._parse_and()]
+        while self._peek() == "or":
+            self._next()
+            operands.append(self._parse_and())
+
+        if len(operands) == 1:
+            return operands[0]
+
+        return lambda tags: any(operand(tags) for operand in operands)
+
+    def _parse_and(self):
+        """Parse a conjunction of negations."""
+        operands = [self._parse_not()]
+        while self._peek() == "and":
+            self._next()
+            operands.append(self._parse_not())
+
+        if len(operands) == 1:
+            return operands[0]
+
+        return lambda tags: all(operand(tags) for operand in operands)
+
+    def _parse_not(self):
+        """Parse a possibly negated operand."""
+        if self._peek() == "not":
+            self._next()
+            operand = self._parse_not()
+            return lambda tags: not operand(tags)
+
+        return self._parse_atom()
+
+    def _parse_atom(self):
+        """Parse a tag pattern, a boolean literal or a parenthesized part."""
+        token = self._next()
+        if token == "(":
+            predicate = self._parse_or()
+            if self._next() != ")":
+                raise SyntaxError("Unbalanced parentheses")
+
+            return predicate
+
+        if token in ("True", "False"):
+            value = token == "True"
+            return lambda tags: value
+
+        if token in VALID_LITERALS:
+            raise SyntaxError("Unexpected %r" % token)
+
+        pattern = re.compile(translate(token.lower()))
+        return lambda tags: any(pattern.match(tag) for tag in tags)
+
+
+COMPILED_FILTERS = {}
+
+
+def compile_tags_filter(tags_filter):
+    """Compile a tags filter into a predicate of tags lists.
+
+    The compiled filters are cached, so each expression is parsed once.
 
     Note:
-        The tags are matched using fnmatch, which enables using filters such
-        as 'Tag*'.
+        The tags are matched using fnmatch patterns, which enables using
+        filters such as 'Tag*'.
 
     Args:
-        tags_list (iterable): tags list to be verified against the tags_filter,
-            e.g. ["Tag1", "Tag2"].
         tags_filter (str): boolean expression composed of tags and boolean
             operators, e.g. "Tag1 and (Tag2 or Tag3 or Tag3)".
 
     Returns:
-        bool. whether the tags list answers the condition expressed in the
-            given tags_filter.
+        function. predicate that gets a tags list and returns whether it
+            answers the condition expressed in the given tags_filter.
 
     Raises:
         ValueError. in case the given boolean expression is illegal.
     """
+    cached_predicate = COMPILED_FILTERS.get(tags_filter)
+    if cached_predicate is not None:
+        return cached_predicate
+
     # Add spaces for easier literal validation
     spaced_expression = tags_filter.replace("(", " ( ").replace(")", " ) ")
 
-    boolean_expression_list = []
+    try:
+        predicate = _ExpressionParser(spaced_expression.split()).parse()
 
-    lower_case_tags = [tag.lower() for tag in tags_list]
+    except SyntaxError:
+        raise ValueError("Illegal boolean expression %r" % tags_filter)
 
-    # Replace the tags in the expression with True if they appear in the tags
-    # list, False otherwise
-    for element in spaced_expression.split():
-        if element != "":
-            if element not in VALID_LITERALS:
-                element = str(any(fnmatch(tag, element.lower())
-                                  for tag in lower_case_tags))
+    def tags_predicate(tags_list):
+        return predicate([tag.lower() for tag in tags_list])
 
-            boolean_expression_list.append(element)
+    COMPILED_FILTERS[tags_filter] = tags_predicate
+    return tags_predicate
 
-    boolean_expression = " ".join(boolean_expression_list)
 
-    # Validate that the calculated expression is comprised of boolean literals
-    validate_boolean_expression(boolean_expression)
+def match_tags(tags_list, tags_filter):
+    """Check whether a tags list answers a condition expressed in tags_filter.
 
-    try:
-        return eval(boolean_expression)
+    Note:
+        The tags are matched using fnmatch, which enables using filters such
+        as 'Tag*'.
 
-    except SyntaxError:
-        raise ValueError("Illegal boolean expression %r" % tags_filter)
+    Args:
+        tags_list (iterable): tags list to be verified against the tags_filter,
+            e.g. ["Tag1", "Tag2"].
+        tags_filter (str): boolean expression composed of tags and boolean
+            operators, e.g. "Tag1 and (Tag2 or Tag3 or Tag3)".
+
+    Returns:
+        bool. whether the tags list answers the condition expressed in the
+            given tags_filter.
+
+    Raises:
+        ValueError. in case the given boolean expression is illegal.
+    """
+    return compile_tags_filter(tags_filter)(tags_list)
@@ -6,9 +6,11 @@ import sys
 from itertools import count
 
 import six
+from django.db import connections
 
 from rotest.core.block import TestBlock
 from rotest.common.config import ROTEST_WORK_DIR
+from rotest.management.base_resource import ExceptionCatchingThread
 from rotest.core.flow_component import (AbstractFlowComponent, MODE_CRITICAL,
                                         MODE_FINALLY, MODE_OPTIONAL,
                                         JumpException)
@@ -45,9 +47,16 @@ class TestFlow(AbstractFlowComponent):
     with values using the 'parametrize' class method (see :class:`TestBlock`
     documentation for more information).
 
+    A parallel flow (see **PARALLEL**) runs all its blocks concurrently, each
+    in a thread of its own, and is meant to be used as a block of another
+    flow. Since none of its blocks precedes the others, they don't skip on
+    each other's failures or get each other's outputs, and the data they
+    share is passed on to the enclosing flow, as if they ran in it.
+    The blocks' resources are requested by the parallel flow in advance.
+
     Note:
         Blocks will run in the order in which they are defined in the
-        `blocks` tuple.
+        `blocks` tuple, unless the flow is parallel.
 
     Attributes:
         save_state (bool): flag to determine if storing the states of
@@ -72,11 +81,13 @@ class TestFlow(AbstractFlowComponent):
         TAGS (list): list of tags by which the test may be filtered.
         IS_COMPLEX (bool): if this test is complex (may contain sub-tests).
         TIMEOUT (number): timeout for flow run, None means no timeout.
+        PARALLEL (bool): whether to run the blocks concurrently.
     """
     blocks = ()
 
     TAGS = []
     TIMEOUT = 1800  # 30 min
+    PARALLEL = False
     IS_COMPLEX = True
 
     TEST_METHOD_NAME = "test_run_blocks"
@@ -88,6 +99,10 @@ class TestFlow(AbstractFlowComponent):
 
         self._tests = []
         self._run_index = 0  # Index of the next block to run
+        # Identifiers of the blocks that finished with each kind of result
+        self._error_blocks = set()
+        self._failing_blocks = set()
+        self._unsuccessful_blocks = set()
         super(TestFlow, self).__init__(parent=parent,
                                        config=config,
                                        indexer=indexer,
@@ -118,7 +133,7 @@ class TestFlow(AbstractFlowComponent):
                        skip_init=skip_init,
                        save_state=save_state,
                        enable_debug=enable_debug,
-                       base_work_dir=self.work_dir,
+                       base_work_dir=None,
                        resource_manager=self.resource_manager)
 
         self._set_parameters(override_previous=False,
@@ -134,6 +149,46 @@ class TestFlow(AbstractFlowComponent):
     def addTest(self, test_item):
         self._tests.append(test_item)
 
+    @classmethod
+    def get_resource_requests(cls):
+        """Return a list of all the resource requests this test makes.
+
+        The requests of a parallel flow also include its blocks' requests,
+        so they wouldn't be made concurrently by the blocks.
+
+        Returns:
+            list. resource requests of the test class.
+        """
+        all_requests = super(TestFlow, cls).get_resource_requests()
+        if cls.PARALLEL:
+            for block_class in cls.blocks:
+                for new_request in block_class.get_resource_requests():
+                    if new_request not in all_requests:
+                        all_requests.append(new_request)
+
+        return all_requests
+
+    @classmethod
+    def get_output_fields(cls, block):
+        """Return the names of the fields the block shares with its siblings.
+
+        Args:
+            block (AbstractFlowComponent): block of the flow.
+
+        Returns:
+            list. names of the fields the block shares.
+        """
+        if isinstance(block, TestBlock):
+            return [block._pipes[output].parameter_name
+                    if output in block._pipes else output
+                    for output in block.get_outputs()]
+
+        if isinstance(block, TestFlow) and block.PARALLEL:
+            return [field for sub_block in block
+                    for field in cls.get_output_fields(sub_block)]
+
+        return []
+
     def validate_inputs(self, extra_inputs=[]):
         """Validate that all the required inputs of the blocks were passed.
 
@@ -156,13 +211,8 @@ class TestFlow(AbstractFlowComponent):
         fields.extend(extra_inputs)
         for block in self:
             block.validate_inputs(fields)
-            if isinstance(block, TestBlock):
-                for output in block.get_outputs().keys():
-                    if output in block._pipes:
-                        fields.append(block._pipes[output].parameter_name)
-
-                    else:
-                        fields.append(output)
+            if not self.PARALLEL:
+                fields.extend(self.get_output_fields(block))
 
     @classmethod
     def get_name(cls):
@@ -193,6 +243,25 @@ class TestFlow(AbstractFlowComponent):
             block._set_parameters(override_previous, validate_legality=False,
                                   **parameters)
 
+    def share_data(self, override_previous=True, **parameters):
+        """Inject the parameters to the flow's components.
+
+        A parallel flow passes the parameters on to the enclosing flow, which
+        injects them back to the parallel flow along with its siblings.
+
+        Args:
+            override_previous (bool): whether to override previous value of
+                the parameters if they were already injected or not.
+        """
+        if self.PARALLEL and not self.is_main:
+            self.parent.share_data(override_previous=override_previous,
+                                   **parameters)
+
+        else:
+            super(TestFlow, self).share_data(
+                                        override_previous=override_previous,
+                                        **parameters)
+
     def _is_valid_input(self, parameter_name):
         """Check if the given parameter is a valid inputs for the component.
 
@@ -274,21 +343,108 @@ class TestFlow(AbstractFlowComponent):
 
     def was_successful(self):
         """Return whether the result of the flow-run was success or not."""
-        return (all(block.was_successful() for block in self) and
+        return (len(self._unsuccessful_blocks) == 0 and
                 super(TestFlow, self).was_successful())
 
     def had_error(self):
         """Return whether any of the blocks had an exception during its run."""
-        return (any(block.had_error() for block in self) or
+        return (len(self._error_blocks) > 0 or
                 super(TestFlow, self).had_error())
 
+    def has_failing_block_before(self, block):
+        """Return whether a block preceding the given one fails the flow.
+
+        Note:
+            The blocks' identifiers are given by their order in the flow.
+
+        Args:
+            block (AbstractFlowComponent): block of the flow.
+
+        Returns:
+            bool. True if a preceding block failed the flow, False otherwise.
+        """
+        if self.PARALLEL:
+            return False
+
+        return any(identifier < block.identifier
+                   for identifier in self._failing_blocks)
+
+    def _update_block_result(self, block):
+        """Record the result of a block that finished running.
+
+        Blocks may run more than once (e.g. after jumping back to them), so
+        only the result of their last run is kept.
+
+        Args:
+            block (AbstractFlowComponent): the finished block.
+        """
+        if block.is_failing():
+            self._failing_blocks.add(block.identifier)
+
+        else:
+            self._failing_blocks.discard(block.identifier)
+
+        if not block.was_successful():
+            self._unsuccessful_blocks.add(block.identifier)
+
+        else:
+            self._unsuccessful_blocks.discard(block.identifier)
+
+        if block.had_error():
+            self._error_blocks.add(block.identifier)
+
+        else:
+            self._error_blocks.discard(block.identifier)
+
+    def _run_block(self, block):
+        """Run a block of a parallel flow, in the current thread.
+
+        Args:
+            block (AbstractFlowComponent): block to run.
+        """
+        try:
+            block(self.result)
+
+        finally:
+            # The thread's events may have opened database connections
+            for connection in connections.all():
+                connection.close()
+
+    def _run_parallel_blocks(self):
+        """Run all the blocks under the test-flow concurrently."""
+        block_threads = []
+        for block in self:
+            block_thread = ExceptionCatchingThread(target=self._run_block,
+                                                   args=(block,))
+            block_thread.start()
+            block_threads.append(block_thread)
+
+        for block, block_thread in zip(self, block_threads):
+            block_thread.join()
+            self._update_block_result(block)
+
+        for block_thread in block_threads:
+            if block_thread.traceback_tuple is not None:
+                six.reraise(*block_thread.traceback_tuple)
+
     def test_run_blocks(self):
         """Main test method, run the blocks under the test-flow."""
         self._run_index = 0
-        while self._run_index < len(self._tests):
-            test = self._tests[self._run_index]
-            self._run_index += 1
-            test(self.result)
+        self._error_blocks.clear()
+        self._failing_blocks.clear()
+        self._unsuccessful_blocks.clear()
+        if self.PARALLEL:
+            self._run_parallel_blocks()
+
+        else:
+            while self._run_index < len(self._tests):
+                test = self._tests[self._run_index]
+                self._run_index += 1
+                try:
+                    test(self.result)
+
+                finally:
+                    self._update_block_result(test)
 
         self._run_index = 0
         all_issues = []
@@ -329,8 +485,10 @@ class TestFlow(AbstractFlowComponent):
         super(TestFlow, self).run(result)
 
 
-def create_flow(blocks, name="AnonymousFlow", mode=MODE_CRITICAL, common={}):
+def create_flow(blocks, name="AnonymousFlow", mode=MODE_CRITICAL, common={},
+                parallel=False):
     """Auxiliary function to create test flows on the spot."""
     return type(name, (TestFlow,), {'mode': mode,
                                     'common': common,
-                                    'blocks': blocks})
+                                    'blocks': blocks,
+                                    'PARALLEL': parallel})
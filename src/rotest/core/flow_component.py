@@ -14,7 +14,7 @@ from future.utils import iteritems
 from future.builtins import range, object
 
 from rotest.common import core_log
-from rotest.common.utils import get_work_dir
+from rotest.common.utils import get_work_dir_name
 from rotest.core.result.result import Result
 from rotest.common.config import ROTEST_WORK_DIR
 from rotest.core.abstract_test import AbstractTest
@@ -164,7 +164,8 @@ class AbstractFlowComponent(AbstractTest):
         core_log.debug("Initializing %r flow-component", name)
 
         core_log.debug("Creating database entry for %r flow component", name)
-        self.work_dir = get_work_dir(base_work_dir, name, self)
+        self._base_work_dir = base_work_dir
+        self._work_dir_name = get_work_dir_name(name, self)
         self.data = CaseData(name=name, run_data=run_data)
 
         if self.resource_manager is None:
@@ -195,8 +196,8 @@ class AbstractFlowComponent(AbstractTest):
                 the parameters if they were already injected or not.
         """
         if not self.IS_COMPLEX:
-            self.parent._set_parameters(override_previous=override_previous,
-                                        **parameters)
+            self.parent.share_data(override_previous=override_previous,
+                                   **parameters)
 
         else:
             self._set_parameters(override_previous=override_previous,
@@ -258,16 +259,11 @@ class AbstractFlowComponent(AbstractTest):
                         self.skipTest(skip_reason)
 
             else:
-                if self.mode in (MODE_CRITICAL, MODE_OPTIONAL):
-                    siblings = list(self.parent)
-                    for component in siblings:
-                        if component is self:
-                            break
+                if self.mode in (MODE_CRITICAL, MODE_OPTIONAL) and \
+                        self.parent.has_failing_block_before(self):
 
-                        if component.is_failing():
-                            self.skip_sub_components(
-                                                self.PREVIOUS_FAILED_MESSAGE)
-                            self.skipTest(self.PREVIOUS_FAILED_MESSAGE)
+                    self.skip_sub_components(self.PREVIOUS_FAILED_MESSAGE)
+                    self.skipTest(self.PREVIOUS_FAILED_MESSAGE)
 
             try:
                 self.request_resources(self.get_resource_requests(),
@@ -344,6 +340,16 @@ class AbstractFlowComponent(AbstractTest):
             if e.jump_target is not self.parent:
                 raise
 
+    def start(self):
+        """Update the data that the component started.
+
+        Components run again when jumping back to them, and their result is
+        the result of their last run.
+        """
+        self.data.success = None
+        self.data.exception_type = None
+        super(AbstractFlowComponent, self).start()
+
     def is_failing(self):
         """State if the component fails the flow (according to its mode).
 
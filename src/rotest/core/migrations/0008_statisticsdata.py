@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.0.13 on 2026-10-19 04:08
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import rotest.common.django_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_auto_20190911_0948'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatisticsData',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', rotest.common.django_utils.fields.NameField(max_length=150, unique=True)),
+                ('durations', models.TextField(blank=True, default='[]')),
+            ],
+        ),
+    ]
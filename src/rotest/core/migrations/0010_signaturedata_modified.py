@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.0.13 on 2026-10-19 12:10
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_signaturedata_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='signaturedata',
+            name='modified',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
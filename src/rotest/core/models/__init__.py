@@ -9,4 +9,5 @@ from .run_data import RunData
 from .case_data import CaseData
 from .suite_data import SuiteData
 from .signature import SignatureData
+from .statistics_data import StatisticsData
 from .general_data import GeneralData
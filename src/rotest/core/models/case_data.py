@@ -46,6 +46,7 @@ class CaseData(GeneralData):
     MAX_CHAR_LEN = 1000
     TB_SEPARATOR = 80 * '-' + '\n'
     _RUNTIME_ORDER = '-start_time'
+    QUERY_CHUNK_SIZE = 500
 
     RESULT_CHOICES = {TestOutcome.SUCCESS: 'Success',
                       TestOutcome.ERROR: 'Error',
@@ -100,6 +101,56 @@ class CaseData(GeneralData):
 
         return matches.count() > 0 and matches.first().success
 
+    @classmethod
+    def get_passed_names(cls, test_names, run_data=None):
+        """Return the names of the given tests whose last run was successful.
+
+        This is the bulk version of :meth:`should_skip`. The last run of each
+        test is found by the database, which compares per name the start time
+        of the latest run with the start time of the latest successful one,
+        so only the names of the passed tests are fetched.
+
+        Args:
+            test_names (iterable): names of the tests to check, e.g. the
+                names of the tests in the run's tree.
+            run_data (RunData): test run data object, leave None to not filter
+                by run data parameters. If it was already saved, the tests
+                of that run are excluded from the search.
+
+        Returns:
+            set. names of the tests whose last run was successful.
+        """
+        query_set = CaseData.objects.filter(start_time__isnull=False)
+
+        if run_data is not None:
+            if run_data.run_name is not None:
+                query_set = query_set.filter(
+                                    run_data__run_name=run_data.run_name)
+
+            if run_data.pk is not None:
+                query_set = query_set.exclude(run_data=run_data)
+
+        query_set = query_set.exclude(exception_type=TestOutcome.SKIPPED)
+
+        test_names = list(set(test_names))
+        passed_names = set()
+        for index in range(0, len(test_names), cls.QUERY_CHUNK_SIZE):
+            names_query = query_set.filter(
+                name__in=test_names[index:index + cls.QUERY_CHUNK_SIZE])
+
+            names_query = names_query.order_by().values('name').annotate(
+                last_run=models.Max('start_time'),
+                last_success=models.Max(models.Case(
+                    models.When(success=True,
+                                then=models.F('start_time')),
+                    output_field=models.DateTimeField())))
+
+            passed_names.update(names_query.filter(
+                last_success=models.F('last_run')).values_list(
+                    'name', flat=True).distinct())
+
+        return passed_names
+
     def resources_names(self):
         """Return a string representing the resources this test used.
 
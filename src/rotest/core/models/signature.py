@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 
 import re
+import hashlib
 
 from django.db import models
 from future.builtins import object
@@ -21,30 +22,88 @@ class SignatureData(models.Model):
         name (str): name of signature.
         link (str): link to the issue page.
         pattern (str): pattern of the signature.
+        fingerprint (str): hash of the normalized error the signature was
+            created from, used to find the signature of known errors
+            without matching patterns.
+        modified (datetime): the last time the signature was saved.
     """
     MAX_LINK_LENGTH = 200
     MAX_PATTERN_LENGTH = 1000
+    FINGERPRINT_LENGTH = 64
+
+    NUMBER_PATTERN = r"\d+(?:\.\d+)?(?:e\-?\d+)?"
+    NORMALIZATIONS = (
+        (re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}[.,\d]*"),
+         "<TIME>"),
+        (re.compile(r"0x[0-9a-fA-F]+"), "<ADDRESS>"),
+        (re.compile(r"(?:[A-Za-z]:)?(?:[\\/][^\\/\s\"':]+)+[\\/]"), ""),
+        (re.compile(r"\d+"), "<NUMBER>"),
+        (re.compile(r"[ \t]+"), " "))
 
     link = models.CharField(max_length=MAX_LINK_LENGTH)
     pattern = models.TextField(max_length=MAX_PATTERN_LENGTH)
+    fingerprint = models.CharField(max_length=FINGERPRINT_LENGTH,
+                                   db_index=True, blank=True, default="")
+    modified = models.DateTimeField(auto_now=True)
 
     class Meta(object):
         """Define the Django application for this model."""
         app_label = 'core'
 
-    @staticmethod
-    def create_pattern(error_message):
+    @classmethod
+    def create_pattern(cls, error_message):
         """Create a pattern from a failure or error message.
 
+        The numbers in the message are replaced with a pattern that matches
+        only numbers, so matching the pattern doesn't backtrack over the
+        rest of the error.
+
         args:
             error_message (str): error message to parse.
 
         returns:
             str. pattern for the given error message.
         """
-        return re.sub(r"\d+(\\.\d+)?(e\\-?\d+)?", ".+",
+        return re.sub(r"\d+(\\.\d+)?(e\\-?\d+)?",
+                      lambda number: cls.NUMBER_PATTERN,
                       re.escape(error_message))
 
+    @classmethod
+    def normalize_error(cls, error_message):
+        """Strip the details that differ between occurrences of an error.
+
+        Timestamps, memory addresses, directories of paths and numbers are
+        replaced, and the whitespaces around each line are removed.
+
+        Args:
+            error_message (str): error message to normalize.
+
+        Returns:
+            str. the normalized error message.
+        """
+        error_message = error_message.replace("\r\n", "\n")
+        for expression, replacement in cls.NORMALIZATIONS:
+            error_message = expression.sub(replacement, error_message)
+
+        return "\n".join(line.strip()
+                         for line in error_message.strip().splitlines())
+
+    @classmethod
+    def create_fingerprint(cls, error_message):
+        """Create a fingerprint from a failure or error message.
+
+        Occurrences of the same error in different runs get the same
+        fingerprint, as it's a hash of the normalized frames and exception.
+
+        Args:
+            error_message (str): error message to fingerprint.
+
+        Returns:
+            str. hexadecimal hash of the normalized error message.
+        """
+        normalized_error = cls.normalize_error(error_message)
+        return hashlib.sha256(normalized_error.encode("utf-8")).hexdigest()
+
     def __unicode__(self):
         return "Signature {}".format(self.id)
 
@@ -0,0 +1,58 @@
+"""Define StatisticsData model class."""
+# pylint: disable=no-init
+from __future__ import absolute_import
+
+import json
+
+from django.db import models
+from future.builtins import object
+
+from rotest.common.django_utils.fields import NameField
+
+
+class StatisticsData(models.Model):
+    """Contain the recent successful run durations of a test.
+
+    The table holds a single row per test name, updated incrementally
+    whenever a case of that name finishes successfully, so duration
+    statistics can be answered without scanning the runs history.
+
+    Attributes:
+        name (str): name of the test, e.g. "MyTest.test_method".
+        durations (str): JSON list of the latest durations of the test
+            in seconds, newest first, holding up to WINDOW_SIZE values.
+        WINDOW_SIZE (number): maximal number of durations to keep per test.
+    """
+    WINDOW_SIZE = 300
+
+    name = NameField(unique=True)
+    durations = models.TextField(blank=True, default="[]")
+
+    class Meta(object):
+        """Define the Django application for this model."""
+        app_label = 'core'
+
+    def __unicode__(self):
+        """Django version of __str__"""
+        return "%s" % self.name
+
+    def __repr__(self):
+        """Unique Representation for data"""
+        return "<StatisticsData: name=%r>" % self.name
+
+    def get_durations(self):
+        """Return the stored durations of the test, newest first.
+
+        Returns:
+            list. durations of the latest successful runs, in seconds.
+        """
+        return json.loads(self.durations)
+
+    def add_duration(self, duration):
+        """Add the duration of a new run to the rolling window.
+
+        Args:
+            duration (number): duration of the run in seconds.
+        """
+        durations = [duration] + self.get_durations()
+        self.durations = json.dumps(durations[:self.WINDOW_SIZE])
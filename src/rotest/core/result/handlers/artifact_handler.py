@@ -1,29 +1,60 @@
 """Artifact creating handler."""
+# pylint: disable=broad-except
 from __future__ import absolute_import
 import os
-from zipfile import ZipFile
+import sys
+import atexit
+import zipfile
+import threading
+from weakref import WeakSet
 
-from rotest.common import config
+from six.moves import queue
+
+from rotest.common import config, core_log
+from rotest.common.log import flush_logs
 from .abstract_handler import AbstractResultHandler
 
 
+# Handlers whose artifact wasn't completed yet
+OPEN_HANDLERS = WeakSet()
+
+
+@atexit.register
+def finish_open_artifacts():
+    """Complete the artifacts of runs that didn't end properly."""
+    for handler in list(OPEN_HANDLERS):
+        handler._finish_artifact()  # pylint: disable=protected-access
+
+
 class ArtifactHandler(AbstractResultHandler):
     """Artifact creating result handler.
 
-    At the end of the test, this handler creates a zip of the work directory,
-    and updates the run data.
+    At the end of each test, this handler adds the test's work directory to
+    a zip of the run, and updates the run data. The files are compressed by
+    a background thread into an archive that stays open during the run, so
+    the tests don't wait for it, and each file is added only once. The
+    archive is completed when the run ends, or on interpreter exit.
 
     Attributes:
         artifacts_path (str): base dir to create the artifacts in.
+        archived_files (set): paths of the files added to the artifact.
         EXTENSTION (str): the extension to append to the artifact file,
             e.g. '.zip'.
         DEFAULT_PROJECT_FOLDER (str): default project dir for the artifact. If
             the user specified a run name, it would be used as project dir.
+        COMPRESSION_METHODS (dict): zip compression methods by their names.
     """
     NAME = 'artifact'
     EXTENSTION = '.zip'
     DEFAULT_PROJECT_FOLDER = 'default'
 
+    COMPRESSION_METHODS = {
+        name: getattr(zipfile, "ZIP_" + name.upper())
+        for name in ("stored", "deflated", "bzip2", "lzma")
+        if hasattr(zipfile, "ZIP_" + name.upper())}
+
+    _FINISH = None
+
     def __init__(self, *args, **kwargs):
         """Initialize the handler and check that the artifacts dir was set."""
         super(ArtifactHandler, self).__init__(*args, **kwargs)
@@ -48,36 +79,105 @@ class ArtifactHandler(AbstractResultHandler):
                              os.path.basename(self.main_test.work_dir)) \
                              + self.EXTENSTION
 
-        with ZipFile(self.artifact_path, mode='w', allowZip64=True):
-            pass
+        self.archived_files = set()
+        self.directories = queue.Queue()
+        self.artifact = self._open_artifact()
+        self.archiving_thread = threading.Thread(target=self._archive_loop)
+        self.archiving_thread.daemon = True
+        self.archiving_thread.start()
+        OPEN_HANDLERS.add(self)
+
+        if run_data is not None:
+            run_data.artifact_path = self.artifact_path
+            if run_data.pk is not None:
+                run_data.save()
+
+    def _open_artifact(self):
+        """Create the artifact file according to the configured compression.
+
+        Returns:
+            zipfile.ZipFile. the opened artifact.
+        """
+        try:
+            compression = \
+                self.COMPRESSION_METHODS[config.ARTIFACTS_COMPRESSION]
+
+        except KeyError:
+            raise ValueError("Unsupported artifacts compression %r, "
+                             "use one of %s" %
+                             (config.ARTIFACTS_COMPRESSION,
+                              sorted(self.COMPRESSION_METHODS)))
+
+        options = {}
+        if config.ARTIFACTS_COMPRESSION_LEVEL is not None:
+            if sys.version_info >= (3, 7):
+                options["compresslevel"] = \
+                    int(config.ARTIFACTS_COMPRESSION_LEVEL)
+
+            else:
+                core_log.warning("Artifacts compression level is supported "
+                                 "from Python 3.7, using the default level")
+
+        return zipfile.ZipFile(self.artifact_path, mode='w',
+                               compression=compression, allowZip64=True,
+                               **options)
 
-        run_data.artifact_path = self.artifact_path
-        if run_data.pk is not None:
-            run_data.save()
+    def _archive_directory(self, directory, recursive=True):
+        """Add the files of the directory that weren't added yet.
+
+        Args:
+            directory (str): path of the directory to add.
+            recursive (bool): whether to add the files of sub directories.
+        """
+        for root, sub_directories, files in os.walk(directory):
+            if not recursive:
+                del sub_directories[:]
+
+            for item in files:
+                file_path = os.path.abspath(os.path.join(root, item))
+                if file_path not in self.archived_files:
+                    self.archived_files.add(file_path)
+                    self.artifact.write(file_path)
+
+    def _archive_loop(self):
+        """Add the queued directories to the artifact until it's finished."""
+        while True:
+            directory, recursive = self.directories.get()
+            if directory is self._FINISH:
+                break
+
+            try:
+                # Make sure the logs of the tests were written
+                flush_logs()
+                self._archive_directory(directory, recursive)
+
+            except Exception:
+                core_log.exception("Failed adding %r to the artifact",
+                                   directory)
+
+    def _finish_artifact(self):
+        """Add the queued directories and close the artifact."""
+        if self.archiving_thread is None:
+            return
+
+        self.directories.put((self._FINISH, False))
+        self.archiving_thread.join()
+        self.archiving_thread = None
+        self.artifact.close()
+        OPEN_HANDLERS.discard(self)
 
     def stop_test(self, test):
-        """Add the case dir to the artifact.
+        """Queue the case dir to be added to the artifact.
 
         Args:
             test (object): test item instance.
         """
-        with ZipFile(self.artifact_path, mode='a',
-                     allowZip64=True) as artifact:
-
-            for root, _, files in os.walk(test.work_dir):
-                for item in files:
-                    file_path = os.path.join(root, item)
-                    artifact.write(file_path)
+        self.directories.put((test.work_dir, True))
 
     def stop_test_run(self):
-        """Add the files of the main work directory to the artifact.
+        """Add the files of the main work directory and complete the artifact.
 
         This is used to copy global files of the run, such as results excel.
         """
-        with ZipFile(self.artifact_path, mode='a',
-                     allowZip64=True) as artifact:
-
-            for item in os.listdir(self.main_test.work_dir):
-                file_path = os.path.join(self.main_test.work_dir, item)
-                if os.path.isfile(file_path):
-                    artifact.write(file_path)
+        self.directories.put((self.main_test.work_dir, False))
+        self._finish_artifact()
@@ -2,21 +2,115 @@
 # pylint: disable=unused-argument
 from __future__ import absolute_import
 
+import time
+import atexit
+from weakref import WeakSet
+from collections import OrderedDict
+
 import six
+from django.db import transaction
+
+from rotest.common.config import DB_FLUSH_INTERVAL
+from rotest.core.models.case_data import CaseData
+from rotest.core.utils.test_statistics import update_statistics
 
 from .abstract_handler import AbstractResultHandler
 
 
+# Handlers in write-behind mode whose run hasn't ended yet
+PENDING_HANDLERS = WeakSet()
+
+
+@atexit.register
+def flush_pending_handlers():
+    """Save the buffered test datas of runs that didn't end properly."""
+    for handler in list(PENDING_HANDLERS):
+        handler.flush()
+
+
 class DBHandler(AbstractResultHandler):
     """Database result handler.
 
     Overrides result handler's methods to update the Rotest's database
     values on each event change in the main result object.
+
+    When FLUSH_INTERVAL is positive, the handler works in write-behind mode:
+    changed test datas are buffered and saved together in one transaction
+    once the interval passes, at the end of the run and on interpreter exit.
+
+    Attributes:
+        FLUSH_INTERVAL (number): seconds to buffer changed test datas before
+            saving them, or 0 to save them on every event.
+        IMMEDIATE_EVENTS (tuple): names of the events (e.g. 'add_failure')
+            whose test data is saved immediately even in write-behind mode.
     """
     NAME = 'db'
 
+    FLUSH_INTERVAL = DB_FLUSH_INTERVAL
+    IMMEDIATE_EVENTS = ()
+
     SKIP_DELTA_MESSAGE = "Previous run passed according to local DB"
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the result handler.
+
+        Attributes:
+            passed_tests (set): names of the tests that passed in the last
+                run, filled at the start of the run when in delta mode.
+            dirty_datas (OrderedDict): test datas waiting to be saved, by
+                their ids, in write-behind mode.
+            finished_datas (list): datas of the ended tests waiting to update
+                the tests' statistics, in write-behind mode.
+            last_flush_time (number): time of the last buffered datas flush.
+        """
+        super(DBHandler, self).__init__(*args, **kwargs)
+        self.passed_tests = set()
+        self.dirty_datas = OrderedDict()
+        self.finished_datas = []
+        self.last_flush_time = time.time()
+
+        if self.FLUSH_INTERVAL > 0:
+            PENDING_HANDLERS.add(self)
+
+    def _save_data(self, test, event, finished=False):
+        """Save the test's data, or buffer it in write-behind mode.
+
+        Args:
+            test (object): test item instance.
+            event (str): name of the event that changed the data.
+            finished (bool): whether the test has ended, so its statistics
+                should be updated too.
+        """
+        if self.FLUSH_INTERVAL <= 0 or event in self.IMMEDIATE_EVENTS:
+            test.data.save()
+            if finished:
+                update_statistics(test.data)
+
+            return
+
+        self.dirty_datas[id(test.data)] = test.data
+        if finished:
+            self.finished_datas.append(test.data)
+
+        if time.time() - self.last_flush_time >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Save all the buffered test datas in a single transaction."""
+        self.last_flush_time = time.time()
+        if len(self.dirty_datas) == 0:
+            return
+
+        with transaction.atomic():
+            for test_data in six.itervalues(self.dirty_datas):
+                test_data.save()
+
+            for test_data in self.finished_datas:
+                update_statistics(test_data)
+
+        self.dirty_datas.clear()
+        self.finished_datas = []
+
     @staticmethod
     def _save_resource(resource, test):
         """Save a copy of the resource to the DB and link it to the Case.
@@ -50,32 +144,56 @@ class DBHandler(AbstractResultHandler):
                 test.data.add_sub_test_data(sub_test.data)
                 cls._save_sub_tests(sub_test, run_data)
 
+    @classmethod
+    def _get_test_names(cls, test):
+        """Yield the names of the test and of its sub tests.
+
+        Args:
+            test (object): test item instance.
+
+        Yields:
+            str. names of the tests in the test's tree.
+        """
+        yield test.data.name
+
+        if test.IS_COMPLEX:
+            for sub_test in test:
+                for name in cls._get_test_names(sub_test):
+                    yield name
+
     def start_test_run(self):
-        """Save all the test datas and the run data."""
+        """Save all the test datas and the run data.
+
+        All the datas are saved in a single transaction, which saves the
+        overhead of committing each of the tree's nodes separately.
+        """
         if self.main_test is None:
             return
 
         run_data = self.main_test.data.run_data
-        if run_data is not None:
-            # Save the run data so it'll have a pk.
-            if run_data.main_test is not None:
-                main_test = run_data.main_test
+        with transaction.atomic():
+            if run_data is not None:
+                # Save the run data so it'll have a pk, and point it to the
+                # main test only after the main test is saved too.
                 run_data.main_test = None
                 run_data.save()
-                main_test.save()
-                run_data.main_test = main_test
-                run_data.save()
 
-            else:
+            # Save all the test datas so they'll have a pk.
+            self._save_sub_tests(self.main_test, run_data)
+
+            if run_data is not None:
+                # Repoint to the main test, now that it has a pk.
+                run_data.main_test = self.main_test.data
                 run_data.save()
 
-        # Save all the test datas so they'll have a pk.
-        self._save_sub_tests(self.main_test, run_data)
+        if run_data is not None and run_data.run_delta:
+            self.passed_tests = CaseData.get_passed_names(
+                self._get_test_names(self.main_test), run_data)
 
-        if run_data is not None:
-            # Repoint to the main test, now that it has a pk.
-            run_data.main_test = self.main_test.data
-            run_data.save()
+    def stop_test_run(self):
+        """Save the buffered test datas."""
+        self.flush()
+        PENDING_HANDLERS.discard(self)
 
     def start_test(self, test):
         """Update the test data to 'in progress' state and set the start time.
@@ -83,13 +201,14 @@ class DBHandler(AbstractResultHandler):
         Args:
             test (object): test item instance.
         """
-        test.data.save()
+        self._save_data(test, "start_test")
 
     def should_skip(self, test):
         """Check if the test passed in the last run.
 
-        The result is based on querying the local DB for the last run. If the
-        last run was successful, then the test should be skipped.
+        The result is based on the local DB's last run of each test, which is
+        queried once at the start of the run. If the last run was successful,
+        then the test should be skipped.
 
         Args:
             test (object): test item instance.
@@ -99,8 +218,7 @@ class DBHandler(AbstractResultHandler):
         """
         if (test.data.run_data is not None and
                 test.data.run_data.run_delta and
-                test.data.should_skip(test.data.name, test.data.run_data,
-                                      test.data.pk)):
+                test.data.name in self.passed_tests):
             return self.SKIP_DELTA_MESSAGE
 
         return None
@@ -117,12 +235,12 @@ class DBHandler(AbstractResultHandler):
                 self._save_resource(resource, test)
 
     def stop_test(self, test):
-        """Finalize the test's data and save a copy of its resources.
+        """Finalize the test's data and update the test's statistics.
 
         Args:
             test (object): test item instance.
         """
-        test.data.save()
+        self._save_data(test, "stop_test", finished=True)
 
     def start_composite(self, test):
         """Update the test data to 'in progress' state and set the start time.
@@ -130,7 +248,7 @@ class DBHandler(AbstractResultHandler):
         Args:
             test (TestSuite): test item instance.
         """
-        self.start_test(test)
+        self._save_data(test, "start_composite")
 
     def stop_composite(self, test):
         """Save the composite test's data.
@@ -138,7 +256,7 @@ class DBHandler(AbstractResultHandler):
         Args:
             test (TestSuite): test item instance.
         """
-        test.data.save()
+        self._save_data(test, "stop_composite")
 
     def add_success(self, test):
         """Save the test data result as success.
@@ -146,7 +264,7 @@ class DBHandler(AbstractResultHandler):
         Args:
             test (object): test item instance.
         """
-        test.data.save()
+        self._save_data(test, "add_success")
 
     def add_info(self, test, msg):
         """Called when a test registers a success message.
@@ -155,7 +273,7 @@ class DBHandler(AbstractResultHandler):
             test (rotest.core.abstract_test.AbstractTest): test item instance.
             msg (str): success message.
         """
-        test.data.save()
+        self._save_data(test, "add_info")
 
     def add_skip(self, test, reason):
         """Save the test data result as skip.
@@ -164,7 +282,7 @@ class DBHandler(AbstractResultHandler):
             test (object): test item instance.
             reason (str): skip reason description.
         """
-        test.data.save()
+        self._save_data(test, "add_skip")
 
     def add_failure(self, test, exception_str):
         """Save the test data result as failure.
@@ -173,7 +291,7 @@ class DBHandler(AbstractResultHandler):
             test (object): test item instance.
             exception_str (str): exception traceback string.
         """
-        test.data.save()
+        self._save_data(test, "add_failure")
 
     def add_error(self, test, exception_str):
         """Save the test data result as error.
@@ -182,7 +300,7 @@ class DBHandler(AbstractResultHandler):
             test (object): test item instance.
             exception_str (str): exception traceback string.
         """
-        test.data.save()
+        self._save_data(test, "add_error")
 
     def add_expected_failure(self, test, exception_str):
         """Save the test data result as expected failure.
@@ -191,7 +309,7 @@ class DBHandler(AbstractResultHandler):
             test (object): test item instance.
             exception_str (str): exception traceback string.
         """
-        test.data.save()
+        self._save_data(test, "add_expected_failure")
 
     def add_unexpected_success(self, test):
         """Save the test data result as unexpected success.
@@ -199,4 +317,4 @@ class DBHandler(AbstractResultHandler):
         Args:
             test (object): test item instance.
         """
-        test.data.save()
+        self._save_data(test, "add_unexpected_success")
@@ -1,8 +1,9 @@
 """Excel result handler."""
-# pylint: disable=unused-argument
+# pylint: disable=unused-argument,too-many-instance-attributes
 from __future__ import absolute_import
 
 import os
+import time
 from collections import OrderedDict
 
 import six
@@ -24,14 +25,22 @@ class ExcelHandler(AbstractResultHandler):
 
     Overrides result handler's methods to generate an Excel result file.
 
+    The file is saved at most once every SAVE_INTERVAL seconds, and at the
+    end of the run. Reports longer than the rows limit of a sheet continue
+    in additional sheets, and the summary counts the results in all of them.
+
     Attributes:
-        row_number (num): current Excel sheet row number to write to.
+        row_number (num): current report row number to write to.
         test_to_row (dict): match between test name to the row number to
             which it was written.
         verbosity (num): whether to include traceback in the Excel report.
         output_file_path (str): the Excel report path.
         workbook (xlwt.Workbook): Excel workbook object.
-        sheet (xlwt.Sheet): Excel sheet object.
+        sheets (list): the Excel sheets of the report, by their order.
+        sheet (xlwt.Sheet): first Excel sheet object.
+        last_save_time (number): time the file was last saved at.
+        has_unsaved_changes (bool): whether the report changed since it was
+            last saved.
     """
     NAME = 'excel'
 
@@ -39,6 +48,10 @@ class ExcelHandler(AbstractResultHandler):
     EXCEL_FILE_ENCODING = "utf-8"
     EXCEL_SHEET_NAME = "TestResults"
     EXCEL_WORKBOOK_NAME = "results.xls"
+    SHEET_NAME_PATTERN = EXCEL_SHEET_NAME + " %d"
+
+    SAVE_INTERVAL = 5  # Seconds
+    MAX_SHEET_ROWS = 65536  # Max number of rows in an xls sheet
 
     RESULT_CHOICES = CaseData.RESULT_CHOICES
 
@@ -130,6 +143,7 @@ class ExcelHandler(AbstractResultHandler):
     RESULT_COLUMN = "B"
     TRACEBACK_COLUMN = "E"
     FORMULA_PATTERN = 'COUNTIF(%s1:%s%d,"%s")'
+    SHEET_REFERENCE_PATTERN = "'%s'!"
 
     MAX_SUMMERIZE_SIZE = len(CONTENT_TO_STYLE) + ROWS_TO_SKIP + 1
 
@@ -152,8 +166,11 @@ class ExcelHandler(AbstractResultHandler):
                                                  self.EXCEL_WORKBOOK_NAME)
 
         self.workbook = xlwt.Workbook(encoding=self.EXCEL_FILE_ENCODING)
-        self.sheet = self.workbook.add_sheet(self.EXCEL_SHEET_NAME,
-                                             cell_overwrite_ok=True)
+        self.sheets = []
+        self.sheet = self._get_sheet(0)
+
+        self.last_save_time = 0
+        self.has_unsaved_changes = False
 
     def start_test(self, test):
         """Update the Excel that a test case starts.
@@ -162,8 +179,7 @@ class ExcelHandler(AbstractResultHandler):
             test (object): test item instance.
         """
         self._write_test_result(test)
-
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def stop_test(self, test):
         """Called when the given test has been run.
@@ -172,8 +188,7 @@ class ExcelHandler(AbstractResultHandler):
             test (object): test item instance.
         """
         self._write_test_result(test)
-
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def start_test_run(self):
         """Generate initial Excel report according to the root test.
@@ -181,15 +196,18 @@ class ExcelHandler(AbstractResultHandler):
         Creates a primary report containing all sub test of the root test.
         All tests will start with "Did Not Run" status.
         """
-        self._write_headers()
         self._generate_initial_excel(self.main_test)
         self._create_result_summary()
-        self._align_columns()
 
-        self.workbook.save(self.output_file_path)
+        self._save_workbook(force=True)
 
         self.row_number += 1
 
+    def stop_test_run(self):
+        """Save the final Excel report."""
+        if self.has_unsaved_changes:
+            self._save_workbook(force=True)
+
     def update_resources(self, test):
         """Write the test's resources to the Excel file.
 
@@ -206,6 +224,7 @@ class ExcelHandler(AbstractResultHandler):
 
         self._write_to_cell(self.test_to_row[test.identifier], self.RESOURCES,
                             self.DEFAULT_CELL_STYLE, resources)
+        self._save_workbook()
 
     def add_success(self, test):
         """Update the test Excel entry's result to success.
@@ -214,7 +233,7 @@ class ExcelHandler(AbstractResultHandler):
             test (object): test item instance.
         """
         self._write_test_result(test)
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def add_info(self, test, msg):
         """Called when a test registers a success message.
@@ -224,7 +243,7 @@ class ExcelHandler(AbstractResultHandler):
             msg (str): success message.
         """
         self._write_test_result(test)
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def add_skip(self, test, reason):
         """Update the test Excel entry's result to skip.
@@ -234,7 +253,7 @@ class ExcelHandler(AbstractResultHandler):
             reason (str): skip reason description.
         """
         self._write_test_result(test)
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def add_failure(self, test, exception_str):
         """Update the test Excel entry's result to failure.
@@ -244,7 +263,7 @@ class ExcelHandler(AbstractResultHandler):
             exception_str (str): exception traceback string.
         """
         self._write_test_result(test)
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def add_error(self, test, exception_str):
         """Update the test Excel entry's result to error.
@@ -254,7 +273,7 @@ class ExcelHandler(AbstractResultHandler):
             exception_str (str): exception traceback string.
         """
         self._write_test_result(test)
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def add_expected_failure(self, test, exception_str):
         """Update the test Excel entry's result to expected failure.
@@ -264,7 +283,7 @@ class ExcelHandler(AbstractResultHandler):
             exception_str (str): exception traceback string.
         """
         self._write_test_result(test)
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def add_unexpected_success(self, test):
         """Update the test Excel entry's result to unexpected success.
@@ -273,7 +292,7 @@ class ExcelHandler(AbstractResultHandler):
             test (object): test item instance.
         """
         self._write_test_result(test)
-        self.workbook.save(self.output_file_path)
+        self._save_workbook()
 
     def _generate_initial_excel(self, test):
         """Create an initial Excel test result.
@@ -353,31 +372,125 @@ class ExcelHandler(AbstractResultHandler):
                             self.DEFAULT_CELL_STYLE, tb_str)
 
         # set row's height
-        self.sheet.row(row_num).height_mismatch = True
-        self.sheet.row(row_num).height = self.ROW_HEIGHT
+        sheet, sheet_row = self._get_sheet_row(row_num)
+        sheet.row(sheet_row).height_mismatch = True
+        sheet.row(sheet_row).height = self.ROW_HEIGHT
+
+    def _save_workbook(self, force=False):
+        """Save the Excel file, unless it was saved in the last interval.
+
+        Args:
+            force (bool): whether to save the file regardless of the time
+                it was last saved at.
+        """
+        self.has_unsaved_changes = True
+        now = time.time()
+        if force or now - self.last_save_time >= self.SAVE_INTERVAL:
+            self.workbook.save(self.output_file_path)
+            self.last_save_time = now
+            self.has_unsaved_changes = False
+
+    def _get_sheet(self, index):
+        """Return the sheet of the given index, creating it if needed.
+
+        Args:
+            index (number): index of the sheet in the report.
+
+        Returns:
+            xlwt.Worksheet. the requested sheet, with headers.
+        """
+        while len(self.sheets) <= index:
+            sheet_name = self.EXCEL_SHEET_NAME
+            if len(self.sheets) > 0:
+                sheet_name = self.SHEET_NAME_PATTERN % (len(self.sheets) + 1)
+
+            sheet = self.workbook.add_sheet(sheet_name,
+                                            cell_overwrite_ok=True)
+            self._write_headers(sheet)
+            self._align_columns(sheet)
+            self.sheets.append(sheet)
+
+        return self.sheets[index]
+
+    def _get_sheet_row(self, row_number):
+        """Return the sheet and the row in it of a report row.
+
+        Each sheet starts with the headers row, followed by the next rows of
+        the report.
+
+        Args:
+            row_number (number): row number in the report, starting from 1
+                (0 is the headers row).
+
+        Returns:
+            tuple. the sheet (xlwt.Worksheet) and the row number in it.
+        """
+        sheet_index, sheet_row = divmod(row_number - 1,
+                                        self.MAX_SHEET_ROWS - 1)
+        return self._get_sheet(sheet_index), sheet_row + 1
 
     def _write_to_cell(self, row_number, header, style, content):
         """Write content to a specific cell.
 
         Args:
-            row_number (number): cell's row number.
+            row_number (number): cell's row number in the report.
             header (str): header of the cell's column.
             style (xlwt.Style): representation of an Excel format.
             content (str): content to be written to the cell.
         """
-        self.sheet.row(row_number).write(self.HEADERS.index(header),
-                                         content, style)
+        sheet, sheet_row = self._get_sheet_row(row_number)
+        sheet.row(sheet_row).write(self.HEADERS.index(header),
+                                   content, style)
 
-    def _write_headers(self):
-        """Write the column headers."""
+    def _write_headers(self, sheet):
+        """Write the column headers.
+
+        Args:
+            sheet (xlwt.Worksheet): the sheet to write the headers in.
+        """
         for header in self.HEADERS:
-            self._write_to_cell(self.row_number, header,
-                                self.BOLDED_CELL_STYLE, header)
+            sheet.row(0).write(self.HEADERS.index(header), header,
+                               self.BOLDED_CELL_STYLE)
+
+    def _align_columns(self, sheet):
+        """Align the columns width.
 
-    def _align_columns(self):
-        """Align the columns width."""
+        Args:
+            sheet (xlwt.Worksheet): the sheet to align its columns.
+        """
         for header, col_width in six.iteritems(self.HEADER_TO_WIDTH):
-            self.sheet.col(self.HEADERS.index(header)).width = col_width
+            sheet.col(self.HEADERS.index(header)).width = col_width
+
+    def _get_count_formula(self, result_type):
+        """Return a formula counting the results of the given type.
+
+        The formula counts the results in the sheet of the current row, up
+        to the row, and in all the sheets before it.
+
+        Args:
+            result_type (str): the result to count, e.g. "Success".
+
+        Returns:
+            xlwt.Formula. formula counting the results.
+        """
+        summary_sheet, summary_row = self._get_sheet_row(self.row_number)
+        counters = []
+        for sheet in self.sheets:
+            if sheet is summary_sheet:
+                counters.append(self.FORMULA_PATTERN % (self.RESULT_COLUMN,
+                                                        self.RESULT_COLUMN,
+                                                        summary_row,
+                                                        result_type))
+                break
+
+            sheet_reference = self.SHEET_REFERENCE_PATTERN % sheet.name
+            counters.append(self.FORMULA_PATTERN % (
+                                sheet_reference + self.RESULT_COLUMN,
+                                self.RESULT_COLUMN,
+                                self.MAX_SHEET_ROWS,
+                                result_type))
+
+        return xlwt.Formula("+".join(counters))
 
     def _create_result_summary(self):
         """Create result summary at the end of the Excel report."""
@@ -389,14 +502,9 @@ class ExcelHandler(AbstractResultHandler):
                                 self.CONTENT_TO_STYLE[result_type],
                                 result_type)
 
-            result_type_count = xlwt.Formula(self.FORMULA_PATTERN %
-                                             (self.RESULT_COLUMN,
-                                              self.RESULT_COLUMN,
-                                              self.row_number,
-                                              result_type))
             self._write_to_cell(self.row_number,
                                 self.SUMMARY_RESULT_COUNTER_COLUMN,
                                 self.DEFAULT_CELL_STYLE,
-                                result_type_count)
+                                self._get_count_formula(result_type))
 
             self.row_number += 1
@@ -2,7 +2,12 @@
 from __future__ import absolute_import
 
 from rotest.core.models.case_data import TestOutcome
+from rotest.management.client.result_reporter import ResultReporter
 from rotest.management.client.result_client import ClientResultManager
+from rotest.management.common.utils import (START_TEST_EVENT,
+                                            STOP_TEST_EVENT,
+                                            START_COMPOSITE_EVENT,
+                                            STOP_COMPOSITE_EVENT)
 from rotest.core.result.handlers.abstract_handler import AbstractResultHandler
 
 
@@ -11,6 +16,10 @@ class RemoteDBHandler(AbstractResultHandler):
 
     Overrides result handler's methods to update a remote Rotest database
     values on each event change in the main result object.
+
+    The tests' events are sent in batches by a background reporter, so the
+    tests don't wait for the result server. Only the run's start and end
+    are reported synchronously.
     """
     NAME = 'remote'
     SKIP_DELTA_MESSAGE = "Previous run passed according to remote DB"
@@ -20,13 +29,26 @@ class RemoteDBHandler(AbstractResultHandler):
         super(RemoteDBHandler, self).__init__(*args, **kwargs)
         self.client = ClientResultManager()
         self.client.connect()
+        self.reporter = ResultReporter(self.client)
+        self.passed_tests = set()
 
     def start_test_run(self):
-        """Save all the test datas and the run data in the remote db."""
+        """Save all the test datas and the run data in the remote db.
+
+        In delta runs, this also fetches the names of the tests that passed
+        in the last run, so skip decisions won't require further requests.
+        """
         self.client.start_test_run(self.main_test)
 
+        run_data = self.main_test.data.run_data
+        if run_data is not None and run_data.run_delta:
+            self.passed_tests = self.client.get_passed_tests()
+
+        self.reporter.start()
+
     def stop_test_run(self):
-        """Disconnect from the result server."""
+        """Send the pending events and disconnect from the result server."""
+        self.reporter.stop()
         self.client.update_run_data(self.main_test.data.run_data)
         self.client.disconnect()
 
@@ -36,13 +58,15 @@ class RemoteDBHandler(AbstractResultHandler):
         Args:
             test (object): test item instance.
         """
-        self.client.start_test(test)
+        self.reporter.report(
+            self.client.create_event(START_TEST_EVENT, test))
 
     def should_skip(self, test):
         """Check if the test passed in the last run according to the remote DB.
 
-        The result is based on querying the results DB for the last run. If the
-        last run was successful, then the test should be skipped.
+        The result is based on the results DB's last run of each test, which
+        is queried once at the start of the run. If the last run was
+        successful, then the test should be skipped.
 
         Args:
             test (object): test item instance.
@@ -51,7 +75,7 @@ class RemoteDBHandler(AbstractResultHandler):
             str. Skip reason if the test should be skipped, None otherwise.
         """
         if (test.data.run_data is not None and test.data.run_data.run_delta and
-                self.client.should_skip(test)):
+                test.data.name in self.passed_tests):
 
             return self.SKIP_DELTA_MESSAGE
 
@@ -63,7 +87,7 @@ class RemoteDBHandler(AbstractResultHandler):
         Args:
             test (object): test item instance.
         """
-        self.client.update_resources(test)
+        self.reporter.report(self.client.create_resources_event(test))
 
     def stop_test(self, test):
         """Finalize the remote test's data.
@@ -71,7 +95,8 @@ class RemoteDBHandler(AbstractResultHandler):
         Args:
             test (object): test item instance.
         """
-        self.client.stop_test(test)
+        self.reporter.report(
+            self.client.create_event(STOP_TEST_EVENT, test))
 
     def start_composite(self, test):
         """Update the remote test data to 'in progress' and set the start time.
@@ -79,7 +104,8 @@ class RemoteDBHandler(AbstractResultHandler):
         Args:
             test (rotest.core.suite.TestSuite): test item instance.
         """
-        self.client.start_composite(test)
+        self.reporter.report(
+            self.client.create_event(START_COMPOSITE_EVENT, test))
 
     def stop_composite(self, test):
         """Save the remote composite test's data.
@@ -87,7 +113,8 @@ class RemoteDBHandler(AbstractResultHandler):
         Args:
             test (rotest.core.suite.TestSuite): test item instance.
         """
-        self.client.stop_composite(test)
+        self.reporter.report(
+            self.client.create_event(STOP_COMPOSITE_EVENT, test))
 
     def add_success(self, test):
         """Save the remote test data result as success.
@@ -95,7 +122,8 @@ class RemoteDBHandler(AbstractResultHandler):
         Args:
             test (object): test item instance.
         """
-        self.client.add_result(test, TestOutcome.SUCCESS)
+        self.reporter.report(
+            self.client.create_result_event(test, TestOutcome.SUCCESS))
 
     def add_info(self, test, msg):
         """Called when a test registers a success message.
@@ -104,7 +132,8 @@ class RemoteDBHandler(AbstractResultHandler):
             test (rotest.core.abstract_test.AbstractTest): test item instance.
             msg (str): success message.
         """
-        self.client.add_result(test, TestOutcome.SUCCESS, msg)
+        self.reporter.report(
+            self.client.create_result_event(test, TestOutcome.SUCCESS, msg))
 
     def add_skip(self, test, reason):
         """Save the remote test data result as skip.
@@ -113,7 +142,9 @@ class RemoteDBHandler(AbstractResultHandler):
             test (object): test item instance.
             reason (str): skip reason description.
         """
-        self.client.add_result(test, TestOutcome.SKIPPED, reason)
+        self.reporter.report(
+            self.client.create_result_event(test, TestOutcome.SKIPPED,
+                                            reason))
 
     def add_failure(self, test, exception_str):
         """Save the remote test data result as failure.
@@ -122,8 +153,9 @@ class RemoteDBHandler(AbstractResultHandler):
             test (object): test item instance.
             exception_str (str): exception traceback string.
         """
-        self.client.add_result(test, TestOutcome.FAILED,
-                               exception_str)
+        self.reporter.report(
+            self.client.create_result_event(test, TestOutcome.FAILED,
+                                            exception_str))
 
     def add_error(self, test, exception_str):
         """Save the remote test data result as error.
@@ -132,8 +164,9 @@ class RemoteDBHandler(AbstractResultHandler):
             test (object): test item instance.
             exception_str (str): exception traceback string.
         """
-        self.client.add_result(test, TestOutcome.ERROR,
-                               exception_str)
+        self.reporter.report(
+            self.client.create_result_event(test, TestOutcome.ERROR,
+                                            exception_str))
 
     def add_expected_failure(self, test, exception_str):
         """Save the remote test data result as expected failure.
@@ -142,8 +175,9 @@ class RemoteDBHandler(AbstractResultHandler):
             test (object): test item instance.
             exception_str (str): exception traceback string.
         """
-        self.client.add_result(test, TestOutcome.EXPECTED_FAILURE,
-                               exception_str)
+        self.reporter.report(
+            self.client.create_result_event(test, TestOutcome.EXPECTED_FAILURE,
+                                            exception_str))
 
     def add_unexpected_success(self, test):
         """Save the remote test data result as unexpected success.
@@ -151,4 +185,6 @@ class RemoteDBHandler(AbstractResultHandler):
         Args:
             test (object): test item instance.
         """
-        self.client.add_result(test, TestOutcome.UNEXPECTED_SUCCESS)
+        self.reporter.report(
+            self.client.create_result_event(test,
+                                            TestOutcome.UNEXPECTED_SUCCESS))
@@ -1,6 +1,14 @@
 """Known issues result handler."""
+# pylint: disable=broad-except
 from __future__ import absolute_import
 
+import threading
+from collections import OrderedDict
+
+from six.moves import queue
+
+from rotest.common import core_log
+from rotest.core.models.signature import SignatureData
 from rotest.core.result.monitor.monitor import skip_if_not_main
 from rotest.core.result.handlers.stream.base_handler import BaseStreamHandler
 from rotest.management.client.signatures_client import ClientSignatureManager
@@ -11,15 +19,60 @@ class SignatureHandler(BaseStreamHandler):
 
     Matches the tests' exceptions with a given pattern,
     and reports it to the user.
+
+    The signatures are resolved by a background thread while the tests
+    finish, and are cached by the normalized errors, so errors that repeat
+    in the run are sent to the server only once. The thread takes all the
+    errors pending at once and resolves them in a single request. Each test
+    waits for the batch holding its errors when it stops, so the signatures
+    are still written to the test's log.
+
+    Attributes:
+        encounters (list): descriptions of the issues met in the run.
+        signatures (dict): ids and links of the resolved signatures, by the
+            fingerprints of their errors.
+        pending_tests (dict): events of the errors that weren't resolved
+            yet, by the identifiers of their tests.
     """
     NAME = 'signature'
 
+    NEW_ISSUE_PATTERN = "Encountered new issue. Assigned ID={}"
+    KNOWN_ISSUE_PATTERN = "Encountered known issue ID={}, link={}"
+
+    MAX_BATCH_SIZE = 100
+
+    _STOP = None
+
     def __init__(self, *args, **kwargs):
         """Initialize the signature handler and connect to the server."""
         super(SignatureHandler, self).__init__(*args, **kwargs)
         self.client = ClientSignatureManager()
         self.client.connect()
         self.encounters = []
+        self.signatures = {}
+        self.pending_tests = {}
+        self.pending_errors = queue.Queue()
+        self.resolving_thread = threading.Thread(target=self._resolve_loop)
+        self.resolving_thread.daemon = True
+        self.resolving_thread.start()
+
+    def _report_encounter(self, test_item, is_new, signature_id, link):
+        """Report the issue the test encountered.
+
+        Args:
+            test_item (AbstractTest): test item instance.
+            is_new (bool): whether the signature was created for the error.
+            signature_id (number): id of the signature.
+            link (str): link to the issue of the signature.
+        """
+        if is_new:
+            encounter = self.NEW_ISSUE_PATTERN.format(signature_id)
+
+        else:
+            encounter = self.KNOWN_ISSUE_PATTERN.format(signature_id, link)
+
+        self.encounters.append(encounter)
+        test_item.logger.warning(encounter)
 
     def handle_response(self, test_item, response_data):
         """Handle signature match response.
@@ -28,16 +81,108 @@ class SignatureHandler(BaseStreamHandler):
             test_item (AbstractTest): test item instance.
             response_data (SignatureResponse): signature match response.
         """
-        if response_data.is_new:
-            encounter = "Encountered new issue. Assigned ID={}".format(
-                                                            response_data.id)
+        self._report_encounter(test_item, response_data.is_new,
+                               response_data.id, response_data.link)
+
+    def _collect_batch(self):
+        """Wait for pending errors and take all the ones that are queued.
+
+        Returns:
+            tuple. list of the pending errors, and whether the handler was
+            asked to stop.
+        """
+        batch = []
+        pending_error = self.pending_errors.get()
+        while pending_error is not self._STOP:
+            batch.append(pending_error)
+            if len(batch) >= self.MAX_BATCH_SIZE:
+                return batch, False
+
+            try:
+                pending_error = self.pending_errors.get_nowait()
+
+            except queue.Empty:
+                return batch, False
+
+        return batch, True
+
+    def _resolve_batch(self, batch):
+        """Get the signatures of the errors, from the cache or the server.
+
+        The errors that aren't in the cache are sent in a single request,
+        each of them once.
+
+        Args:
+            batch (list): the pending errors, tuples of the test, the
+                exception traceback string, its fingerprint and the event to
+                set when it's resolved.
+        """
+        unknown_errors = OrderedDict()
+        for _, exception_str, fingerprint, _ in batch:
+            if fingerprint not in self.signatures:
+                unknown_errors.setdefault(fingerprint, exception_str)
+
+        new_signatures = set()
+        if len(unknown_errors) > 0:
+            responses = self.client.get_or_create_signatures(
+                                                list(unknown_errors.values()))
+            for fingerprint, response in zip(unknown_errors, responses):
+                self.signatures[fingerprint] = (response["id"],
+                                                response["link"])
+                if response["is_new"]:
+                    new_signatures.add(fingerprint)
+
+        for test, _, fingerprint, _ in batch:
+            is_new = fingerprint in new_signatures
+            new_signatures.discard(fingerprint)
+            self._report_encounter(test, is_new, *self.signatures[fingerprint])
+
+    def _resolve_loop(self):
+        """Resolve batches of pending errors until the handler is stopped."""
+        should_stop = False
+        while not should_stop:
+            batch, should_stop = self._collect_batch()
+            if len(batch) == 0:
+                continue
+
+            try:
+                self._resolve_batch(batch)
+
+            except Exception:
+                core_log.exception("Failed resolving the signatures of %d "
+                                   "errors", len(batch))
+
+            finally:
+                for pending_error in batch:
+                    pending_error[-1].set()
+
+    def _check_signature(self, test, exception_str):
+        """Report the signature of the error, resolving it if it's unknown.
+
+        Args:
+            test (AbstractTest): test item instance.
+            exception_str (str): exception traceback string.
+        """
+        fingerprint = SignatureData.create_fingerprint(exception_str)
+        if fingerprint in self.signatures:
+            self._report_encounter(test, False,
+                                   *self.signatures[fingerprint])
 
         else:
-            encounter = "Encountered known issue ID={}, link={}".format(
-                                        response_data.id, response_data.link)
+            resolved_event = threading.Event()
+            self.pending_tests.setdefault(test.identifier,
+                                          []).append(resolved_event)
+            self.pending_errors.put((test, exception_str, fingerprint,
+                                     resolved_event))
 
-        self.encounters.append(encounter)
-        test_item.logger.warning(encounter)
+    def _wait_for_signatures(self):
+        """Wait for all the pending errors to be resolved."""
+        if self.resolving_thread is None:
+            return
+
+        self.pending_errors.put(self._STOP)
+        self.resolving_thread.join()
+        self.resolving_thread = None
 
     @skip_if_not_main
     def add_error(self, test, exception_str):
@@ -47,8 +192,7 @@ class SignatureHandler(BaseStreamHandler):
             test (AbstractTest): test item instance.
             exception_str (str): exception traceback string.
         """
-        response = self.client.get_or_create_signature(exception_str)
-        self.handle_response(test, response)
+        self._check_signature(test, exception_str)
 
     @skip_if_not_main
     def add_failure(self, test, exception_str):
@@ -58,11 +202,24 @@ class SignatureHandler(BaseStreamHandler):
             test (AbstractTest): test item instance.
             exception_str (str): exception traceback string.
         """
-        response = self.client.get_or_create_signature(exception_str)
-        self.handle_response(test, response)
+        self._check_signature(test, exception_str)
+
+    def stop_test(self, test):
+        """Wait for the batch holding the test's errors to be resolved.
+
+        Args:
+            test (AbstractTest): test item instance.
+        """
+        for resolved_event in self.pending_tests.pop(test.identifier, ()):
+            resolved_event.wait()
+
+    def stop_test_run(self):
+        """Wait for the signatures of the run's errors to be resolved."""
+        self._wait_for_signatures()
 
     def print_errors(self, *_args):
         """Called by TestRunner after test run."""
+        self._wait_for_signatures()
         self.stream.writeln("Signatures summary:")
         for encounter in self.encounters:
             self.stream.writeln('\t' + encounter)
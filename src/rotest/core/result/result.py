@@ -2,17 +2,48 @@
 # pylint: disable=invalid-name,too-few-public-methods,arguments-differ
 # pylint: disable=too-many-arguments,dangerous-default-value
 from __future__ import absolute_import
+from functools import wraps
+from threading import RLock
 from unittest.result import TestResult
-import pkg_resources
 
 from rotest.common import core_log
+from rotest.common.entry_points import get_entry_points, load_entry_points
+from rotest.common.log import flush_logs, release_test_logger
 from rotest.core.models.case_data import TestOutcome
 
 
+RESULT_HANDLERS_GROUP = "rotest.result_handlers"
+
+
+def get_result_handler_names():
+    """Return the names of the result handlers, without importing them.
+
+    Returns:
+        list: the names of the registered result handlers.
+    """
+    return list(get_entry_points(RESULT_HANDLERS_GROUP))
+
+
 def get_result_handlers():
-    return {entry_point.name: entry_point.load()
-            for entry_point in
-            pkg_resources.iter_entry_points("rotest.result_handlers")}
+    """Return the result handlers' classes, importing them on first call.
+
+    Returns:
+        dict: the registered result handlers' classes, by their names.
+    """
+    return load_entry_points(RESULT_HANDLERS_GROUP)
+
+
+def synchronized(method):
+    """Serialize the calls to the decorated method of the result.
+
+    Blocks of parallel flows report their events from different threads.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:  # pylint: disable=protected-access
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Result(TestResult):
@@ -35,6 +66,7 @@ class Result(TestResult):
 
         self.stream = stream
         self.main_test = main_test
+        self._lock = RLock()
 
         all_result_handlers = get_result_handlers()
 
@@ -55,6 +87,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.start_test_run()
 
+    @synchronized
     def startTest(self, test):
         """Called when the given test is about to be run.
 
@@ -70,6 +103,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.start_test(test)
 
+    @synchronized
     def setupFinished(self, test):
         """Called when the given test finished setting up.
 
@@ -80,6 +114,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.setup_finished(test)
 
+    @synchronized
     def startTeardown(self, test):
         """Called when the given test is starting its teardown.
 
@@ -90,6 +125,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.start_teardown(test)
 
+    @synchronized
     def shouldSkip(self, test):
         """Check if the test should be skipped.
 
@@ -111,6 +147,7 @@ class Result(TestResult):
 
         return None
 
+    @synchronized
     def updateResources(self, test):
         """Called once after locking the tests resources.
 
@@ -121,6 +158,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.update_resources(test)
 
+    @synchronized
     def stopTest(self, test):
         """Called when the given test has been run.
 
@@ -140,13 +178,11 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.stop_test(test)
 
-        # In order to avoid having too many open files we close the log file
-        # handlers at the end of each test.
-        handlers = test.logger.handlers[:]
-        for handler in handlers:
-            handler.close()
-            test.logger.removeHandler(handler)
+        # In order to avoid having too many open files and loggers we release
+        # the test's logger at the end of each test.
+        release_test_logger(test.logger)
 
+    @synchronized
     def startComposite(self, test):
         """Called when the given TestSuite is about to be run.
 
@@ -163,6 +199,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.start_composite(test)
 
+    @synchronized
     def stopComposite(self, test):
         """Called when the given TestSuite has been run.
 
@@ -185,15 +222,20 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.stop_composite(test)
 
+        if "logger" in vars(test):
+            release_test_logger(test.logger)
+
     def stopTestRun(self):
         """Called once after all tests are executed."""
         super(Result, self).stopTestRun()
 
         core_log.info("Test run has finished")
+        flush_logs()
 
         for result_handler in self.result_handlers:
             result_handler.stop_test_run()
 
+    @synchronized
     def addSuccess(self, test):
         """Called when a test has completed successfully.
 
@@ -214,6 +256,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.add_success(test)
 
+    @synchronized
     def addInfo(self, test, msg=None):
         """Called when a test registers a success message.
 
@@ -228,6 +271,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.add_info(test, msg)
 
+    @synchronized
     def addSkip(self, test, reason):
         """Called when a test is skipped.
 
@@ -244,6 +288,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.add_skip(test, reason)
 
+    @synchronized
     def addFailure(self, test, err):
         """Called when an error has occurred.
 
@@ -262,6 +307,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.add_failure(test, exception_string)
 
+    @synchronized
     def addError(self, test, err):
         """Called when an error has occurred.
 
@@ -280,6 +326,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.add_error(test, exception_string)
 
+    @synchronized
     def addExpectedFailure(self, test, err):
         """Called when an expected failure/error occurred.
 
@@ -300,6 +347,7 @@ class Result(TestResult):
         for result_handler in self.result_handlers:
             result_handler.add_expected_failure(test, exception_string)
 
+    @synchronized
     def addUnexpectedSuccess(self, test):
         """Called when a test was expected to fail, but succeed.
 
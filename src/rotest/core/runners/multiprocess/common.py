@@ -6,9 +6,13 @@ import os
 import psutil
 
 from rotest.common import core_log
+from rotest.management.common.parsers import CompactParser
 
 
 PROCESS_TERMINATION_TIMEOUT = 10
+# Parser of the messages between the workers and the manager, both sides run
+# the same version of Rotest, so the compact format can be used.
+MESSAGES_PARSER = CompactParser
 
 
 class WrappedException(Exception):
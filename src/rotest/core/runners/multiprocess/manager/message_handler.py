@@ -8,21 +8,19 @@ from future.builtins import object
 from rotest.common import core_log
 from rotest.core.models.case_data import TestOutcome
 from rotest.core.models.general_data import GeneralData
-from rotest.management.common.parsers import DEFAULT_PARSER
-from rotest.core.runners.multiprocess.common import (WrappedException,
+from rotest.core.runners.multiprocess.common import (MESSAGES_PARSER,
+                                                     WrappedException,
                                                      get_item_by_id)
 from rotest.management.common.messages import (AddInfo,
                                                StopTest,
                                                StartTest,
                                                AddResult,
-                                               ShouldSkip,
                                                RunFinished,
                                                SetupFinished,
                                                StartTeardown,
                                                StopComposite,
                                                StartComposite,
-                                               CloneResources,
-                                               ShouldSkipReply)
+                                               CloneResources)
 
 
 class RunnerMessageHandler(object):
@@ -47,7 +45,7 @@ class RunnerMessageHandler(object):
         """
         self.result = result
         self.main_test = main_test
-        self.decoder = DEFAULT_PARSER()
+        self.decoder = MESSAGES_PARSER()
         self.runner = multiprocess_runner
 
         self.result_event_handlers = {
@@ -63,7 +61,6 @@ class RunnerMessageHandler(object):
             AddResult: self._handle_end_message,
             StopTest: self._handle_stop_message,
             StartTest: self._handle_start_message,
-            ShouldSkip: self._handle_should_skip_message,
             SetupFinished: self._handle_setup_finished_message,
             StartTeardown: self._handle_start_teardown_message,
             StopComposite: self._handle_composite_stop_message,
@@ -150,19 +147,6 @@ class RunnerMessageHandler(object):
         self._update_parent_start(test)
         self.result.startComposite(test)
 
-    def _handle_should_skip_message(self, test, message):
-        """Handle ShouldSkip of a worker.
-
-        Args:
-            test (object): test item to update.
-            message (ShouldSkip): worker message object.
-        """
-        reply = self.decoder.encode(ShouldSkipReply(msg_id=message.msg_id,
-                                    request_id=message.msg_id,
-                                    should_skip=self.result.shouldSkip(test)))
-
-        self.runner.workers_pool[message.msg_id].reply_queue.put(reply)
-
     def _handle_update_resources_message(self, test, message):
         """Handle UpdateResources of a worker.
 
@@ -49,6 +49,8 @@ class MultiprocessRunner(BaseTestRunner):
             jobs to all workers processes from the main runner process.
         results_queue (multiprocessing.Queue): queue object used to transfer
             jobs results from all workers processes to the main runner process.
+        skip_reasons (dict): maps the identifiers of the tests that should be
+            skipped to their skip reasons, shared with all the workers.
         message_handlers (dict): converts from a message class to its handler.
         result_event_handlers (dict): converts from outcome codes to the
             result's event handler.
@@ -74,6 +76,7 @@ class MultiprocessRunner(BaseTestRunner):
                                                  *args, **kwargs)
         self.workers_pool = {}
 
+        self.skip_reasons = {}
         self.results_queue = None
         self.requests_queue = None
         self.message_handler = None
@@ -106,6 +109,41 @@ class MultiprocessRunner(BaseTestRunner):
         elif isinstance(test_item, (TestCase, TestFlow)):
             self.requests_queue.put(test_item.identifier)
 
+    @staticmethod
+    def create_work_dirs(test_item):
+        """Create the work directory of the run before forking the workers.
+
+        The work directory of the main test gets a unique name only when
+        it's created, so the manager creates it for all the workers.
+        The sub tests' work directories are named by their place in the
+        tree, so each worker creates the ones of its tests when they are
+        first used.
+
+        Args:
+            test_item (object): main test object.
+        """
+        core_log.debug('Creating the work directory of %r', test_item.data)
+        getattr(test_item, 'work_dir')
+
+    def collect_skip_reasons(self, test_item):
+        """Decide which of the test jobs should be skipped.
+
+        Goes over the test item's sub tests recursively and queries the
+        result handlers once for each test that would be queued as a job,
+        so the workers won't have to query the manager during the run.
+
+        Args:
+            test_item (object): test object.
+        """
+        if isinstance(test_item, TestSuite):
+            for sub_test in test_item:
+                self.collect_skip_reasons(sub_test)
+
+        elif isinstance(test_item, (TestCase, TestFlow)):
+            skip_reason = self.result.shouldSkip(test_item)
+            if skip_reason is not None:
+                self.skip_reasons[test_item.identifier] = skip_reason
+
     @staticmethod
     def create_resource_manager():
         """Suppress creating resource manager so each test would create one.
@@ -127,6 +165,7 @@ class MultiprocessRunner(BaseTestRunner):
                                skip_init=self.skip_init,
                                save_state=self.save_state,
                                output_handlers=self.monitors,
+                               skip_reasons=self.skip_reasons,
                                results_queue=self.results_queue,
                                requests_queue=self.requests_queue)
 
@@ -294,6 +333,7 @@ class MultiprocessRunner(BaseTestRunner):
     def execute(self, test_item):
         """Execute the given test item.
 
+        * Creates the work directory of the run.
         * Starts the main test.
         * Queues sub cases identifiers into the request queue.
         * Waits on the results queue for test results while
@@ -306,6 +346,8 @@ class MultiprocessRunner(BaseTestRunner):
         Returns:
             RunData. test run data.
         """
+        self.create_work_dirs(self.test_item)
+
         result = self._makeResult()
 
         self.message_handler = RunnerMessageHandler(result=result,
@@ -313,6 +355,11 @@ class MultiprocessRunner(BaseTestRunner):
                                                     multiprocess_runner=self)
         result.startTestRun()
 
+        core_log.debug('Deciding which of %r tests should be skipped',
+                       self.test_item.data.name)
+        self.skip_reasons = {}
+        self.collect_skip_reasons(self.test_item)
+
         core_log.debug('Queuing %r tests jobs', self.test_item.data.name)
         self.queue_test_jobs(self.test_item)
 
@@ -48,11 +48,14 @@ class WorkerProcess(Process):
         start_time (datetime.datetime): the start time of the current test.
         skip_init (bool): True to skip resources initialization and validation.
         output_handlers (list): output handlers for the worker's runner.
+        skip_reasons (dict): maps the identifiers of the tests that should be
+            skipped to their skip reasons, as decided by the main runner.
     """
 
     def __init__(self, save_state, config, run_delta, run_name, requests_queue,
                  reply_queue, results_queue, root_test, failfast, parent_id,
-                 skip_init, output_handlers, *args, **kwargs):
+                 skip_init, output_handlers, skip_reasons=None,
+                 *args, **kwargs):
 
         core_log.debug('Initializing test worker')
         super(WorkerProcess, self).__init__()
@@ -68,6 +71,7 @@ class WorkerProcess(Process):
         self.reply_queue = reply_queue
         self.results_queue = results_queue
         self.requests_queue = requests_queue
+        self.skip_reasons = skip_reasons
         self.output_handlers = output_handlers
 
         self.config = config
@@ -128,6 +132,7 @@ class WorkerProcess(Process):
                               save_state=self.save_state,
                               outputs=self.output_handlers,
                               reply_queue=self.reply_queue,
+                              skip_reasons=self.skip_reasons,
                               results_queue=self.results_queue)
 
         runner.resource_manager = self.resource_manager
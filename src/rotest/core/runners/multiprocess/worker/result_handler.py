@@ -7,13 +7,12 @@ import time
 from future.utils import iteritems
 
 from rotest.core.models.case_data import TestOutcome
-from rotest.management.common.parsers import DEFAULT_PARSER
+from rotest.core.runners.multiprocess.common import MESSAGES_PARSER
 from rotest.core.result.handlers.abstract_handler import AbstractResultHandler
 from rotest.management.common.messages import (AddInfo,
                                                StopTest,
                                                AddResult,
                                                StartTest,
-                                               ShouldSkip,
                                                RunFinished,
                                                SetupFinished,
                                                StartTeardown,
@@ -30,12 +29,15 @@ class WorkerHandler(AbstractResultHandler):
             jobs results from all workers processes to the main runner process.
         reply_queue (multiprocessing.Queue): queue object used to transfer
             data from the main runner to this specific worker.
+        skip_reasons (dict): maps the identifiers of the tests that should be
+            skipped to their skip reasons, as decided by the main runner.
 
         REPLY_TIMEOUT (number): maximal time to wait for the manager replies.
     """
     REPLY_TIMEOUT = 60  # seconds
 
-    def __init__(self, reply_queue, results_queue, *args, **kwargs):
+    def __init__(self, reply_queue, results_queue, skip_reasons=None,
+                 *args, **kwargs):
         """Initialize result handler and save the result queue.
 
         Args:
@@ -43,13 +45,20 @@ class WorkerHandler(AbstractResultHandler):
                 transfer test events to the main runner process.
             reply_queue (multiprocessing.Queue): queue object used to transfer
                 data from the main runner to this specific worker.
+            skip_reasons (dict): maps the identifiers of the tests that
+                should be skipped to their skip reasons.
         """
         super(WorkerHandler, self).__init__()
-        self.parser = DEFAULT_PARSER()
+        self.parser = MESSAGES_PARSER()
         self.worker_pid = os.getpid()
         self.reply_queue = reply_queue
         self.results_queue = results_queue
 
+        if skip_reasons is None:
+            skip_reasons = {}
+
+        self.skip_reasons = skip_reasons
+
     def send_message(self, message):
         """Put a message in the results queue.
 
@@ -77,16 +86,16 @@ class WorkerHandler(AbstractResultHandler):
     def should_skip(self, test):
         """Check if the test should be skipped.
 
+        The skip decisions of all the tests are made by the main runner
+        before the workers start, so no query to the manager is needed.
+
         Args:
             test (object): test item instance.
 
         Returns:
             str. skip reason if the test should be skipped, None otherwise.
         """
-        self.send_message(ShouldSkip(msg_id=self.worker_pid,
-                                     test_id=test.identifier))
-        skip_reason = self.get_message().should_skip
-        return skip_reason
+        return self.skip_reasons.get(test.identifier)
 
     def setup_finished(self, test):
         """Notify the manager about the finish of a test setup via queue."""
@@ -24,9 +24,12 @@ class WorkerRunner(BaseTestRunner):
             jobs results from all workers processes to the main runner process.
         reply_queue (multiprocessing.Queue): queue object used to transfer
             data from the main runner to this specific worker.
+        skip_reasons (dict): maps the identifiers of the tests that should be
+            skipped to their skip reasons, as decided by the main runner.
     """
     def __init__(self, save_state, config, run_delta, outputs,
-                 run_name, results_queue, reply_queue, *args, **kwargs):
+                 run_name, results_queue, reply_queue, skip_reasons=None,
+                 *args, **kwargs):
 
         super(WorkerRunner, self).__init__(save_state, config,
                                            run_delta, outputs, run_name,
@@ -36,7 +39,8 @@ class WorkerRunner(BaseTestRunner):
         self.results_queue = results_queue
 
         self.queue_handler = WorkerHandler(self.reply_queue,
-                                           self.results_queue)
+                                           self.results_queue,
+                                           skip_reasons)
 
         # Suppress stream write method
         self.stream.write = lambda *args, **kwargs: None
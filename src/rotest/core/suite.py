@@ -1,20 +1,23 @@
 """Define Rotest's TestSuite, composed from test suites or test cases."""
 # pylint: disable=method-hidden,bad-super-call,too-many-arguments
-# pylint: disable=too-many-locals
+# pylint: disable=too-many-locals,too-many-instance-attributes
 from __future__ import absolute_import
 
 import unittest
 from itertools import count, chain
 
 from future.builtins import next
+from cached_property import cached_property
 
 from rotest.common import core_log
 from rotest.core.case import TestCase
 from rotest.core.flow import TestFlow
-from rotest.common.utils import get_work_dir
 from rotest.core.result.result import Result
 from rotest.common.config import ROTEST_WORK_DIR
 from rotest.core.models.suite_data import SuiteData
+from rotest.common.utils import (create_work_dir,
+                                 get_work_dir_name,
+                                 create_sub_work_dir)
 
 
 class TestSuite(unittest.TestSuite):
@@ -53,7 +56,8 @@ class TestSuite(unittest.TestSuite):
 
         Args:
             tests (iterable): tests to add to the suite.
-            base_work_dir (str): the base directory of the tests.
+            base_work_dir (str): the base directory of the tests, or None
+                to use the parent's work directory.
             save_state (bool): flag to determine if storing the states of
                 resources is required.
             config (AttrDict): dictionary of configurations.
@@ -90,7 +94,8 @@ class TestSuite(unittest.TestSuite):
             raise AttributeError("%s: Components tuple can't be empty" % name)
 
         core_log.debug("Creating database entry for %r test-suite", name)
-        self.work_dir = get_work_dir(base_work_dir, name, self)
+        self._base_work_dir = base_work_dir
+        self._work_dir_name = get_work_dir_name(name, self)
         self.data = SuiteData(name=name, run_data=run_data)
 
         for test_component in chain(self.components, tests):
@@ -105,7 +110,7 @@ class TestSuite(unittest.TestSuite):
                                         save_state=save_state,
                                         methodName=method_name,
                                         enable_debug=enable_debug,
-                                        base_work_dir=self.work_dir,
+                                        base_work_dir=None,
                                         resource_manager=resource_manager)
 
                     core_log.debug("Adding %r to %r", test_item, self.data)
@@ -118,7 +123,7 @@ class TestSuite(unittest.TestSuite):
                                            skip_init=skip_init,
                                            save_state=save_state,
                                            enable_debug=enable_debug,
-                                           base_work_dir=self.work_dir,
+                                           base_work_dir=None,
                                            resource_manager=resource_manager)
 
                 core_log.debug("Adding %r to %r", test_item, self.data)
@@ -131,7 +136,7 @@ class TestSuite(unittest.TestSuite):
                                            skip_init=skip_init,
                                            save_state=save_state,
                                            enable_debug=enable_debug,
-                                           base_work_dir=self.work_dir,
+                                           base_work_dir=None,
                                            resource_manager=resource_manager)
 
                 core_log.debug("Adding %r to %r", test_item, self.data)
@@ -201,6 +206,22 @@ class TestSuite(unittest.TestSuite):
 
         return self.parent.parents_count + 1
 
+    @cached_property
+    def work_dir(self):
+        """Create the work directory of the suite on its first use.
+
+        The work directory of a sub suite is named by its index under its
+        parent, so each process creates the same directory for it.
+
+        Returns:
+            str. path of the suite's work directory.
+        """
+        if self._base_work_dir is None:
+            return create_sub_work_dir(self.parent.work_dir,
+                                       self._work_dir_name)
+
+        return create_work_dir(self._base_work_dir, self._work_dir_name)
+
     def start(self):
         """Update the data that the test started."""
         self.data.start()
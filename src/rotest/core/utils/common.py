@@ -36,48 +36,105 @@ def print_test_instance(test_name, depth, tag_filter, test_tags, all_tags):
     return tag_filter is not None and match_tags(all_tags, tag_filter)
 
 
-def print_test_hierarchy(test, tag_filter, tags=[], depth=0):
-    """Recursively print the test's hierarchy tree and tags.
+def get_test_hierarchy(test):
+    """Return the test's hierarchy tree and tags, as they are listed.
+
+    Tests of the discovery index aren't classes, and hold the hierarchy of
+    their class, so they can be listed without being imported.
 
     Args:
-        test (rotest.core.AbstractTest): test to print.
+        test (type): test class, or an indexed test.
+
+    Returns:
+        dict. the type, name and tags of the test, the names of a test
+            case's tests and the hierarchies of the sub tests of suites and
+            flows, or None for other classes.
+    """
+    if not isinstance(test, type):
+        return test.hierarchy
+
+    if issubclass(test, TestCase):
+        return {"type": "case",
+                "tags": list(test.TAGS),
+                "names": [test.get_name(method_name)
+                          for method_name in test.load_test_method_names()]}
+
+    if issubclass(test, TestBlock):
+        return {"type": "block",
+                "name": test.get_name()}
+
+    if issubclass(test, TestSuite):
+        sub_tests = test.components
+
+    elif issubclass(test, TestFlow):
+        sub_tests = test.blocks
+
+    else:
+        return None
+
+    return {"type": "suite" if issubclass(test, TestSuite) else "flow",
+            "name": test.get_name(),
+            "class_name": test.__name__,
+            "tags": list(test.TAGS),
+            "sub_tests": [get_test_hierarchy(sub_test)
+                          for sub_test in sub_tests]}
+
+
+def print_hierarchy(hierarchy, tag_filter, tags=[], depth=0):
+    """Recursively print a hierarchy tree of :func:`get_test_hierarchy`.
+
+    Args:
+        hierarchy (dict): hierarchy of the test to print.
         tag_filter (str): boolean expression composed of tags and boolean
             operators, e.g. "Tag1 and (Tag2 or Tag3 or Tag3)".
         tags (list): tags list to be verified against the tag_filter,
             e.g. ["Tag1", "Tag2"].
         depth (number): depth of the current test in the tree.
     """
+    if hierarchy is None:
+        return
+
     tags = tags[:]
 
-    actual_test = test
-    if issubclass(actual_test, TestCase):
-        tags.extend(test.TAGS)
-        for method_name in test.load_test_method_names():
-            test_name = test.get_name(method_name)
+    if hierarchy["type"] == "case":
+        tags.extend(hierarchy["tags"])
+        for test_name in hierarchy["names"]:
             method_tags = tags + test_name.split(".")
             print_test_instance(test_name, depth, tag_filter,
-                                test.TAGS, method_tags)
+                                hierarchy["tags"], method_tags)
 
-    elif issubclass(actual_test, TestBlock):
-        print_test_instance(test.get_name(), depth, tag_filter, [], tags)
+    elif hierarchy["type"] == "block":
+        print_test_instance(hierarchy["name"], depth, tag_filter, [], tags)
 
-    elif issubclass(actual_test, TestSuite):
-        tags.extend(actual_test.TAGS)
-        tags.append(actual_test.__name__)
-        sub_tests = test.components
-        print(HIERARCHY_SEPARATOR * depth, test.get_name(), test.TAGS)
-        for sub_test in sub_tests:
-            print_test_hierarchy(sub_test, tag_filter, tags, depth + 1)
-
-    elif issubclass(actual_test, TestFlow):
-        tags.extend(actual_test.TAGS)
-        tags.append(actual_test.__name__)
-        test_name = test.get_name()
-        is_colored = print_test_instance(test_name, depth, tag_filter,
-                                         actual_test.TAGS, tags)
-
-        sub_tests = actual_test.blocks
-        for sub_test in sub_tests:
-            print_test_hierarchy(sub_test,
-                                 PASS_ALL_FILTER if is_colored else None,
-                                 tags, depth + 1)
+    elif hierarchy["type"] == "suite":
+        tags.extend(hierarchy["tags"])
+        tags.append(hierarchy["class_name"])
+        print(HIERARCHY_SEPARATOR * depth, hierarchy["name"],
+              hierarchy["tags"])
+        for sub_hierarchy in hierarchy["sub_tests"]:
+            print_hierarchy(sub_hierarchy, tag_filter, tags, depth + 1)
+
+    elif hierarchy["type"] == "flow":
+        tags.extend(hierarchy["tags"])
+        tags.append(hierarchy["class_name"])
+        is_colored = print_test_instance(hierarchy["name"], depth, tag_filter,
+                                         hierarchy["tags"], tags)
+
+        for sub_hierarchy in hierarchy["sub_tests"]:
+            print_hierarchy(sub_hierarchy,
+                            PASS_ALL_FILTER if is_colored else None,
+                            tags, depth + 1)
+
+
+def print_test_hierarchy(test, tag_filter, tags=[], depth=0):
+    """Recursively print the test's hierarchy tree and tags.
+
+    Args:
+        test (rotest.core.AbstractTest): test to print.
+        tag_filter (str): boolean expression composed of tags and boolean
+            operators, e.g. "Tag1 and (Tag2 or Tag3 or Tag3)".
+        tags (list): tags list to be verified against the tag_filter,
+            e.g. ["Tag1", "Tag2"].
+        depth (number): depth of the current test in the tree.
+    """
+    print_hierarchy(get_test_hierarchy(test), tag_filter, tags, depth)
@@ -0,0 +1,180 @@
+"""Compiled index of the signatures, for matching errors with them quickly."""
+from __future__ import absolute_import
+
+import re
+try:
+    # The regular expressions parser was made private in Python 3.11
+    from re import _parser as sre_parse
+
+except ImportError:
+    import sre_parse
+
+import threading
+from collections import Counter, defaultdict
+
+import six
+from future.builtins import object, range
+from django.db.models import Count, Max
+
+from rotest.core.models import SignatureData
+
+
+TRIGRAM_LENGTH = 3
+
+
+def get_required_literal(pattern):
+    """Return the longest literal that every match of the pattern contains.
+
+    Only literals that appear at the top level of the pattern are taken into
+    account, since they can't be skipped by a match.
+
+    Args:
+        pattern (str): regular expression pattern.
+
+    Returns:
+        str. the longest required literal, or an empty string if there is
+            none.
+    """
+    longest_literal = current_literal = ""
+    for operation, value in sre_parse.parse(pattern, re.MULTILINE):
+        if operation == sre_parse.LITERAL:
+            current_literal += six.unichr(value)
+            continue
+
+        longest_literal = max(longest_literal, current_literal, key=len)
+        current_literal = ""
+
+    return max(longest_literal, current_literal, key=len)
+
+
+def get_trigrams(text):
+    """Return all the substrings of the text in the length of a trigram.
+
+    Args:
+        text (str): text to split.
+
+    Returns:
+        set. the trigrams of the text.
+    """
+    return {text[index:index + TRIGRAM_LENGTH]
+            for index in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+
+class SignatureIndex(object):
+    """Compiled signatures with a trigram prefilter.
+
+    The patterns are compiled once and indexed by a rare trigram of the
+    longest literal each of them requires, so matching an error evaluates
+    only the patterns whose literal appears in it. Patterns without such a
+    literal are always evaluated.
+
+    The index is rebuilt when the signatures in the DB change in number, in
+    their latest id or in their latest modification time, so signatures
+    created, edited or deleted by other processes (e.g. in the admin) are
+    noticed too. Only the signatures' ids are kept, and the matching
+    signature is fetched from the DB, so its details are always current.
+
+    Attributes:
+        version (tuple): the count, the latest id and the latest
+            modification time of the signatures the index was built from,
+            or None if the index wasn't built yet.
+        entries (list): tuples of a signature's id, its compiled pattern and
+            its required literal, by the signatures' order.
+        trigram_to_entries (dict): indices of the entries, by the trigram
+            chosen for each of them.
+        unfiltered_entries (list): indices of the entries that have no
+            required literal long enough to be indexed.
+    """
+    def __init__(self):
+        self.version = None
+        self.entries = []
+        self.trigram_to_entries = {}
+        self.unfiltered_entries = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _get_db_version():
+        """Return a summary of the signatures that changes with any edit.
+
+        Returns:
+            tuple. the count, the latest id and the latest modification time
+                of the signatures in the DB.
+        """
+        summary = SignatureData.objects.aggregate(count=Count("id"),
+                                                  latest=Max("id"),
+                                                  modified=Max("modified"))
+        return summary["count"], summary["latest"], summary["modified"]
+
+    def _build(self, version):
+        """Compile and index all the signatures.
+
+        Args:
+            version (tuple): the summary of the signatures in the DB.
+        """
+        entries = []
+        for signature_id, pattern in SignatureData.objects.order_by(
+                "id").values_list("id", "pattern"):
+
+            compiled_pattern = re.compile(pattern, re.MULTILINE)
+            literal = ""
+            if not compiled_pattern.flags & re.IGNORECASE:
+                literal = get_required_literal(pattern)
+
+            entries.append((signature_id, compiled_pattern, literal))
+
+        entries_trigrams = [get_trigrams(literal)
+                            for _, _, literal in entries]
+        trigram_frequency = Counter()
+        for trigrams in entries_trigrams:
+            trigram_frequency.update(trigrams)
+
+        trigram_to_entries = defaultdict(list)
+        unfiltered_entries = []
+        for index, trigrams in enumerate(entries_trigrams):
+            if len(trigrams) == 0:
+                unfiltered_entries.append(index)
+                continue
+
+            rarest_trigram = min(sorted(trigrams),
+                                 key=trigram_frequency.__getitem__)
+            trigram_to_entries[rarest_trigram].append(index)
+
+        self.entries = entries
+        self.trigram_to_entries = dict(trigram_to_entries)
+        self.unfiltered_entries = unfiltered_entries
+        self.version = version
+
+    def match(self, error_str):
+        """Return the first signature that matches the error.
+
+        Args:
+            error_str (str): exception traceback string.
+
+        Returns:
+            SignatureData. the signature of the given exception, or None if
+                no signature matches it.
+        """
+        version = self._get_db_version()
+        with self.lock:
+            if self.version != version:
+                self._build(version)
+
+            entries = self.entries
+            candidates = set(self.unfiltered_entries)
+            for trigram in get_trigrams(error_str):
+                candidates.update(self.trigram_to_entries.get(trigram, ()))
+
+        for index in sorted(candidates):
+            signature_id, compiled_pattern, literal = entries[index]
+            if literal in error_str and compiled_pattern.match(error_str):
+                signature = SignatureData.objects.filter(
+                                                    id=signature_id).first()
+                # The signature may have been deleted since the index was
+                # built
+                if signature is not None:
+                    return signature
+
+        return None
+
+
+SIGNATURE_INDEX = SignatureIndex()
@@ -1,35 +1,152 @@
 """Module for statistics collection on tests."""
 from __future__ import absolute_import
+
+import json
 from statistics import mean, median, pstdev
 
-from rotest.core.models import CaseData
+from django.db import transaction
+from django.db.models import F
+
+from rotest.core.models.case_data import TestOutcome
+from rotest.core.models import CaseData, StatisticsData
 
 
 CUT_OFF_FACTOR = 1.5
+QUERY_CHUNK_SIZE = 500
 
 
-def collect_durations(test_name, max_size=300):
-    """Return re durations of successful runs tests with the given name.
+def query_durations(test_name, max_size=StatisticsData.WINDOW_SIZE):
+    """Return durations of successful runs of the test from its history.
 
     Args:
         test_name (str): name of the test to search, e.g. "MyTest.test_method".
         max_size (number): maximal number of tests to collect.
 
     Returns:
-        list. collected tests after filtering.
+        list. durations of the latest runs of the test, newest first.
     """
     latest_tests = CaseData.objects.filter(name=test_name,
-                                           exception_type=0,
+                                           exception_type=TestOutcome.SUCCESS,
                                            start_time__isnull=False,
-                                           end_time__isnull=False)
+                                           end_time__isnull=False,
+                                           end_time__gt=F('start_time'))
+
+    latest_tests = latest_tests.order_by('-id')[:max_size]
+    return [(end_time - start_time).total_seconds()
+            for start_time, end_time in
+            latest_tests.values_list('start_time', 'end_time')]
+
+
+def query_batch_durations(test_names, max_size=StatisticsData.WINDOW_SIZE):
+    """Return durations of successful runs of many tests from their history.
+
+    Each test's history is limited in the query itself, so at most
+    max_size rows are read per test, no matter how long its history is.
+
+    Args:
+        test_names (list): names of the tests to search.
+        max_size (number): maximal number of tests to collect per name.
+
+    Returns:
+        dict. test name to the durations of its latest runs, newest first.
+    """
+    return {test_name: query_durations(test_name, max_size)
+            for test_name in test_names}
+
 
-    latest_tests = latest_tests.order_by('-id')
-    durations = ((test.end_time - test.start_time).total_seconds()
-                 for test in latest_tests)
+def collect_durations(test_name, max_size=StatisticsData.WINDOW_SIZE):
+    """Return re durations of successful runs tests with the given name.
+
+    The durations are taken from the test's statistics row when possible,
+    falling back to scanning the runs history for tests with no statistics
+    yet or when asking for more samples than the statistics hold.
+
+    Args:
+        test_name (str): name of the test to search, e.g. "MyTest.test_method".
+        max_size (number): maximal number of tests to collect.
+
+    Returns:
+        list. collected tests after filtering.
+    """
+    if max_size <= StatisticsData.WINDOW_SIZE:
+        try:
+            statistics = StatisticsData.objects.get(name=test_name)
+
+        except StatisticsData.DoesNotExist:
+            pass
 
-    durations = [x for x in durations if x > 0]
+        else:
+            return statistics.get_durations()[:max_size]
 
-    return durations[:max_size]
+    return query_durations(test_name, max_size)
+
+
+def collect_batch_durations(test_names,
+                            max_size=StatisticsData.WINDOW_SIZE):
+    """Return the durations of successful runs of many tests at once.
+
+    The statistics rows of all the tests are fetched in a few bulk queries,
+    and only tests with no statistics yet fall back to a limited scan of
+    their history.
+
+    Args:
+        test_names (list): names of the tests to search.
+        max_size (number): maximal number of durations to collect per test.
+
+    Returns:
+        dict. test name to the list of its collected durations.
+    """
+    test_names = list(set(test_names))
+    durations = {}
+    if max_size <= StatisticsData.WINDOW_SIZE:
+        for index in range(0, len(test_names), QUERY_CHUNK_SIZE):
+            names_chunk = test_names[index:index + QUERY_CHUNK_SIZE]
+            for statistics in StatisticsData.objects.filter(
+                                                    name__in=names_chunk):
+
+                durations[statistics.name] = \
+                    statistics.get_durations()[:max_size]
+
+    durations.update(query_batch_durations(
+                            [test_name for test_name in test_names
+                             if test_name not in durations], max_size))
+
+    return durations
+
+
+def update_statistics(test_data):
+    """Update the statistics row of a test according to its finished data.
+
+    Only successful runs with a positive duration are recorded, matching
+    the runs that :func:`query_durations` takes into account. If the test
+    has no statistics row yet, one is created and initialized from the
+    already saved history, which includes the given test.
+
+    Args:
+        test_data (rotest.core.models.CaseData): saved data of a test
+            that has just ended.
+    """
+    if (test_data.exception_type != TestOutcome.SUCCESS or
+            test_data.start_time is None or test_data.end_time is None):
+        return
+
+    duration = (test_data.end_time - test_data.start_time).total_seconds()
+    if duration <= 0:
+        return
+
+    with transaction.atomic():
+        statistics, created = \
+            StatisticsData.objects.select_for_update().get_or_create(
+                                                        name=test_data.name)
+
+        if created:
+            statistics.durations = json.dumps(
+                query_durations(test_data.name))
+
+        else:
+            statistics.add_duration(duration)
+
+        statistics.save()
 
 
 def remove_anomalies(durations):
@@ -73,3 +190,19 @@ def clean_data(durations, min_duration_cut=0.5,
         iteration_index += 1
 
     return durations
+
+
+def summarize_durations(durations):
+    """Return the minimal, average and maximal values of the durations.
+
+    Args:
+        durations (list): non-empty list of numeric values.
+
+    Returns:
+        dict. the "min", "avg" and "max" values of the durations.
+    """
+    return {
+        "min": min(durations),
+        "avg": sum(durations) / len(durations),
+        "max": max(durations)
+    }
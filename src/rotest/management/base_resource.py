@@ -12,15 +12,16 @@ from bdb import BdbQuit
 from threading import Thread
 
 import six
-from ipdbugger import debug
 from attrdict import AttrDict
 from future.utils import iteritems
 from future.builtins import zip, object
+from cached_property import cached_property
 
 from rotest.common import core_log
 from rotest.common.config import ROTEST_WORK_DIR
 from rotest.common.utils import parse_config_file
-from rotest.common.utils import get_work_dir, get_class_fields
+from rotest.common.utils import get_class_fields, ClassFieldsMeta
+from rotest.common.utils import create_work_dir, get_work_dir_name
 from rotest.common.constants import default_config, DEFAULT_SCHEMA_PATH
 from rotest.management.models.resource_data import ResourceData, DataPointer
 
@@ -107,7 +108,7 @@ class ExceptionCatchingThread(Thread):
             raise
 
 
-class BaseResource(object):
+class BaseResource(six.with_metaclass(ClassFieldsMeta, object)):
     """Represent the common interface of all the resources.
 
     To implement a resource, you may override:
@@ -157,12 +158,9 @@ class BaseResource(object):
 
         self.config = config
         self.parent = None
-        self.work_dir = None
         self._sub_resources = None
 
         self.set_work_dir(self.name, base_work_dir)
-        self.logger.debug("Resource %r work dir was created under %r",
-                          self.name, base_work_dir)
 
         self.set_sub_resources()
 
@@ -190,7 +188,9 @@ class BaseResource(object):
             sub_class = sub_request.get_type(self.config)
             actual_kwargs = sub_request.kwargs.copy()
             actual_kwargs['config'] = self.config
-            actual_kwargs['base_work_dir'] = self.work_dir
+            # Sub resources are created under this resource's work directory
+            # when they first use theirs
+            actual_kwargs['base_work_dir'] = None
             for key, value in six.iteritems(sub_request.kwargs):
                 if isinstance(value, DataPointer):
                     actual_kwargs[key] = value.unwrap_data_pointer(self.data)
@@ -302,11 +302,32 @@ class BaseResource(object):
     def set_work_dir(self, resource_name, containing_work_dir):
         """Set the work directory under the given case's work directory.
 
+        The directory itself is created on the first use of 'work_dir'.
+
         Args:
             resource_name (str): name of resource.
-            containing_work_dir (str): root work directory.
+            containing_work_dir (str): root work directory, or None to use
+                the parent resource's work directory.
+        """
+        vars(self).pop("work_dir", None)
+        self._base_work_dir = containing_work_dir
+        self._work_dir_name = get_work_dir_name(resource_name, None)
+
+    @cached_property
+    def work_dir(self):
+        """Create the work directory of the resource on its first use.
+
+        Returns:
+            str. path of the resource's work directory.
         """
-        self.work_dir = get_work_dir(containing_work_dir, resource_name, None)
+        base_work_dir = self._base_work_dir
+        if base_work_dir is None:
+            base_work_dir = self.parent.work_dir
+
+        work_dir = create_work_dir(base_work_dir, self._work_dir_name)
+        self.logger.debug("Resource %r work dir was created under %r",
+                          self.name, base_work_dir)
+        return work_dir
 
     def store_state(self, state_dir_path):
         """Hook method for backing up the resource state.
@@ -427,6 +448,7 @@ class BaseResource(object):
 
     def enable_debug(self):
         """Wrap the resource methods with debugger."""
+        from ipdbugger import debug
         debug(self.connect, ignore_exceptions=[KeyboardInterrupt, BdbQuit])
         debug(self.initialize, ignore_exceptions=[KeyboardInterrupt, BdbQuit])
         debug(self.finalize, ignore_exceptions=[KeyboardInterrupt, BdbQuit])
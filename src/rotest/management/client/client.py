@@ -11,11 +11,14 @@ from rotest.common import core_log
 from rotest.api.request_token import RequestToken
 from rotest.api.resource_control import UpdateFields
 from rotest.api.common import UpdateFieldsParamsModel
-from rotest.api.test_control import GetTestStatistics
+from rotest.api.test_control import (GetTestStatistics,
+                                     GetBatchTestStatistics)
 from rotest.management.common.parsers import JSONParser
 from rotest.api.common.responses import FailureResponseModel
 from rotest.management.client.websocket_client import PingingWebsocket
-from rotest.api.common.models import GenericModel, StatisticsRequestModel
+from rotest.api.common.models import (GenericModel,
+                                      StatisticsRequestModel,
+                                      BatchStatisticsRequestModel)
 from rotest.management.common.resource_descriptor import ResourceDescriptor
 from rotest.common.config import (DJANGO_MANAGER_PORT,
                                   RESOURCE_REQUEST_TIMEOUT, API_BASE_URL)
@@ -158,3 +161,39 @@ class AbstractClient(object):
             raise RuntimeError(response.details)
 
         return response.body
+
+    def get_batch_statistics(self, test_names,
+                             max_sample_size=None,
+                             min_duration_cut=None,
+                             max_iterations=None,
+                             acceptable_ratio=None):
+        """Request duration statistics of many tests in a single request.
+
+        Args:
+            test_names (list): names of the tests to search,
+                e.g. ["MyTest.test_method", "MyFlow"].
+            max_sample_size (number): maximal number of tests to collect.
+            min_duration_cut (number): ignore tests under the given duration.
+            max_iterations (number): max anomalies removal iterations.
+            acceptable_ratio (number): acceptable ration between max and min
+                values, under which don't try to remove anomalies.
+
+        Returns:
+            dict. test name to a dictionary containing the min, max and avg
+                test durations. Tests with no usable history are omitted.
+        """
+        request_data = BatchStatisticsRequestModel({
+            "test_names": list(test_names),
+            "max_sample_size": max_sample_size,
+            "min_duration_cut": min_duration_cut,
+            "max_iterations": max_iterations,
+            "acceptable_ratio": acceptable_ratio})
+
+        response = self.requester.request(GetBatchTestStatistics,
+                                          data=request_data,
+                                          method="post")
+
+        if isinstance(response, FailureResponseModel):
+            raise RuntimeError(response.details)
+
+        return response.body["statistics"]
@@ -8,6 +8,8 @@ additional data about the run.
 """
 from __future__ import absolute_import
 
+import time
+
 import six
 
 from rotest.common import core_log
@@ -18,10 +20,14 @@ from rotest.management.common.resource_descriptor import ResourceDescriptor
 from rotest.management.common.utils import (TEST_ID_KEY,
                                             TEST_NAME_KEY,
                                             TEST_SUBTESTS_KEY,
-                                            TEST_CLASS_CODE_KEY)
-from rotest.api.common.models import (StartTestRunParamsModel,
+                                            ADD_RESULT_EVENT,
+                                            TEST_CLASS_CODE_KEY,
+                                            UPDATE_RESOURCES_EVENT)
+from rotest.api.common.models import (TokenModel,
+                                      StartTestRunParamsModel,
                                       UpdateRunDataParamsModel,
                                       AddTestResultParamsModel,
+                                      ReportTestEventsParamsModel,
                                       TestControlOperationParamsModel,
                                       UpdateResourcesParamsModel)
 from rotest.api.test_control import (StartTestRun,
@@ -29,10 +35,12 @@ from rotest.api.test_control import (StartTestRun,
                                      AddTestResult,
                                      StartTest,
                                      ShouldSkip,
+                                     GetPassedTests,
                                      StopTest,
                                      UpdateResources,
                                      StartComposite,
-                                     StopComposite)
+                                     StopComposite,
+                                     ReportTestEvents)
 
 
 class ClientResultManager(AbstractClient):
@@ -48,11 +56,14 @@ class ClientResultManager(AbstractClient):
         super(ClientResultManager, self).__init__(logger=logger, host=host)
 
     @classmethod
-    def _create_test_dict(cls, test_item):
+    def _create_test_dict(cls, test_item, data_classes=None):
         """Recursively create a dict representing the test's hierarchy.
 
         Args:
             test_item (TestCase / TestSuite): the top test.
+            data_classes (dict): maps the test data classes met so far to
+                their index in the run's classes table. Leave None to
+                encode each node's class inside the node itself.
 
         Returns:
             dict. a dictionary representing the tests tree.
@@ -60,11 +71,17 @@ class ClientResultManager(AbstractClient):
         test_dict = {TEST_ID_KEY: test_item.identifier,
                      TEST_NAME_KEY: test_item.data.name}
 
-        test_dict[TEST_CLASS_CODE_KEY] = cls.parser.recursive_encode(
-            type(test_item.data))
+        data_class = type(test_item.data)
+        if data_classes is None:
+            test_dict[TEST_CLASS_CODE_KEY] = \
+                cls.parser.recursive_encode(data_class)
+
+        else:
+            test_dict[TEST_CLASS_CODE_KEY] = \
+                data_classes.setdefault(data_class, len(data_classes))
 
         if test_item.IS_COMPLEX:
-            subtests = [cls._create_test_dict(sub_test)
+            subtests = [cls._create_test_dict(sub_test, data_classes)
                         for sub_test in test_item]
 
             test_dict[TEST_SUBTESTS_KEY] = subtests
@@ -74,21 +91,30 @@ class ClientResultManager(AbstractClient):
     def start_test_run(self, main_test):
         """Inform the result server of the start of the run.
 
+        The tests tree refers to the test data classes by their index in a
+        table sent alongside it, so each class is encoded only once.
+
         Args:
             main_test (TestCase / TestSuite): main test container of the run.
         """
-        tests_tree_dict = self._create_test_dict(main_test)
+        data_classes = {}
+        tests_tree_dict = self._create_test_dict(main_test, data_classes)
+        classes = [self.parser.recursive_encode(data_class)
+                   for data_class in sorted(data_classes,
+                                            key=data_classes.get)]
+
         run_data = {'run_name': main_test.data.run_data.run_name,
                     'config': main_test.data.run_data.config}
 
         request_data = StartTestRunParamsModel({
             "token": self.token,
             "tests": tests_tree_dict,
-            "run_data": run_data
+            "run_data": run_data,
+            "classes": classes
         })
 
         response = self.requester.request(StartTestRun,
-                                              data=request_data,
+                                          data=request_data,
                                           method="post")
 
         if isinstance(response, FailureResponseModel):
@@ -178,6 +204,23 @@ class ClientResultManager(AbstractClient):
 
         return response.should_skip
 
+    def get_passed_tests(self):
+        """Get the names of the tests that passed in the last run.
+
+        Returns:
+            set. names of the tests whose last run was successful.
+        """
+        response = self.requester.request(GetPassedTests,
+                                          data=TokenModel({
+                                              "token": self.token
+                                          }),
+                                          method="get")
+
+        if isinstance(response, FailureResponseModel):
+            raise RuntimeError(response.details)
+
+        return set(response.test_names)
+
     def stop_test(self, test_item):
         """Inform the result server of the end of a test.
 
@@ -195,26 +238,36 @@ class ClientResultManager(AbstractClient):
         if isinstance(response, FailureResponseModel):
             raise RuntimeError(response.details)
 
+    @classmethod
+    def _get_resources_descriptors(cls, test_item):
+        """Return the encoded descriptors of the test's locked resources.
+
+        Args:
+            test_item (rotest.core.case.TestCase): the test to describe.
+
+        Returns:
+            list. encoded descriptors of the resources with data classes.
+        """
+        if test_item.locked_resources is None:
+            return []
+
+        return [ResourceDescriptor(type(resource),
+                                   name=resource.data.name).encode()
+                for resource in six.itervalues(test_item.locked_resources)
+                if resource.DATA_CLASS is not None]
+
     def update_resources(self, test_item):
         """Inform the result server of locked resources of a test.
 
         Args:
             test_item (rotest.core.case.TestCase): the test to update about.
         """
-        resources = []
-        if test_item.locked_resources is not None:
-            resources = [ResourceDescriptor(type(resource),
-                                            name=resource.data.name).encode()
-                         for resource in
-                         six.itervalues(test_item.locked_resources)
-                         if resource.DATA_CLASS is not None]
-
         request_data = UpdateResourcesParamsModel({
             "test_details": {
                 "test_id": test_item.identifier,
                 "token": self.token
             },
-            "descriptors": resources
+            "descriptors": self._get_resources_descriptors(test_item)
         })
         response = self.requester.request(UpdateResources,
                                           data=request_data,
@@ -256,3 +309,95 @@ class ClientResultManager(AbstractClient):
 
         if isinstance(response, FailureResponseModel):
             raise RuntimeError(response.details)
+
+    @classmethod
+    def create_event(cls, event, test_item, **details):
+        """Describe an event of a test, to be reported in a batch.
+
+        The event is timestamped when it's created, so its time is kept
+        regardless of when it's sent to the server.
+
+        Args:
+            event (str): type of the event, e.g. START_TEST_EVENT.
+            test_item (rotest.core.abstract_test.AbstractTest): the test
+                the event refers to.
+            details (dict): additional fields of the event.
+
+        Returns:
+            dict. the event, as expected by :meth:`report_events`.
+        """
+        event_dict = {"event": event,
+                      "test_id": test_item.identifier,
+                      "time": time.time()}
+        event_dict.update(details)
+        return event_dict
+
+    @classmethod
+    def create_result_event(cls, test_item, result_code, info=""):
+        """Describe a result of a test, to be reported in a batch.
+
+        Args:
+            test_item (TestCase): the test to update its result.
+            result_code (number): the code of the result (TestOutcome code).
+            info (str): additional data about the test outcome.
+
+        Returns:
+            dict. the event, as expected by :meth:`report_events`.
+        """
+        return cls.create_event(ADD_RESULT_EVENT, test_item,
+                                result_code=result_code,
+                                info=info if info is not None else "")
+
+    @classmethod
+    def create_resources_event(cls, test_item):
+        """Describe the locked resources of a test, to be reported in a batch.
+
+        Args:
+            test_item (rotest.core.case.TestCase): the test to update about.
+
+        Returns:
+            dict. the event, as expected by :meth:`report_events`.
+        """
+        return cls.create_event(
+            UPDATE_RESOURCES_EVENT, test_item,
+            descriptors=cls._get_resources_descriptors(test_item))
+
+    def report_events(self, events, batch_id=None):
+        """Inform the result server of a batch of test events.
+
+        The events' times are sent relative to the time of sending, so the
+        server can rebase them on its own clock.
+
+        Args:
+            events (list): the events to report, in the order they occurred.
+            batch_id (number): identifier of the batch in the run. The server
+                applies a batch once per identifier, so it's safe to resend.
+
+        Returns:
+            list. the events that the server failed to apply, each is a dict
+                with the index of the event in the batch and the failure's
+                details.
+        """
+        send_time = time.time()
+        sent_events = []
+        for event in events:
+            sent_event = dict(event)
+            event_time = sent_event.pop("time", None)
+            if event_time is not None:
+                sent_event["age"] = max(send_time - event_time, 0)
+
+            sent_events.append(sent_event)
+
+        request_data = {"token": self.token, "events": sent_events}
+        if batch_id is not None:
+            request_data["batch_id"] = batch_id
+
+        response = self.requester.request(
+            ReportTestEvents,
+            data=ReportTestEventsParamsModel(request_data),
+            method="post")
+
+        if isinstance(response, FailureResponseModel):
+            raise RuntimeError(response.details)
+
+        return response.failures
@@ -0,0 +1,150 @@
+"""Background reporter of test events to the result server."""
+# pylint: disable=broad-except
+from __future__ import absolute_import
+
+import time
+import itertools
+import threading
+
+from six.moves import queue
+from future.builtins import object
+
+from rotest.common import core_log
+
+
+class ResultReporter(object):
+    """Report test events to the result server from a background thread.
+
+    Events are queued by the test thread and sent by the reporting thread,
+    coalesced into batched requests, so running tests never wait for the
+    result server. When too many events are pending, reporting new events
+    blocks until the queue drains, and requests that failed to reach the
+    server are retried before giving up on the batch. Each batch is sent
+    with its own identifier, so the server doesn't apply a resent batch
+    twice, and events the server failed to apply are logged one by one.
+
+    Attributes:
+        client (ClientResultManager): connected client to send events with.
+        logger (logging.Logger): logger to report failures to.
+        MAX_PENDING_EVENTS (number): maximal number of queued events.
+        MAX_BATCH_SIZE (number): maximal number of events per request.
+        COALESCE_INTERVAL (number): seconds to wait for more events after
+            the first one in a batch arrives.
+        RETRIES (number): number of times to resend a failed batch.
+        RETRY_DELAY (number): seconds to wait before the first resend,
+            doubled on each following resend.
+    """
+    MAX_PENDING_EVENTS = 1000
+    MAX_BATCH_SIZE = 200
+    COALESCE_INTERVAL = 0.05
+    RETRIES = 3
+    RETRY_DELAY = 0.5
+
+    _STOP = object()
+
+    def __init__(self, client, logger=core_log):
+        self.client = client
+        self.logger = logger
+        self.events = queue.Queue(maxsize=self.MAX_PENDING_EVENTS)
+        self.reporting_thread = None
+        self.batch_ids = itertools.count()
+
+    def start(self):
+        """Start the reporting thread."""
+        self.reporting_thread = threading.Thread(target=self.report_loop)
+        self.reporting_thread.daemon = True
+        self.reporting_thread.start()
+
+    def stop(self):
+        """Send all the pending events and stop the reporting thread."""
+        if self.reporting_thread is None:
+            return
+
+        self.events.put(self._STOP)
+        self.reporting_thread.join()
+        self.reporting_thread = None
+
+    def report(self, event):
+        """Queue an event to be sent to the result server.
+
+        Args:
+            event (dict): the event to send, see
+                :meth:`rotest.management.client.result_client.
+                ClientResultManager.create_event`.
+        """
+        self.events.put(event)
+
+    def _collect_batch(self):
+        """Wait for events and coalesce them into a batch.
+
+        Returns:
+            tuple. list of the collected events, and whether the reporter
+            was asked to stop.
+        """
+        batch = []
+        deadline = None
+        while len(batch) < self.MAX_BATCH_SIZE:
+            if deadline is None:
+                event = self.events.get()
+
+            else:
+                try:
+                    event = self.events.get(
+                        timeout=max(deadline - time.time(), 0))
+
+                except queue.Empty:
+                    break
+
+            if event is self._STOP:
+                return batch, True
+
+            batch.append(event)
+            if deadline is None:
+                deadline = time.time() + self.COALESCE_INTERVAL
+
+        return batch, False
+
+    def _send_batch(self, batch):
+        """Send a batch of events, retrying on failures.
+
+        Args:
+            batch (list): the events to send.
+        """
+        batch_id = next(self.batch_ids)
+        retry_delay = self.RETRY_DELAY
+        for attempt in range(self.RETRIES + 1):
+            try:
+                failures = self.client.report_events(batch, batch_id)
+                for failure in failures:
+                    self.logger.error("The result server failed applying "
+                                      "test event %r: %s",
+                                      batch[failure["index"]],
+                                      failure["details"])
+
+                return
+
+            except RuntimeError as error:
+                # The server rejected the batch, resending it won't help
+                self.logger.error("The result server rejected %d test "
+                                  "events: %s", len(batch), error)
+                return
+
+            except Exception as error:
+                if attempt == self.RETRIES:
+                    self.logger.error("Failed reporting %d test events to "
+                                      "the result server: %s",
+                                      len(batch), error)
+                    return
+
+                self.logger.warning("Failed reporting test events to the "
+                                    "result server (%s), retrying", error)
+                time.sleep(retry_delay)
+                retry_delay *= 2
+
+    def report_loop(self):
+        """Send batches of events until the reporter is stopped."""
+        should_stop = False
+        while not should_stop:
+            batch, should_stop = self._collect_batch()
+            if len(batch) > 0:
+                self._send_batch(batch)
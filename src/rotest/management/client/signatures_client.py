@@ -2,11 +2,12 @@
 from __future__ import absolute_import
 
 from rotest.common import core_log
-from rotest.api.signature_control import GetOrCreate
+from rotest.api.signature_control import GetOrCreate, GetOrCreateBatch
 from rotest.common.config import RESOURCE_MANAGER_HOST
 from rotest.management.client.client import AbstractClient
 from rotest.api.common.responses import FailureResponseModel
-from rotest.api.common.models import SignatureControlParamsModel
+from rotest.api.common.models import (SignatureControlParamsModel,
+                                      BatchSignatureControlParamsModel)
 
 
 class ClientSignatureManager(AbstractClient):
@@ -42,3 +43,25 @@ class ClientSignatureManager(AbstractClient):
             raise RuntimeError(response.details)
 
         return response
+
+    def get_or_create_signatures(self, error_strings):
+        """Get or create the signatures of many errors in a single request.
+
+        Args:
+            error_strings (list): strings of the errors.
+
+        Returns:
+            list. the signature data of each error, in the errors' order.
+        """
+        request_data = BatchSignatureControlParamsModel({
+            "errors": list(error_strings)
+        })
+
+        response = self.requester.request(GetOrCreateBatch,
+                                          data=request_data,
+                                          method="post")
+
+        if isinstance(response, FailureResponseModel):
+            raise RuntimeError(response.details)
+
+        return response.signatures
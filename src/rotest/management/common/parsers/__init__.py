@@ -1,4 +1,5 @@
 """Define all parsers that supports resource_management messages"""
 from .json_parser import JSONParser
+from .compact_parser import CompactParser
 
 DEFAULT_PARSER = JSONParser
@@ -0,0 +1,76 @@
+"""Compact parser module.
+
+Note:
+    The messages are encoded into tuples of base types, which are meant to be
+    serialized by the transport itself (e.g. pickled once by a
+    multiprocessing queue), so the parser isn't suited for text channels.
+"""
+from __future__ import absolute_import
+
+from future.utils import itervalues
+
+from rotest.management.common import messages
+from .json_parser import JSONParser
+
+
+class CompactParser(JSONParser):
+    """Compact messages parser.
+
+    Encodes a message as a tuple of its type's code followed by its fields'
+    values in the order of the type's slots, instead of a dictionary of the
+    type's name and the fields' names and values.
+    Values of base types and None are kept as they are, and the other values
+    are encoded like in :class:`JSONParser`, into dictionaries.
+
+    Attributes:
+        MESSAGE_TYPES (list): the message classes, sorted by their names.
+            A message type's code is its index in the list.
+        MESSAGE_CODES (dict): map message class to its code.
+    """
+    MESSAGE_TYPES = sorted((value for value in itervalues(vars(messages))
+                            if isinstance(value, type) and
+                            issubclass(value, messages.AbstractMessage)),
+                           key=lambda message_type: message_type.__name__)
+
+    MESSAGE_CODES = {message_type: code
+                     for code, message_type in enumerate(MESSAGE_TYPES)}
+
+    _RAW_TYPES = frozenset(JSONParser._BASE_TYPES + (type(None),))
+
+    def _encode_message(self, message):
+        """Encode a message to a compact tuple.
+
+        Args:
+            message (AbstractMessage): message to encode.
+
+        Returns:
+            tuple. the message type's code and the encoded fields' values.
+        """
+        values = [self.MESSAGE_CODES[type(message)]]
+        for slot in message.__slots__:
+            value = getattr(message, slot)
+            # Match the exact type, subclasses of the base types (e.g. bool
+            # or str derived classes) must go through the encoders
+            # pylint: disable=unidiomatic-typecheck
+            if type(value) not in self._RAW_TYPES:
+                value = self.recursive_encode(value)
+
+            values.append(value)
+
+        return tuple(values)
+
+    def _decode_message(self, data):
+        """Decode a message from a compact tuple.
+
+        Args:
+            data (tuple): message to decode.
+
+        Returns:
+            AbstractMessage. the decoded message.
+        """
+        message_class = self.MESSAGE_TYPES[data[0]]
+        values = [self.recursive_decode(value)
+                  if isinstance(value, dict) else value
+                  for value in data[1:]]
+
+        return message_class(*values)
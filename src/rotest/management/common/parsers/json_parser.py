@@ -41,6 +41,7 @@ class JSONParser(AbstractParser):
 
     Attributes:
         complex_decoders (dict): map element type to its decoding method.
+        complex_encoders (dict): map data type to its encoding method.
     """
     _NONE_TYPE = 'None'
     _LIST_TYPE = 'List'
@@ -48,6 +49,7 @@ class JSONParser(AbstractParser):
     _DICT_TYPE = 'Dictionary'
     _RESOURCE_TYPE = 'Resource'
     _RESOURCE_DATA_TYPE = 'ResourceData'
+    _BASE_TYPES = tuple(string_types) + (bool, int, float)
 
     def __init__(self):
         super(JSONParser, self).__init__()
@@ -66,6 +68,12 @@ class JSONParser(AbstractParser):
             models.Model: self._encode_resource_data,
             BaseResource: self._encode_resource
         }
+        # Encoders by the exact type of the data, None for base types that
+        # are encoded as is. Other types are resolved and added on first use.
+        self._type_encoders = dict.fromkeys(self._BASE_TYPES)
+        for encoder_type in (dict, list, tuple, type):
+            self._type_encoders[encoder_type] = \
+                self.complex_encoders[encoder_type]
 
     def _encode_message(self, message):
         """Encode a message to JSON-compatible format.
@@ -101,10 +109,6 @@ class JSONParser(AbstractParser):
     def recursive_encode(self, data):
         """Encode the given data according to its type.
 
-        Warning:
-            Do not change the order of the type validation! Some types matches
-            more than one type (e.g: bool is also a Number).
-
         Args:
             data (object): an object to encode.
 
@@ -117,18 +121,46 @@ class JSONParser(AbstractParser):
         if data is None:
             return self._NONE_TYPE
 
-        base_types = [string_types, bool, Number]
+        try:
+            encoder_handler = self._type_encoders[type(data)]
+
+        except KeyError:
+            encoder_handler = self._resolve_encoder(type(data))
+
+        if encoder_handler is None:
+            return data
 
-        for encoder_type in base_types:
-            if isinstance(data, encoder_type):
-                return data
+        return encoder_handler(data)
+
+    def _resolve_encoder(self, data_type):
+        """Find the encoder of a type by its bases, and cache it.
+
+        Warning:
+            Do not change the order of the type validation! Some types matches
+            more than one type (e.g: bool is also a Number).
+
+        Args:
+            data_type (type): type of the data to encode.
+
+        Returns:
+            function. the type's encoding method, or None if the data of the
+                type should be encoded as is.
+
+        Raises:
+            TypeError: given type couldn't be encoded by this parser.
+        """
+        for base_type in (string_types, bool, Number):
+            if issubclass(data_type, base_type):
+                self._type_encoders[data_type] = None
+                return None
 
         for encoder_type, encoder_handler in \
                 list(iteritems(self.complex_encoders)):
-            if isinstance(data, encoder_type):
-                return encoder_handler(data)
+            if issubclass(data_type, encoder_type):
+                self._type_encoders[data_type] = encoder_handler
+                return encoder_handler
 
-        raise TypeError("Type %r isn't supported by the parser" % type(data))
+        raise TypeError("Type %r isn't supported by the parser" % data_type)
 
     def _encode_resource(self, resource):
         """Encode a resource to an json string.
@@ -233,23 +265,27 @@ class JSONParser(AbstractParser):
         Raises:
             ParsingError: failed to decode the element.
         """
-        if not isinstance(element, dict) or \
-                        list(element.keys())[0] not in self.complex_decoders:
-            value = element
+        if isinstance(element, dict):
+            if len(element) != 1:
+                raise ParsingError("Expected a single typed element, got %r" %
+                                   element)
 
-            if value == self._NONE_TYPE:
-                return None
+            (decoder_type, value), = element.items()
+            try:
+                decoder = self.complex_decoders[decoder_type]
+
+            except KeyError:
+                raise ParsingError("Unknown element type %r" % decoder_type)
 
-            if isinstance(value, string_types):
-                return value
+            return decoder(value)
 
-            if isinstance(value, (bool, Number)):
-                return value
+        if element == self._NONE_TYPE:
+            return None
 
-        decoder_type = list(element.keys())[0]
+        if isinstance(element, (string_types, bool, Number)):
+            return element
 
-        decoder = self.complex_decoders[decoder_type]
-        return decoder(element[decoder_type])
+        raise ParsingError("Failed to decode element %r" % element)
 
     def _decode_resource_data(self, resource_element):
         """Decode a resource element.
@@ -15,6 +15,13 @@ TEST_NAME_KEY = 'name'
 TEST_CLASS_CODE_KEY = 'class'
 TEST_SUBTESTS_KEY = 'subtests'
 
+START_TEST_EVENT = 'start_test'
+STOP_TEST_EVENT = 'stop_test'
+START_COMPOSITE_EVENT = 'start_composite'
+STOP_COMPOSITE_EVENT = 'stop_composite'
+ADD_RESULT_EVENT = 'add_result'
+UPDATE_RESOURCES_EVENT = 'update_resources'
+
 TYPE_NAME = "type"
 DATA_NAME = "data"
 PROPERTIES = "properties"
@@ -22,6 +29,8 @@ PROPERTIES = "properties"
 LOCAL_IP = "127.0.0.1"
 LOCALHOST = "localhost"
 
+TYPES_CACHE = {}
+
 
 def get_client_ip(request):
     """Get client's ip address.
@@ -80,11 +89,15 @@ def extract_type(type_path):
     Raises:
         ResourceTypeError: given type path doesn't exists.
     """
+    if type_path in TYPES_CACHE:
+        return TYPES_CACHE[type_path]
+
     try:
         module_name, type_name = type_path.rsplit('.', 1)
         module = importlib.import_module(module_name)
 
-        return getattr(module, type_name)
+        TYPES_CACHE[type_path] = getattr(module, type_name)
+        return TYPES_CACHE[type_path]
 
     except Exception as ex:
         raise ResourceTypeError("Failed to extract type %r. Reason: %s."
@@ -28,10 +28,13 @@ except ImportError:
         ReverseSingleRelatedObjectDescriptor as ForwardManyToOneDescriptor
 
 from rotest.common.django_utils.fields import NameField
-from rotest.common.django_utils.common import get_fields
+from rotest.common.django_utils.common import get_fields, get_remote_field
 from rotest.common.django_utils import get_sub_model, linked_unicode
 
 
+RELATED_LOOKUPS_CACHE = {}
+
+
 class DataPointer(object):
     def __init__(self, field_name=None, field_ref=None, parent_pointer=None):
         self.field_name = field_name
@@ -137,6 +140,9 @@ class ResourceData(six.with_metaclass(DataBase, models.Model)):
     # Fields that shouldn't be transmitted to the client:
     IGNORED_FIELDS = ["group", "owner_time", "reserved_time"]
 
+    # Values of the fields as stored in the DB, None if they're unknown
+    _loaded_values = None
+
     name = NameField(unique=True)
     is_usable = models.BooleanField(default=True)
     group = models.ForeignKey(auth_models.Group, on_delete=models.PROTECT,
@@ -234,6 +240,49 @@ class ResourceData(six.with_metaclass(DataBase, models.Model)):
         """
         return get_fields(self, self.IGNORED_FIELDS)
 
+    @classmethod
+    def get_related_lookups(cls, prefix="", parents=()):
+        """Return the lookups of the relations read by :meth:`get_fields`.
+
+        The lookups cover the related fields of the resource and, recursively,
+        of its sub-resources, to be fetched in advance using
+        'prefetch_related' instead of one query per object and field.
+
+        Args:
+            prefix (str): lookup of the resource from the queried model.
+            parents (tuple): models on the lookup's path, to stop on cycles.
+
+        Returns:
+            list. the lookups, e.g. ['demo1', 'demo2'].
+        """
+        if prefix == "" and cls in RELATED_LOOKUPS_CACHE:
+            return RELATED_LOOKUPS_CACHE[cls]
+
+        lookups = []
+        related_fields = [field for field in cls._meta.fields
+                          if field.is_relation and
+                          not get_remote_field(field).parent_link]
+        related_fields.extend(cls._meta.many_to_many)
+
+        for field in related_fields:
+            if field.name in cls.IGNORED_FIELDS:
+                continue
+
+            lookup = prefix + field.name
+            lookups.append(lookup)
+
+            related_model = field.related_model
+            if issubclass(related_model, ResourceData) and \
+                    related_model not in parents + (cls,):
+
+                lookups.extend(related_model.get_related_lookups(
+                    prefix=lookup + "__", parents=parents + (cls,)))
+
+        if prefix == "":
+            RELATED_LOOKUPS_CACHE[cls] = lookups
+
+        return lookups
+
     def duplicate(self):
         """Create a copy of the resource, save it to DB and return it.
 
@@ -281,19 +330,103 @@ class ResourceData(six.with_metaclass(DataBase, models.Model)):
 
         return resource_copy
 
-    def _was_reserved_changed(self):
-        """Check if the user is trying to change the value of 'Reserved'.
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Create an instance loaded from the DB and remember its values."""
+        instance = super(ResourceData, cls).from_db(db, field_names, values)
+        instance._update_loaded_values()  # pylint: disable=protected-access
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        """Reload the fields' values from the DB and remember them.
+
+        Args:
+            using (str): alias of the DB to reload from.
+            fields (list): names of the fields to reload, None for all the
+                loaded fields.
+        """
+        super(ResourceData, self).refresh_from_db(using=using, fields=fields)
+        self._update_loaded_values(fields)
+
+    def _get_field_values(self):
+        """Return the values of the instance's loaded concrete fields.
 
         Returns:
-            bool. whether 'Reserved' was changed.
+            dict. the fields' values, by their attribute names.
+        """
+        return {field.attname: getattr(self, field.attname)
+                for field in self._meta.concrete_fields
+                if field.attname in self.__dict__}
+
+    def _update_loaded_values(self, fields=None):
+        """Remember the current values of the fields as the stored ones.
+
+        Args:
+            fields (list): names of the fields that were stored or loaded,
+                None for all the loaded fields.
         """
+        field_values = self._get_field_values()
+        if fields is not None:
+            field_values = dict(
+                self._loaded_values or {},
+                **{field.attname: field_values[field.attname]
+                   for field in self._meta.concrete_fields
+                   if field.attname in field_values and
+                   (field.name in fields or field.attname in fields)})
+
+        self._loaded_values = field_values
+
+    def _get_changed_fields(self):
+        """Return the fields whose values differ from the stored ones.
+
+        Note:
+            Fields that are updated on every save (e.g. with 'auto_now')
+            are always considered changed.
+
+        Returns:
+            list. attribute names of the changed fields, or None if the
+                stored values are unknown.
+        """
+        loaded_values = self._loaded_values
+        if loaded_values is None or self.pk is None:
+            return None
+
+        return [field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and
+                field.attname in self.__dict__ and
+                (getattr(field, "auto_now", False) or
+                 field.attname not in loaded_values or
+                 loaded_values[field.attname] != getattr(self,
+                                                         field.attname))]
+
+    def _get_stored_reserved(self):
+        """Return the value of 'Reserved' stored in the DB.
+
+        Uses the value loaded with the instance, and queries the DB only
+        for instances that weren't loaded from it (e.g. decoded ones).
+
+        Returns:
+            str. the stored value, or None if the resource isn't stored.
+        """
+        loaded_values = self._loaded_values
+        if loaded_values is not None and self.pk is not None and \
+                "reserved" in loaded_values:
+
+            return loaded_values["reserved"]
+
         try:
-            pre_reserved = ResourceData.objects.get(pk=self.pk).reserved
+            return ResourceData.objects.get(pk=self.pk).reserved
 
         except ObjectDoesNotExist:
-            pre_reserved = ''
+            return None
 
-        return pre_reserved != self.reserved
+    def _was_reserved_changed(self):
+        """Check if the user is trying to change the value of 'Reserved'.
+
+        Returns:
+            bool. whether 'Reserved' was changed.
+        """
+        return (self._get_stored_reserved() or '') != self.reserved
 
     def clean(self):
         """Block reserving and releasing if sub-resources are not available.
@@ -301,19 +434,15 @@ class ResourceData(six.with_metaclass(DataBase, models.Model)):
         Disable only if the resource is not available for neither the previous
         and the current user.
         """
-        try:
-            pre_reserved = ResourceData.objects.get(pk=self.pk).reserved
+        pre_reserved = self._get_stored_reserved()
 
-            if pre_reserved != self.reserved:
-                cur_available = self._is_sub_resources_available(self.reserved)
-                pre_available = self._is_sub_resources_available(pre_reserved)
-                if (self.reserved != "" and
-                        not cur_available and not pre_available):
-                    raise ValidationError('Cannot reserve a resource if its '
-                                          'sub-resources are not available')
-
-        except ObjectDoesNotExist:
-            pass
+        if pre_reserved is not None and pre_reserved != self.reserved:
+            cur_available = self._is_sub_resources_available(self.reserved)
+            pre_available = self._is_sub_resources_available(pre_reserved)
+            if (self.reserved != "" and
+                    not cur_available and not pre_available):
+                raise ValidationError('Cannot reserve a resource if its '
+                                      'sub-resources are not available')
 
         super(ResourceData, self).clean()
 
@@ -339,15 +468,31 @@ class ResourceData(six.with_metaclass(DataBase, models.Model)):
             sub_resource.save()
 
     def save(self, *args, **kwargs):
-        """Propagate reservation change to sub-resources of the resource."""
-        if self._was_reserved_changed():
+        """Propagate reservation change to sub-resources of the resource.
+
+        Instances loaded from the DB update only their changed fields, unless
+        the fields to update or the save mode are given.
+        """
+        pre_reserved = self._get_stored_reserved() or ''
+        if pre_reserved != self.reserved:
             if self.reserved == '':
                 self.reserved_time = None
-                pre_reserved = ResourceData.objects.get(pk=self.pk).reserved
                 self._unreserve_sub_resources(pre_reserved)
 
             else:
                 self.reserved_time = datetime.now()
                 self._reserve_sub_resources(self.reserved)
 
-        return super(ResourceData, self).save(*args, **kwargs)
+        if len(args) > 0:
+            # The save mode is given positionally, track the values again
+            # when the instance is loaded.
+            self._loaded_values = None
+            return super(ResourceData, self).save(*args, **kwargs)
+
+        if not kwargs.get("force_insert") and \
+                kwargs.get("update_fields") is None:
+
+            kwargs["update_fields"] = self._get_changed_fields()
+
+        super(ResourceData, self).save(**kwargs)
+        self._update_loaded_values(kwargs.get("update_fields"))
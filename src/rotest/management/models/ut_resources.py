@@ -51,9 +51,10 @@ class DemoResource(BaseResource):
         # Because of Django unit-test DB fixture loading mechanism, cases
         # primary key are duplicated when the a new fixture is loaded, thus
         # work_dir names are also duplicated. this is a fix to this phenomena.
-        work_dir_path = os.path.join(case_work_dir, logical_name)
-        if os.path.exists(work_dir_path):
-            shutil.rmtree(work_dir_path)
+        if case_work_dir is not None:
+            work_dir_path = os.path.join(case_work_dir, logical_name)
+            if os.path.exists(work_dir_path):
+                shutil.rmtree(work_dir_path)
 
         super(DemoResource, self).set_work_dir(logical_name, case_work_dir)
 
@@ -4,9 +4,12 @@ from __future__ import absolute_import
 from functools import partial
 
 from six.moves import http_client
+from django.db import connection
 from django.test import Client, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 
-from rotest.management.models import DemoResourceData
+from rotest.management.models import (DemoResourceData,
+                                      DemoComplexResourceData)
 
 from tests.api.utils import request
 
@@ -68,3 +71,31 @@ class TestQueryResources(TransactionTestCase):
         })
         self.assertEqual(response.status_code, http_client.OK)
         self.assertEqual(len(content.resource_descriptors), count)
+
+    def test_query_complex_resources_queries(self):
+        """Assert that sub-resources are fetched once for all resources."""
+        def query_complex_resources():
+            with CaptureQueriesContext(connection) as queries:
+                response, content = self.requester(json_data={
+                    "type": "rotest.management.models.ut_models."
+                            "DemoComplexResourceData",
+                    "properties": {}
+                })
+
+            self.assertEqual(response.status_code, http_client.OK)
+            return len(content.resource_descriptors), len(queries)
+
+        resources_count, queries_count = query_complex_resources()
+
+        for index in range(5):
+            DemoComplexResourceData.objects.create(
+                name="complex{}".format(index),
+                demo1=DemoResourceData.objects.create(
+                    name="sub1_{}".format(index), version=1,
+                    ip_address="1.2.3.4"),
+                demo2=DemoResourceData.objects.create(
+                    name="sub2_{}".format(index), version=1,
+                    ip_address="1.2.3.4"))
+
+        self.assertEqual(query_complex_resources(),
+                         (resources_count + 5, queries_count))
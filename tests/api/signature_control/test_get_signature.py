@@ -70,3 +70,114 @@ class TestGetOrCreateSignature(TransactionTestCase):
         self.assertFalse(content.is_new)
         self.assertEqual(content.id, 2)
         self.assertEqual(content.link, link)
+
+    def test_first_signature_match(self):
+        """Validate that the first matching signature is returned."""
+        SignatureData.objects.create(pk=3, link="",
+                                     pattern="(first|second) traceback")
+        SignatureData.objects.create(pk=4, link="",
+                                     pattern="second traceback.*")
+
+        response, content = self.requester(json_data={
+            "error": "second traceback"
+        })
+
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertEqual(content.id, 3)
+
+    def test_edited_signature_match(self):
+        """Validate that editing a signature changes the matched errors."""
+        signature = SignatureData.objects.create(pk=5, link="",
+                                                 pattern="old traceback")
+        self.requester(json_data={"error": "old traceback"})
+
+        signature.pattern = "new traceback"
+        signature.save()
+
+        response, content = self.requester(json_data={
+            "error": "new traceback"
+        })
+
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertFalse(content.is_new)
+        self.assertEqual(content.id, 5)
+
+    def test_pattern_match_before_fingerprint(self):
+        """Validate that patterns take precedence over the fingerprint."""
+        _, content = self.requester(json_data={"error": "shared traceback"})
+        self.assertTrue(content.is_new)
+
+        signature = SignatureData.objects.get(id=content.id)
+        signature.pattern = "a pattern that matches nothing"
+        signature.save()
+        other_signature = SignatureData.objects.create(
+                                        link="", pattern="shared traceback")
+
+        response, content = self.requester(json_data={
+            "error": "shared traceback"
+        })
+
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertFalse(content.is_new)
+        self.assertEqual(content.id, other_signature.id)
+
+    def test_updated_link_match(self):
+        """Validate that the matched signature's link is always current."""
+        SignatureData.objects.create(pk=6, link="old link",
+                                     pattern="linked traceback")
+        self.requester(json_data={"error": "linked traceback"})
+
+        SignatureData.objects.filter(pk=6).update(link="new link")
+
+        response, content = self.requester(json_data={
+            "error": "linked traceback"
+        })
+
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertEqual(content.id, 6)
+        self.assertEqual(content.link, "new link")
+
+    def test_batch_get_or_create(self):
+        """Validate getting and creating the signatures of many errors."""
+        SignatureData.objects.create(pk=7, link="Some link",
+                                     pattern="known traceback")
+
+        response, content = request(client=self.client,
+                                    path="signatures/batch_get_or_create",
+                                    json_data={
+                                        "errors": ["unknown traceback",
+                                                   "known traceback",
+                                                   "unknown traceback"]
+                                    })
+
+        self.assertEqual(response.status_code, http_client.OK)
+        new_signature, known_signature, repeated_signature = \
+            content.signatures
+        self.assertTrue(new_signature["is_new"])
+        self.assertEqual(known_signature["id"], 7)
+        self.assertEqual(known_signature["link"], "Some link")
+        self.assertFalse(repeated_signature["is_new"])
+        self.assertEqual(repeated_signature["id"], new_signature["id"])
+
+    def test_fingerprint_match(self):
+        """Validate matching an error by its fingerprint."""
+        _, content = self.requester(json_data={
+            "error": 'File "/home/user/tests/x.py", line 12, in test\n'
+                     "ValueError: <Device at 0x7f3a2c> timed out at "
+                     "2019-04-08 06:30:12.123"
+        })
+        self.assertTrue(content.is_new)
+
+        signature = SignatureData.objects.get(id=content.id)
+        signature.pattern = "a pattern that matches nothing"
+        signature.save()
+
+        response, content = self.requester(json_data={
+            "error": 'File "/opt/project/tests/x.py", line 15, in test\n'
+                     "ValueError: <Device at 0x55e0> timed out at "
+                     "2020-01-01 10:00:00.5"
+        })
+
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertFalse(content.is_new)
+        self.assertEqual(content.id, signature.id)
@@ -2,15 +2,19 @@
 # pylint: disable=protected-access
 from __future__ import absolute_import
 
+import json
 from functools import partial
 from datetime import datetime, timedelta
 
 from future.builtins import next
 from six.moves import http_client
+from django.db import connection
 from django.test import Client, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 
-from rotest.core.models import RunData
+from rotest.core.models import RunData, StatisticsData
 from rotest.core.models.case_data import CaseData, TestOutcome
+from rotest.core.utils.test_statistics import collect_batch_durations
 from rotest.management.client.result_client import ClientResultManager
 
 from tests.api.utils import request
@@ -66,6 +70,36 @@ class TestControl(TransactionTestCase):
         self.test_suite = next(iter(self.main_test))
         self.test_case = next(iter(self.test_suite))
 
+    def test_start_test_run_string_class_codes(self):
+        """Assert that class indices sent as strings are accepted."""
+        _, token_object = self.requester(path="tests/get_token",
+                                         method="get")
+        data_classes = {}
+        tests_tree_dict = ClientResultManager._create_test_dict(
+            self.main_test, data_classes)
+        nodes = [tests_tree_dict]
+        while nodes:
+            node = nodes.pop()
+            node["class"] = str(node["class"])
+            nodes.extend(node.get("subtests", ()))
+
+        classes = [ClientResultManager.parser.recursive_encode(data_class)
+                   for data_class in sorted(data_classes,
+                                            key=data_classes.get)]
+        response, _ = self.requester(path="tests/start_test_run",
+                                     json_data={
+                                         "run_data": {"run_name": "strings"},
+                                         "tests": tests_tree_dict,
+                                         "classes": classes,
+                                         "token": token_object.token
+                                     })
+        self.assertEqual(response.status_code, http_client.NO_CONTENT)
+        cases = CaseData.objects.filter(run_data__run_name="strings")
+        self.assertEqual(sorted(cases.values_list("name", flat=True)),
+                         sorted(case.data.name
+                                for suite in self.main_test
+                                for case in suite))
+
     def test_update_run_date(self):
         """Assert that the request has the right server response."""
         response, _ = self.requester(
@@ -108,6 +142,36 @@ class TestControl(TransactionTestCase):
         self.assertEqual(response.status_code, http_client.OK)
         self.assertFalse(content.should_skip)
 
+    def test_get_passed_tests(self):
+        """Assert that the passed tests of the previous run are returned.
+
+        Only the last run of each test counts, and tests that aren't part of
+        the session's tree are ignored.
+        """
+        passed_case, failed_case = [test.data.name
+                                    for test in self.test_suite]
+        previous_run = RunData.objects.create(run_name='test_run_name')
+        start_time = datetime.now()
+        for test_name, success, delay in ((passed_case, False, 0),
+                                          (passed_case, True, 1),
+                                          (failed_case, True, 0),
+                                          (failed_case, False, 1),
+                                          ("NotInRunCase", True, 0)):
+
+            CaseData.objects.create(name=test_name,
+                                    run_data=previous_run,
+                                    success=success,
+                                    start_time=start_time +
+                                    timedelta(seconds=delay),
+                                    exception_type=TestOutcome.SUCCESS
+                                    if success else TestOutcome.FAILED)
+
+        response, content = self.requester(path="tests/get_passed_tests",
+                                           json_data={"token": self.token},
+                                           method="get")
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertEqual(list(content.test_names), [passed_case])
+
     def test_get_statistics_cleaning(self):
         """Check the functionality of the test statistics request."""
         now = datetime.now()
@@ -162,6 +226,129 @@ class TestControl(TransactionTestCase):
         self.assertEqual(content.max, 17)
         self.assertEqual(content.avg, 8)
 
+    def test_get_statistics_from_summary(self):
+        """Check that the statistics are taken from the summary table."""
+        test_name = "SomeTest"
+        StatisticsData.objects.create(name=test_name,
+                                      durations=json.dumps([4, 5, 6, 17]))
+
+        response, content = self.requester(path="tests/get_statistics",
+                                           json_data={
+                                               "test_name": test_name,
+                                               "max_sample_size": None,
+                                               "min_duration_cut": None,
+                                               "max_iterations": None,
+                                               "acceptable_ratio": None
+                                           }, method="get")
+
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertEqual(content.min, 4)
+        self.assertEqual(content.max, 6)
+        self.assertEqual(content.avg, 5)
+
+    def test_get_batch_statistics(self):
+        """Check the functionality of the batch test statistics request."""
+        now = datetime.now()
+        for duration in (4, 5, 6, 17):
+            CaseData.objects.create(
+                name="SomeTest",
+                success=True,
+                start_time=now,
+                end_time=now + timedelta(seconds=duration),
+                exception_type=0)
+
+        StatisticsData.objects.create(name="OtherTest",
+                                      durations=json.dumps([2, 2, 2]))
+
+        response, content = self.requester(path="tests/get_batch_statistics",
+                                           json_data={
+                                               "test_names": ["SomeTest",
+                                                              "OtherTest",
+                                                              "NoSuchTest"],
+                                               "max_sample_size": None,
+                                               "min_duration_cut": None,
+                                               "max_iterations": None,
+                                               "acceptable_ratio": None
+                                           })
+
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertEqual(content.statistics,
+                         {"SomeTest": {"min": 4, "avg": 5, "max": 6},
+                          "OtherTest": {"min": 2, "avg": 2, "max": 2}})
+
+    def test_batch_durations_queries(self):
+        """Check the history of tests with no statistics is limited."""
+        now = datetime.now()
+        for test_name in ("SomeTest", "OtherTest", "ThirdTest"):
+            for duration in (1, 2, 3):
+                CaseData.objects.create(
+                    name=test_name,
+                    success=True,
+                    start_time=now,
+                    end_time=now + timedelta(seconds=duration),
+                    exception_type=TestOutcome.SUCCESS)
+
+        with CaptureQueriesContext(connection) as queries:
+            durations = collect_batch_durations(
+                ["SomeTest", "OtherTest", "ThirdTest", "NoSuchTest"],
+                max_size=2)
+
+        # One query for the statistics and a limited one per test history
+        self.assertEqual(len(queries), 5)
+        for query in queries[1:]:
+            self.assertIn("LIMIT 2", query["sql"])
+
+        self.assertEqual(durations, {"SomeTest": [3, 2],
+                                     "OtherTest": [3, 2],
+                                     "ThirdTest": [3, 2],
+                                     "NoSuchTest": []})
+
+    def test_stop_test_updates_statistics(self):
+        """Assert that stopping a successful test updates its statistics."""
+        now = datetime.now()
+        CaseData.objects.create(name=self.test_case.data.name,
+                                success=True,
+                                start_time=now,
+                                end_time=now + timedelta(seconds=3),
+                                exception_type=TestOutcome.SUCCESS)
+
+        for path in ("tests/start_test", "tests/stop_test"):
+            self.requester(path=path,
+                           params={
+                               "token": self.token,
+                               "test_id": self.test_case.identifier
+                           })
+
+        self.assertFalse(StatisticsData.objects.filter(
+                                    name=self.test_case.data.name).exists())
+
+        self.requester(path="tests/start_test",
+                       params={
+                           "token": self.token,
+                           "test_id": self.test_case.identifier
+                       })
+        self.requester(path="tests/add_test_result",
+                       params={
+                           "token": self.token,
+                           "test_id": self.test_case.identifier
+                       },
+                       json_data={
+                           "result": {
+                               "result_code": TestOutcome.SUCCESS,
+                               "info": ""
+                           }
+                       })
+        self.requester(path="tests/stop_test",
+                       params={
+                           "token": self.token,
+                           "test_id": self.test_case.identifier
+                       })
+
+        statistics = StatisticsData.objects.get(name=self.test_case.data.name)
+        durations = statistics.get_durations()
+        self.assertEqual(len(durations), 2)
+        self.assertIn(3, durations)
+
     def test_add_test_result(self):
         """Assert that the request has the right server response."""
         response, _ = self.requester(
@@ -214,3 +401,70 @@ class TestControl(TransactionTestCase):
                                              self.test_case.identifier
                                      })
         self.assertEqual(response.status_code, http_client.NO_CONTENT)
+
+    def test_report_events(self):
+        """Assert that the valid events of a batch are applied."""
+        start_event = {"event": "start_test",
+                       "test_id": self.test_case.identifier}
+        response, content = self.requester(path="tests/report_events",
+                                           json_data={
+                                               "token": self.token,
+                                               "events": [
+                                                   {"event": "no_such_event",
+                                                    "test_id": 0},
+                                                   start_event]
+                                           })
+        self.assertEqual(response.status_code, http_client.OK)
+        self.assertEqual([failure["index"] for failure in content.failures],
+                         [0])
+        self.assertIsNotNone(
+            CaseData.objects.get(name=self.test_case.data.name).start_time)
+
+        response, _ = self.requester(path="tests/report_events",
+                                     json_data={"token": "no_such_token",
+                                                "events": [start_event]})
+        self.assertEqual(response.status_code, http_client.BAD_REQUEST)
+
+    def test_report_events_resent_batch(self):
+        """Assert that a batch resent with the same id is applied once."""
+        for age in (60, 0):
+            response, content = self.requester(
+                path="tests/report_events",
+                json_data={"token": self.token,
+                           "batch_id": 1,
+                           "events": [
+                               {"event": "start_test",
+                                "test_id": self.test_case.identifier,
+                                "age": age},
+                               {"event": "no_such_event", "test_id": 0}]})
+
+            self.assertEqual(response.status_code, http_client.OK)
+            self.assertEqual([failure["index"]
+                              for failure in content.failures], [1])
+
+        start_time = CaseData.objects.get(
+                                    name=self.test_case.data.name).start_time
+        self.assertLessEqual(start_time,
+                             datetime.now() - timedelta(seconds=60))
+
+    def test_report_events_times(self):
+        """Assert that the events' times are rebased on the server's clock."""
+        before_request = datetime.now()
+        response, _ = self.requester(path="tests/report_events",
+                                     json_data={
+                                         "token": self.token,
+                                         "events": [{
+                                             "event": "start_test",
+                                             "test_id":
+                                                 self.test_case.identifier,
+                                             "age": 60}]
+                                     })
+        after_request = datetime.now()
+
+        self.assertEqual(response.status_code, http_client.OK)
+        start_time = CaseData.objects.get(
+                                    name=self.test_case.data.name).start_time
+        self.assertLessEqual(before_request - timedelta(seconds=60),
+                             start_time)
+        self.assertLessEqual(start_time,
+                             after_request - timedelta(seconds=60))
@@ -12,6 +12,10 @@ from rotest.cli.main import main
 from rotest.core import TestCase, TestSuite
 from rotest.cli.client import main as client_main
 from rotest.cli.client import parse_outputs_option
+from rotest.core.result.result import RESULT_HANDLERS_GROUP
+from rotest.cli.client import create_client_options_parser
+from rotest.common.entry_points import (LOADED_ENTRY_POINTS_CACHE,
+                                        get_version, get_entry_points)
 from rotest.common.constants import DEFAULT_SCHEMA_PATH, DEFAULT_CONFIG_PATH
 
 
@@ -19,6 +23,20 @@ class MockCase(TestCase):
     pass
 
 
+@pytest.fixture(autouse=True)
+def installed_distributions():
+    """Read the installed distributions before the file system is faked."""
+    get_version()
+    get_entry_points(RESULT_HANDLERS_GROUP)
+
+
+@mock.patch.dict(LOADED_ENTRY_POINTS_CACHE, clear=True)
+def test_parser_not_loading_output_handlers():
+    parser = create_client_options_parser()
+    assert "tree" in parser.format_help()
+    assert RESULT_HANDLERS_GROUP not in LOADED_ENTRY_POINTS_CACHE
+
+
 def test_parsing_output_handlers():
     outputs = parse_outputs_option("pretty,artifact,excel")
     assert outputs == ["pretty", "artifact", "excel"]
@@ -104,7 +122,8 @@ def test_finding_tests_in_current_module(discover, run_tests):
     sys.argv = ["python", "script.py"]
     main()
 
-    discover.assert_called_once_with(("script.py",))
+    discover.assert_called_once_with(("script.py",), tags_filter=None,
+                                     lazy=True)
     run_tests.assert_called()
 
 
@@ -115,7 +134,7 @@ def test_finding_tests_in_current_directory(discover, run_tests):
     sys.argv = ["rotest"]
     main()
 
-    discover.assert_called_once_with((".",))
+    discover.assert_called_once_with((".",), tags_filter=None, lazy=True)
     run_tests.assert_called()
 
 
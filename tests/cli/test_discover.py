@@ -2,13 +2,15 @@ from __future__ import absolute_import
 import os
 import unittest
 
+import py
 import six
 import mock
 import pytest
 from pyfakefs.fake_filesystem_unittest import Patcher
 
 from rotest.core import TestSuite, TestCase, TestBlock
-from rotest.cli.discover import (is_test_class,
+from rotest.core.utils.common import print_test_hierarchy
+from rotest.cli.discover import (is_test_class, load_tests, IndexedTest,
                                  get_test_files, discover_tests_under_paths)
 
 
@@ -93,3 +95,156 @@ def test_importing_bad_file():
 
         with pytest.raises(ImportError):
             discover_tests_under_paths(["some_bad_test.py"])
+
+
+def test_skipping_indexed_files(tmpdir):
+    """Assert that unchanged files without tests to run aren't imported."""
+    test_file = tmpdir.join("indexed_test.py")
+    test_file.write("from rotest.core import TestCase\n"
+                    "class IndexedCase(TestCase):\n"
+                    "    TAGS = ['Indexed']\n"
+                    "    def test(self):\n"
+                    "        pass\n")
+
+    index_path = str(tmpdir.join("discovery_index.json"))
+    with mock.patch("rotest.cli.discover.DISCOVERY_INDEX", True), \
+            mock.patch("rotest.cli.discover.DISCOVERY_INDEX_PATH",
+                       index_path):
+
+        tests = discover_tests_under_paths([str(test_file)])
+        assert [test.__name__ for test in tests] == ["IndexedCase"]
+        assert os.path.exists(index_path)
+
+        with mock.patch("py.path.local") as local_path:
+            assert discover_tests_under_paths([str(test_file)],
+                                              tags_filter="Other") == []
+            local_path.assert_not_called()
+
+        tests = discover_tests_under_paths([str(test_file)],
+                                           tags_filter="Indexed")
+        assert [test.__name__ for test in tests] == ["IndexedCase"]
+
+
+def test_listing_indexed_tests(tmpdir, capsys):
+    """Assert that indexed tests are listed without importing their files."""
+    tmpdir.join("blocks.py").write("from rotest.core import TestBlock\n"
+                                   "class Block(TestBlock):\n"
+                                   "    def test_method(self):\n"
+                                   "        pass\n")
+    test_file = tmpdir.join("indexed_flow_test.py")
+    test_file.write("from rotest.core import TestFlow\n"
+                    "from blocks import Block\n"
+                    "class IndexedFlow(TestFlow):\n"
+                    "    TAGS = ['Indexed']\n"
+                    "    blocks = [Block]\n")
+
+    index_path = str(tmpdir.join("discovery_index.json"))
+    with mock.patch("rotest.cli.discover.DISCOVERY_INDEX", True), \
+            mock.patch("rotest.cli.discover.DISCOVERY_INDEX_PATH",
+                       index_path):
+
+        tests = discover_tests_under_paths([str(test_file)])
+        print_test_hierarchy(tests[0], None)
+        imported_listing, _ = capsys.readouterr()
+
+        with mock.patch("py.path.local") as local_path:
+            tests = discover_tests_under_paths([str(test_file)], lazy=True)
+            assert [type(test) for test in tests] == [IndexedTest]
+            assert tests[0].__name__ == "IndexedFlow"
+            assert tests[0].TAGS == ["Indexed"]
+
+            print_test_hierarchy(tests[0], None)
+            local_path.assert_not_called()
+
+    indexed_listing, _ = capsys.readouterr()
+    assert "Block.test_method" in indexed_listing
+    assert indexed_listing == imported_listing
+
+
+def test_loading_selected_indexed_tests(tmpdir):
+    """Assert that only the files of the loaded indexed tests are imported."""
+    for name in ("First", "Second"):
+        tmpdir.join("%s_test.py" % name.lower()).write(
+            "from rotest.core import TestCase\n"
+            "class %sCase(TestCase):\n"
+            "    def test(self):\n"
+            "        pass\n" % name)
+
+    index_path = str(tmpdir.join("discovery_index.json"))
+    with mock.patch("rotest.cli.discover.DISCOVERY_INDEX", True), \
+            mock.patch("rotest.cli.discover.DISCOVERY_INDEX_PATH",
+                       index_path):
+
+        discover_tests_under_paths([str(tmpdir)])
+        tests = discover_tests_under_paths([str(tmpdir)], lazy=True)
+
+    assert sorted(test.__name__ for test in tests) == ["FirstCase",
+                                                      "SecondCase"]
+
+    selected_test = [test for test in tests
+                     if test.__name__ == "SecondCase"][0]
+    with mock.patch("py.path.local", wraps=py.path.local) as local_path:
+        loaded_tests = load_tests([selected_test])
+
+    local_path.assert_called_once_with(selected_test.path)
+    assert [test.__name__ for test in loaded_tests] == ["SecondCase"]
+    assert is_test_class(loaded_tests[0])
+
+
+def test_skipping_files_without_tests(tmpdir):
+    """Assert that files that can't define tests aren't imported."""
+    tmpdir.join("helpers.py").write("raise RuntimeError('imported')\n"
+                                    "class Helper(object):\n"
+                                    "    pass\n")
+    tmpdir.join("resources.py").write(
+        "raise RuntimeError('imported')\n"
+        "from rotest.management import BaseResource\n"
+        "class Resource(BaseResource):\n"
+        "    pass\n")
+    tmpdir.join("base_case.py").write("from rotest.core import TestCase\n"
+                                      "class BaseCase(TestCase):\n"
+                                      "    __test__ = False\n")
+    tmpdir.join("derived_test.py").write(
+        "from base_case import BaseCase as Base\n"
+        "class DerivedCase(Base):\n"
+        "    def test(self):\n"
+        "        pass\n")
+
+    with mock.patch("rotest.cli.discover.DISCOVERY_INDEX", False):
+        tests = discover_tests_under_paths([str(tmpdir)])
+
+    assert [test.__name__ for test in tests] == ["DerivedCase"]
+
+
+def test_importing_created_flows(tmpdir):
+    """Assert that files creating flows at import time are imported."""
+    tmpdir.join("created_flow_test.py").write(
+        "from rotest.core import TestBlock\n"
+        "from rotest.core.flow import create_flow\n"
+        "class Block(TestBlock):\n"
+        "    def test_method(self):\n"
+        "        pass\n"
+        "CreatedFlow = create_flow([Block], name='CreatedFlow')\n")
+
+    with mock.patch("rotest.cli.discover.DISCOVERY_INDEX", False):
+        tests = discover_tests_under_paths([str(tmpdir)])
+
+    assert [test.__name__ for test in tests] == ["CreatedFlow"]
+
+
+def test_resolving_bases_by_imports(tmpdir):
+    """Assert that classes' bases are resolved through their file imports."""
+    tmpdir.mkdir("helpers").join("base.py").write("class Base(object):\n"
+                                                  "    pass\n")
+    tmpdir.join("helpers").join("helper.py").write(
+        "raise RuntimeError('imported')\n"
+        "from base import Base\n"
+        "class Helper(Base):\n"
+        "    pass\n")
+    tmpdir.mkdir("tests").join("abstract_case.py").write(
+        "from rotest.core import TestCase\n"
+        "class Base(TestCase):\n"
+        "    __test__ = False\n")
+
+    with mock.patch("rotest.cli.discover.DISCOVERY_INDEX", False):
+        assert discover_tests_under_paths([str(tmpdir)]) == []
@@ -2,10 +2,14 @@
 from __future__ import absolute_import
 import os
 import time
+import logging
 import unittest
+import threading
+import multiprocessing
 
 from rotest.common import core_log
-from rotest.common.log import get_test_logger
+from rotest.common.log import (get_test_logger, flush_logs,
+                               release_test_logger)
 from rotest.common.config import ROTEST_WORK_DIR
 
 
@@ -14,6 +18,7 @@ class TestLog(unittest.TestCase):
 
     TEST_LOG_BASENAME = 'logger_unittest'
     TEST_LOG_DIR = ROTEST_WORK_DIR
+    FORKS_NUMBER = 60
 
     @classmethod
     def setUpClass(cls):
@@ -23,9 +28,8 @@ class TestLog(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        for log_handler in cls.test_log.handlers:
-            log_handler.close()
-
+        release_test_logger(cls.test_log)
+        flush_logs()
         os.remove(cls.test_log_file_path)
 
     @staticmethod
@@ -43,6 +47,7 @@ class TestLog(unittest.TestCase):
                 core_log_file.seek(0, os.SEEK_END)
                 test_log_file.seek(0, os.SEEK_END)
                 core_log.debug(log_msg)
+                flush_logs()
                 core_log_file_content = core_log_file.read()
                 test_log_file_content = test_log_file.read()
                 self.assertEqual(core_log_file_content.count(log_msg), 1)
@@ -56,7 +61,86 @@ class TestLog(unittest.TestCase):
                 core_log_file.seek(0, os.SEEK_END)
                 test_log_file.seek(0, os.SEEK_END)
                 self.test_log.debug(log_msg)
+                flush_logs()
                 core_log_file_content = core_log_file.read()
                 test_log_file_content = test_log_file.read()
                 self.assertEqual(core_log_file_content.count(log_msg), 1)
                 self.assertEqual(test_log_file_content.count(log_msg), 1)
+
+    def test_release_test_logger(self):
+        """Release a test logger and verify it's closed and unregistered."""
+        test_log = get_test_logger('released_logger_unittest',
+                                   self.TEST_LOG_DIR)
+        log_file_path = self._get_log_file_path(test_log)
+        self.addCleanup(os.remove, log_file_path)
+
+        log_msg = '%s TEST_RELEASED_LOGGER' % time.ctime()
+        test_log.debug(log_msg)
+        release_test_logger(test_log)
+        flush_logs()
+
+        self.assertEqual(test_log.handlers, [])
+        self.assertNotIn(test_log.name, logging.Logger.manager.loggerDict)
+        with open(log_file_path, 'r') as test_log_file:
+            self.assertEqual(test_log_file.read().count(log_msg), 1)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_logging_around_fork(self):
+        """Fork while logging heavily and verify the children can log."""
+        test_log = get_test_logger('forked_logger_unittest',
+                                   self.TEST_LOG_DIR)
+        log_file_path = self._get_log_file_path(test_log)
+        self.addCleanup(os.remove, log_file_path)
+
+        stop_logging = threading.Event()
+
+        def log_continuously():
+            index = 0
+            while not stop_logging.is_set():
+                test_log.debug("PARENT_RECORD_%d_", index)
+                index += 1
+
+        logging_thread = threading.Thread(target=log_continuously)
+        logging_thread.start()
+        try:
+            processes = []
+            for index in range(self.FORKS_NUMBER):
+                process = multiprocessing.Process(target=log_in_child,
+                                                  args=(test_log, index))
+                process.start()
+                processes.append(process)
+
+            for process in processes:
+                process.join(timeout=10)
+                self.assertEqual(process.exitcode, 0)
+
+        finally:
+            stop_logging.set()
+            logging_thread.join()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        release_test_logger(test_log)
+        flush_logs()
+
+        with open(log_file_path, 'r') as test_log_file:
+            log_content = test_log_file.read()
+
+        for index in range(self.FORKS_NUMBER):
+            self.assertEqual(log_content.count("CHILD_RECORD_%d_" % index), 1)
+
+        parent_records = [line for line in log_content.splitlines()
+                          if "PARENT_RECORD_" in line]
+        self.assertEqual(len(parent_records), len(set(parent_records)))
+
+
+def log_in_child(test_log, index):
+    """Log a record in a forked process and wait for it to be written.
+
+    Args:
+        test_log (logging.Logger): logger to log with.
+        index (number): index of the process.
+    """
+    test_log.debug("CHILD_RECORD_%d_", index)
+    flush_logs()
@@ -0,0 +1,85 @@
+"""Test Rotest's common utils."""
+from __future__ import absolute_import
+
+import gc
+import weakref
+import unittest
+from abc import ABCMeta
+
+import six
+
+from rotest.core.case import TestCase
+from rotest.management.base_resource import BaseResource, ResourceRequest
+from rotest.common.utils import get_class_fields, CLASS_FIELDS_CACHE
+
+
+class TestGetClassFields(unittest.TestCase):
+    """Test the search and caching of class fields."""
+    def setUp(self):
+        class ParentResource(BaseResource):
+            first = BaseResource.request()
+
+        class ChildResource(ParentResource):
+            second = BaseResource.request()
+
+        self.parent_class = ParentResource
+        self.child_class = ChildResource
+
+    @staticmethod
+    def get_field_names(klass):
+        """Return the names of the resource requests of the class."""
+        return [name for name, _ in get_class_fields(klass, ResourceRequest)]
+
+    def test_inherited_fields(self):
+        """Test that fields of parent classes are found and cached."""
+        self.assertEqual(self.get_field_names(self.child_class),
+                         ["first", "second"])
+        self.assertIn(ResourceRequest, CLASS_FIELDS_CACHE[self.child_class])
+
+    def test_cached_fields(self):
+        """Test that the fields are searched once until the class changes."""
+        self.get_field_names(self.child_class)
+        _, fields = CLASS_FIELDS_CACHE[self.child_class][ResourceRequest]
+
+        self.get_field_names(self.child_class)
+        _, cached_fields = \
+            CLASS_FIELDS_CACHE[self.child_class][ResourceRequest]
+        self.assertIs(cached_fields, fields)
+
+        self.child_class.third = BaseResource.request()
+        self.get_field_names(self.child_class)
+        _, new_fields = CLASS_FIELDS_CACHE[self.child_class][ResourceRequest]
+        self.assertIsNot(new_fields, fields)
+
+    def test_cache_releases_classes(self):
+        """Test that the cache doesn't keep deleted classes alive."""
+        self.get_field_names(self.child_class)
+        class_reference = weakref.ref(self.child_class)
+
+        self.child_class = None
+        gc.collect()
+        self.assertIsNone(class_reference())
+
+    def test_mixin_with_metaclass(self):
+        """Test that tests can inherit from classes with other metaclasses."""
+        class AbstractMixin(six.with_metaclass(ABCMeta, object)):
+            mixin_request = BaseResource.request()
+
+        class MixinCase(TestCase, AbstractMixin):
+            case_request = BaseResource.request()
+
+        self.assertEqual(self.get_field_names(MixinCase),
+                         ["mixin_request", "case_request"])
+
+    def test_invalidation(self):
+        """Test that setting class attributes invalidates the cache."""
+        self.assertEqual(self.get_field_names(self.child_class),
+                         ["first", "second"])
+
+        self.parent_class.third = BaseResource.request()
+        self.assertEqual(self.get_field_names(self.child_class),
+                         ["first", "third", "second"])
+
+        del self.child_class.second
+        self.assertEqual(self.get_field_names(self.child_class),
+                         ["first", "third"])
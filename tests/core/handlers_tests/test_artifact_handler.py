@@ -0,0 +1,93 @@
+"""Test Rotest's artifact handler."""
+# pylint: disable=protected-access
+from __future__ import absolute_import
+
+import os
+import sys
+import shutil
+import zipfile
+import tempfile
+
+import mock
+
+from rotest.core.result.handlers.artifact_handler import (ArtifactHandler,
+                                                         OPEN_HANDLERS)
+
+from tests.core.handlers_tests.base_result_handler_test import \
+    BaseResultHandlerTest
+
+
+class TestArtifactHandler(BaseResultHandlerTest):
+    """Test artifact handler's functionality."""
+    __test__ = True
+
+    def setUp(self):
+        """Create the artifacts in a temporary directory."""
+        self.artifacts_dir = tempfile.mkdtemp()
+        patcher = mock.patch("rotest.common.config.ARTIFACTS_DIR",
+                             self.artifacts_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.artifacts_dir)
+
+        super(TestArtifactHandler, self).setUp()
+
+    def get_result_handler(self):
+        """Get an instance of ArtifactHandler.
+
+        Returns:
+            ArtifactHandler. An instance of ArtifactHandler to test with.
+        """
+        return ArtifactHandler(main_test=self.main_test)
+
+    def validate_stop_test_run(self):
+        """Validate that the artifact is complete.
+
+        Raises:
+            AssertionError. the artifact is invalid.
+        """
+        with zipfile.ZipFile(self.handler.artifact_path) as artifact:
+            self.assertIsNone(artifact.testzip())
+
+    def test_archive_each_file_once(self):
+        """Test that files of nested work dirs are archived once."""
+        case = next(iter(self.components))
+        case_file = os.path.join(case.work_dir, "case.log")
+        with open(case_file, "w") as log_file:
+            log_file.write("case log")
+
+        run_file = os.path.join(self.main_test.work_dir, "run.log")
+        with open(run_file, "w") as log_file:
+            log_file.write("run log")
+
+        self.handler.start_test_run()
+        self.handler.stop_test(case)
+        self.handler.stop_test(case.parent)
+        self.handler.stop_test_run()
+
+        with zipfile.ZipFile(self.handler.artifact_path) as artifact:
+            names = [os.path.basename(name) for name in artifact.namelist()]
+            self.assertEqual(names.count("case.log"), 1)
+            self.assertEqual(names.count("run.log"), 1)
+            self.assertEqual(artifact.getinfo(case_file.lstrip(os.sep)).
+                             compress_type, zipfile.ZIP_DEFLATED)
+
+    def test_compression_level(self):
+        """Test that the compression level is used where it's supported."""
+        self.handler.stop_test_run()
+        with mock.patch("rotest.common.config.ARTIFACTS_COMPRESSION_LEVEL",
+                        "9"), mock.patch("zipfile.ZipFile") as zip_file:
+            self.handler._open_artifact()
+
+        _, options = zip_file.call_args
+        if sys.version_info >= (3, 7):
+            self.assertEqual(options["compresslevel"], 9)
+
+        else:
+            self.assertNotIn("compresslevel", options)
+
+    def test_finished_artifact_released(self):
+        """Test that the handler isn't kept after its artifact completes."""
+        self.assertIn(self.handler, OPEN_HANDLERS)
+        self.handler.stop_test_run()
+        self.assertNotIn(self.handler, OPEN_HANDLERS)
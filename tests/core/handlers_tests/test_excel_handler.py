@@ -10,6 +10,7 @@ from future.builtins import range
 from future.utils import iteritems
 
 from rotest.core.block import TestBlock
+from rotest.core.models.case_data import TestOutcome
 from rotest.core.result.handlers.excel_handler import ExcelHandler
 
 from tests.core.handlers_tests.base_result_handler_test import \
@@ -57,7 +58,10 @@ class TestExcelHandler(BaseResultHandlerTest):
         Returns:
             TestExcelHandler. An instance of TestExcelHandler to test with.
         """
-        return ExcelHandler(self.main_test)
+        handler = ExcelHandler(self.main_test)
+        # Save the report on every event, to validate it after each one
+        handler.SAVE_INTERVAL = 0
+        return handler
 
     def _read_excel(self):
         """Read the excel workbook and sheet."""
@@ -232,3 +236,51 @@ class TestExcelHandler(BaseResultHandlerTest):
             actual_cell = actual_sheet.cell(row, col)
             expected_cell = expected_sheet.cell(row, col)
             self.assertEqual(actual_cell, expected_cell)
+
+    def _read_result(self, test):
+        """Read the result of a test from the excel file.
+
+        Args:
+            test (TestCase / TestBlock): test to read its result.
+
+        Returns:
+            str. the result written in the excel file.
+        """
+        self._read_excel()
+        return self.worksheet.cell_value(
+                                rowx=self.handler.test_to_row[test.identifier],
+                                colx=self.RESULT_COLUMN)
+
+    def test_debounced_save(self):
+        """Test that the report is saved once per interval and at the end."""
+        self.handler.SAVE_INTERVAL = 3600
+        self.handler.start_test_run()
+        case = next(iter(self.components))
+        initial_result = self._read_result(case)
+
+        self.handler.start_test(case)
+        case.data.exception_type = TestOutcome.SUCCESS
+        self.handler.add_success(case)
+        self.assertEqual(self._read_result(case), initial_result)
+
+        self.handler.stop_test_run()
+        self.assertIn(ExcelHandler.SUCCESS, self._read_result(case))
+
+    def test_multiple_sheets(self):
+        """Test that long reports continue in additional sheets."""
+        self.handler.MAX_SHEET_ROWS = 10
+        self.handler.start_test_run()
+        self._read_excel()
+
+        self.assertGreater(self.workbook.nsheets, 1)
+        for worksheet in self.workbook.sheets():
+            self.assertEqual(worksheet.row_values(self.HEADERS_ROW),
+                             list(ExcelHandler.HEADERS))
+
+        for test in self.components:
+            sheet, row = self.handler._get_sheet_row(
+                                    self.handler.test_to_row[test.identifier])
+            worksheet = self.workbook.sheet_by_name(sheet.name)
+            self.assertIn(ExcelHandler.DID_NOT_RUN,
+                          worksheet.cell_value(rowx=row,
+                                               colx=self.RESULT_COLUMN))
@@ -0,0 +1,119 @@
+"""Test Rotest's signature handler."""
+from __future__ import absolute_import
+
+import os
+import time
+import threading
+
+import mock
+from attrdict import AttrDict
+from six.moves import StringIO
+from django.test.testcases import TransactionTestCase
+
+from rotest.common.log import flush_logs, release_test_logger
+from rotest.core.result.handlers.signature_handler import SignatureHandler
+
+from tests.core.utils import MockCase1, MockCase2, MockTestSuite
+
+
+class TestSignatureHandler(TransactionTestCase):
+    """Test signature handler's functionality."""
+    @mock.patch("rotest.core.result.handlers.signature_handler."
+                "ClientSignatureManager")
+    def setUp(self, client_class):
+        """Create a handler with a mocked signatures client."""
+        MockTestSuite.components = (MockCase1, MockCase2)
+        self.main_test = MockTestSuite()
+        self.client = client_class.return_value
+        self.client.get_or_create_signatures.side_effect = \
+            self.get_or_create_signatures
+
+        self.stream = StringIO()
+        self.handler = SignatureHandler(main_test=self.main_test,
+                                        stream=self.stream)
+
+    @staticmethod
+    def get_or_create_signatures(errors):
+        """Mock the server's response, creating a signature for each error.
+
+        Args:
+            errors (list): strings of the errors.
+
+        Returns:
+            list. the signature data of each error.
+        """
+        return [AttrDict(is_new=True, id=index + 1, link="")
+                for index, _ in enumerate(errors)]
+
+    def test_repeated_errors(self):
+        """Test that repeating errors are resolved once and summarized."""
+        first_case, second_case = self.main_test
+        self.handler.add_error(first_case,
+                               "ValueError: device 0x7f3a timed out")
+        self.handler.add_error(second_case,
+                               "ValueError: device 0x55e0 timed out")
+        self.handler.stop_test_run()
+        self.handler.print_errors()
+
+        sent_errors = [error
+                       for call_args in
+                       self.client.get_or_create_signatures.call_args_list
+                       for error in call_args[0][0]]
+        self.assertEqual(len(sent_errors), 1)
+        self.assertEqual(self.handler.encounters,
+                         ["Encountered new issue. Assigned ID=1",
+                          "Encountered known issue ID=1, link="])
+        self.assertIn("Encountered known issue ID=1", self.stream.getvalue())
+
+    def test_encounter_in_test_log(self):
+        """Test that the encounter is written to the test's log."""
+        def get_or_create_signatures(errors):
+            time.sleep(0.1)
+            return self.get_or_create_signatures(errors)
+
+        self.client.get_or_create_signatures.side_effect = \
+            get_or_create_signatures
+
+        test_case = next(iter(self.main_test))
+        self.handler.add_error(test_case, "ValueError: device timed out")
+        self.handler.stop_test(test_case)
+        release_test_logger(test_case.logger)
+        flush_logs()
+
+        log_content = ""
+        for file_name in os.listdir(test_case.work_dir):
+            with open(os.path.join(test_case.work_dir, file_name)) as log_file:
+                log_content += log_file.read()
+
+        self.assertIn("Encountered new issue. Assigned ID=1", log_content)
+        self.handler.stop_test_run()
+
+    def test_batched_errors(self):
+        """Test that the errors pending together are sent in one request."""
+        called = threading.Event()
+        release = threading.Event()
+
+        def get_or_create_signatures(errors):
+            called.set()
+            release.wait()
+            return self.get_or_create_signatures(errors)
+
+        self.client.get_or_create_signatures.side_effect = \
+            get_or_create_signatures
+
+        first_case, second_case = self.main_test
+        self.handler.add_error(first_case, "ValueError: device timed out")
+        called.wait()
+        for error in ("KeyError: missing key", "IOError: disk is full",
+                      "OSError: no such file"):
+            self.handler.add_error(second_case, error)
+
+        release.set()
+        self.handler.stop_test(second_case)
+
+        calls = self.client.get_or_create_signatures.call_args_list
+        self.assertEqual([list(call_args[0][0]) for call_args in calls],
+                         [["ValueError: device timed out"],
+                          ["KeyError: missing key", "IOError: disk is full",
+                           "OSError: no such file"]])
+        self.handler.stop_test_run()
@@ -14,6 +14,7 @@ import pytest
 from future.builtins import range
 from six.moves import queue
 
+from rotest.common.config import ROTEST_WORK_DIR
 from rotest.core.runners.multiprocess.manager.runner import MultiprocessRunner
 
 from tests.core.utils import MockSuite1, BasicRotestUnitTest
@@ -204,10 +205,52 @@ class TestMultipleWorkers(AbstractMultiprocessRunnerTest):
                          resources_locked)
 
 
+class TestWorkersWorkDirs(AbstractMultiprocessRunnerTest):
+    """Test the work directories created by several workers."""
+
+    PROCESSES_NUMBER = 2
+
+    def test_single_run_directory(self):
+        """Test that the workers share the run's work directories.
+
+        * Runs a suite of four cases using two workers.
+        * Validates that exactly one run directory was created.
+        * Validates that exactly one directory was created for each case.
+        """
+        BasicMultiprocessCase.pid_queue = self.pid_queue
+        BasicMultiprocessCase.post_timeout_event = self.post_timeout_event
+
+        MockSuite1.components = (BasicMultiprocessCase,) * 4
+
+        previous_dirs = set(os.listdir(ROTEST_WORK_DIR))
+        self.runner.run(MockSuite1)
+        run_dirs = set(os.listdir(ROTEST_WORK_DIR)) - previous_dirs
+
+        run_dir = self.runner.test_item.work_dir
+        self.assertEqual(run_dirs, {os.path.basename(run_dir)})
+
+        case_dirs = [name for name in os.listdir(run_dir)
+                     if os.path.isdir(os.path.join(run_dir, name))]
+        self.assertEqual(sorted(name.split("_")[0] for name in case_dirs),
+                         ["1", "2", "3", "4"])
+
+    def test_manager_creates_run_directory_only(self):
+        """Test that the cases' directories are left for the workers."""
+        MockSuite1.components = (BasicMultiprocessCase,) * 4
+
+        main_test = MockSuite1()
+        self.runner.create_work_dirs(main_test)
+
+        self.assertEqual(os.listdir(main_test.work_dir), [])
+        for test in main_test:
+            self.assertNotIn("work_dir", vars(test))
+
+
 class TestMultiprocessRunnerSuite(unittest.TestSuite):
     """A test suite for multiprocess runner's tests."""
     TESTS = [TestMultiprocessRunner,
-             TestMultipleWorkers]
+             TestMultipleWorkers,
+             TestWorkersWorkDirs]
 
     def __init__(self):
         """Construct the class."""
@@ -0,0 +1,37 @@
+"""Test Rotest's tags filter expressions."""
+from __future__ import absolute_import
+
+import pytest
+
+from rotest.core.filter import match_tags, compile_tags_filter
+
+
+@pytest.mark.parametrize("tags_filter, expected", [
+    ("Tag1", True),
+    ("tag2", True),
+    ("Tag*", True),
+    ("Tag3", False),
+    ("Tag1 and Tag3", False),
+    ("Tag3 or Tag1", True),
+    ("not Tag3 and Tag2", True),
+    ("not (Tag3 or Tag1)", False),
+    ("Tag3 or Tag1 and not Tag2", False),
+    ("(Tag1)and(Tag2 or False)", True),
+    ("not not True", True),
+])
+def test_matching_tags(tags_filter, expected):
+    assert match_tags(["Tag1", "Tag2"], tags_filter) is expected
+
+
+@pytest.mark.parametrize("tags_filter", [
+    "", "Tag1 Tag2", "Tag1 and", "(Tag1", "Tag1)", "and Tag1", "not"])
+def test_illegal_expressions(tags_filter):
+    with pytest.raises(ValueError):
+        match_tags(["Tag1"], tags_filter)
+
+
+def test_compiling_once():
+    tags_filter = compile_tags_filter("Tag1 or Tag2")
+    assert compile_tags_filter("Tag1 or Tag2") is tags_filter
+    assert tags_filter(["tag2"])
+    assert not tags_filter(["Tag3"])
@@ -2,6 +2,7 @@
 # pylint: disable=no-init,too-many-public-methods
 # pylint: disable=too-many-lines,too-many-arguments,too-many-locals
 from __future__ import absolute_import
+from threading import Event
 
 from future.builtins import object
 
@@ -1116,6 +1117,133 @@ class TestTestFlow(BasicRotestUnitTest):
         self.assertEqual(test_flow.data.exception_type, TestOutcome.FAILED,
                          'Flow data status should have been failure')
 
+    def test_jump_back_to_failed_block(self):
+        """Validate the result of re-running a failed block that now passes.
+
+        We check that a FINALLY block can jump back to a failed CRITICAL
+        block, and once it passes, the blocks after it aren't skipped.
+        """
+        runs = {"flaky": 0, "jumping": 0}
+
+        class FlakyBlock(MockBlock):
+            """Mock block, fails only on its first run."""
+            __test__ = False
+
+            def test_flaky(self):
+                runs["flaky"] += 1
+                if runs["flaky"] == 1:
+                    self.fail("First run")
+
+        class JumpingBlock(MockBlock):
+            """Mock block, jumps to the start of the flow on its first run."""
+            __test__ = False
+
+            def test_jump(self):
+                runs["jumping"] += 1
+                if runs["jumping"] == 1:
+                    self.parent.jump_to(0)
+
+        MockFlow.blocks = (FlakyBlock.params(mode=MODE_CRITICAL),
+                           JumpingBlock.params(mode=MODE_FINALLY),
+                           SuccessBlock.params(mode=MODE_CRITICAL))
+
+        test_flow = MockFlow()
+        self.run_test(test_flow)
+
+        self.assertEqual(runs, {"flaky": 2, "jumping": 2},
+                         "The blocks didn't re-run after the jump")
+
+        self.assertTrue(self.result.wasSuccessful(),
+                        'Flow failed when it should have succeeded')
+
+        self.validate_blocks(test_flow, successes=3)
+
+        # === Validate data object ===
+        self.assertTrue(test_flow.data.success,
+                        'Flow data result should have been True')
+
+        self.assertEqual(test_flow.data.exception_type, TestOutcome.SUCCESS,
+                         'Flow data status should have been success')
+
+    def test_parallel_blocks(self):
+        """Validate behavior of blocks under a parallel flow.
+
+        * The first block waits for the second one, so they must run together.
+        * The output of the third block is available after the parallel flow.
+        """
+        field_name = 'some_field'
+        field_value = 'some_value'
+        started_event = Event()
+
+        class WaitingBlock(MockBlock):
+            def test_wait(self):
+                self.assertTrue(started_event.wait(5),
+                                "Blocks didn't run concurrently")
+
+        class SignalingBlock(MockBlock):
+            def test_signal(self):  # pylint: disable=no-self-use
+                started_event.set()
+
+        class ParallelFlow(MockSubFlow):
+            PARALLEL = True
+            blocks = (WaitingBlock,
+                      SignalingBlock,
+                      create_writer_block(inject_name=field_name,
+                                          inject_value=field_value))
+
+        MockFlow.blocks = (ParallelFlow,
+                           create_reader_block(inject_name=field_name,
+                                               inject_value=field_value))
+
+        test_flow = MockFlow()
+        self.run_test(test_flow)
+
+        self.assertTrue(self.result.wasSuccessful(),
+                        'Flow failed when it should have succeeded')
+
+        self.validate_blocks(test_flow, successes=2)
+        self.validate_blocks(list(test_flow)[0], successes=3)
+
+    def test_parallel_blocks_failure(self):
+        """Validate behavior of blocks after a failure in a parallel flow.
+
+        We check that the parallel blocks don't skip on each other's failure,
+        but the blocks after the parallel flow follow their modes.
+        """
+        class ParallelFlow(MockSubFlow):
+            PARALLEL = True
+            blocks = (FailureBlock.params(mode=MODE_CRITICAL),
+                      SuccessBlock.params(mode=MODE_CRITICAL),
+                      SuccessBlock.params(mode=MODE_OPTIONAL))
+
+        MockFlow.blocks = (ParallelFlow,
+                           SuccessBlock.params(mode=MODE_CRITICAL),
+                           SuccessBlock.params(mode=MODE_FINALLY))
+
+        test_flow = MockFlow()
+        self.run_test(test_flow)
+
+        self.assertFalse(self.result.wasSuccessful(),
+                         'Flow succeeded when it should have failed')
+
+        self.validate_blocks(test_flow, successes=1, failures=1, skips=1)
+        self.validate_blocks(list(test_flow)[0], successes=2, failures=1)
+
+        self.assertEqual(test_flow.data.exception_type, TestOutcome.FAILED,
+                         'Flow data status should have been failure')
+
+    def test_parallel_blocks_inputs_static_check(self):
+        """Test that parallel blocks don't get each other's outputs."""
+        class ParallelFlow(MockSubFlow):
+            PARALLEL = True
+            blocks = (create_writer_block(inject_name='some_name'),
+                      create_reader_block(inject_name='some_name'))
+
+        MockFlow.blocks = (ParallelFlow,)
+
+        with self.assertRaises(AttributeError):
+            MockFlow()
+
     def test_sub_flow_inputs(self):
         """Test behavior of inputs validation of sub-flows in positive case.
 
@@ -2,10 +2,14 @@
 # pylint: disable=too-many-arguments
 # pylint: disable=protected-access,too-many-public-methods,invalid-name
 from __future__ import absolute_import
+import mock
+
 from rotest.core.runner import run
 from rotest.core.models.run_data import RunData
+from rotest.core.models.general_data import GeneralData
 from rotest.core.models.case_data import TestOutcome
-from rotest.core.result.handlers.db_handler import DBHandler
+from rotest.core.result.handlers.db_handler import (DBHandler,
+                                                   PENDING_HANDLERS)
 
 from tests.core.utils import (ErrorCase, SuccessCase, FailureCase, SkipCase,
                               MockSuite1, MockSuite2, MockNestedTestSuite,
@@ -370,6 +374,25 @@ class TestRunDelta(BasicRotestUnitTest):
         self.validate_suite_data(second_delta_suite, True, successes=1,
                                  skips=1)
 
+    def test_delta_iterations_multiprocess(self):
+        """Test run delta when running the tests in worker processes.
+
+        * Runs a suite with success & failure cases using a worker process.
+        * Validates that in the first run, both tests were run and one
+          succeeded.
+        * Validates that in the second run, the successful test was skipped
+          according to the decision made by the main process.
+        """
+        MockTestSuite.components = (SuccessCase, FailureCase)
+
+        runs_data = run(MockTestSuite, delta_iterations=2,
+                        processes_number=1, outputs=(DBHandler.NAME,))
+        full_suite, delta_suite = [run_data.main_test
+                                   for run_data in runs_data]
+
+        self.validate_suite_data(full_suite, False, successes=1, fails=1)
+        self.validate_suite_data(delta_suite, False, skips=1, fails=1)
+
     def test_different_run_names(self):
         """Test run delta on runs with different run names.
 
@@ -436,3 +459,33 @@ class TestRunDelta(BasicRotestUnitTest):
                         outputs=(DBHandler.NAME,), run_name='run1')
         self.validate_suite_data(run_data.main_test, False, successes=1,
                                  fails=1)
+
+    def test_write_behind(self):
+        """Test run delta when the DB handler buffers the tests' datas.
+
+        * Runs a suite with success & failure cases, buffering the datas.
+        * Validates that the datas were saved only at the end of the run.
+        * Runs the same cases with delta flag.
+        * Validates that only the failed test ran in the second run.
+        """
+        MockTestSuite.components = (SuccessCase, FailureCase)
+
+        with mock.patch.object(DBHandler, "FLUSH_INTERVAL", 3600):
+            main_test = MockTestSuite(run_data=RunData(run_name='run1'))
+            result = self.create_result(main_test)
+            handler, = result.result_handlers
+            self.assertIn(handler, PENDING_HANDLERS)
+            main_test.run(result)
+
+            self.assertFalse(GeneralData.objects.filter(
+                                    end_time__isnull=False).exists())
+
+            result.stopTestRun()
+            self.assertNotIn(handler, PENDING_HANDLERS)
+            self.validate_suite_data(main_test.data, False, successes=1,
+                                     fails=1)
+
+            run_data, = run(MockTestSuite, delta_iterations=1,
+                            outputs=(DBHandler.NAME,), run_name='run1')
+
+        self.validate_suite_data(run_data.main_test, False, skips=1, fails=1)
@@ -361,3 +361,37 @@ class TestTestSuite(BasicRotestUnitTest):
             (test_suite.data, test_suite.work_dir, ROTEST_WORK_DIR))
 
         self.validate_work_dirs(test_suite)
+
+    def test_lazy_working_dir(self):
+        """Test that the working directories are created on their first use.
+
+        Validates that creating the tests doesn't create their directories,
+        and that using a sub test's directory creates it under its parent's.
+        """
+        MockFlow.blocks = (SuccessBlock, SuccessBlock)
+        MockSuite1.components = (SuccessCase, MockFlow)
+        MockTestSuite.components = (MockSuite1,)
+
+        test_suite = MockTestSuite()
+        sub_suite = next(iter(test_suite))
+        flow = list(sub_suite)[1]
+        block = next(iter(flow))
+        for test in (test_suite, sub_suite, flow, block):
+            self.assertNotIn("work_dir", vars(test))
+
+        self.assertTrue(os.path.isdir(block.work_dir))
+        self.assertEqual(block.work_dir,
+                         os.path.join(test_suite.work_dir, "1_MockSuite1",
+                                      "2_MockFlow",
+                                      "1_SuccessBlock.test_success"))
+        self.assertEqual(os.path.dirname(sub_suite.work_dir),
+                         test_suite.work_dir)
+
+    def test_working_dir_of_repeated_tests(self):
+        """Test that repeated tests get the work directory of their index."""
+        MockTestSuite.components = (SuccessCase, SuccessCase)
+
+        test_suite = MockTestSuite()
+        work_dir_names = [os.path.basename(test.work_dir).split("_")[0]
+                          for test in test_suite]
+        self.assertEqual(work_dir_names, ["1", "2"])
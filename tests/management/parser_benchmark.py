@@ -0,0 +1,171 @@
+"""Benchmark the resource manager's message parsers.
+
+Encodes and decodes messages like the ones the client and the server pass
+during a run, and prints the best time of each parser for each message:
+
+* A ResourcesReply of resource data, half of them complex resource data.
+* A LockResources message of resource descriptors.
+* A StartTestRun message of a nested tests tree.
+
+Run it directly, e.g. ``python tests/management/parser_benchmark.py``.
+"""
+from __future__ import absolute_import, print_function
+
+import copy
+import timeit
+import argparse
+from functools import partial
+
+from future.builtins import range
+
+from rotest.management.models.ut_resources import DemoResource
+from rotest.management.common.parsers import JSONParser, CompactParser
+from rotest.management.common.resource_descriptor import ResourceDescriptor
+from rotest.management.models.ut_models import (DemoResourceData,
+                                                DemoComplexResourceData)
+from rotest.management.common.messages import (StartTestRun,
+                                               LockResources,
+                                               ResourcesReply)
+
+PARSERS = (JSONParser, CompactParser)
+
+
+def create_resources_reply(resources_number):
+    """Create a resources reply message of simple and complex resources.
+
+    Args:
+        resources_number (number): number of resources in the reply.
+
+    Returns:
+        ResourcesReply. the resources reply message.
+    """
+    resources = []
+    for index in range(resources_number // 2):
+        demo1 = DemoResourceData(name="demo1_%d" % index, version=1,
+                                 ip_address="1.2.3.%d" % (index % 256))
+        demo2 = DemoResourceData(name="demo2_%d" % index, version=2,
+                                 ip_address="1.2.4.%d" % (index % 256))
+        resources.append(demo1)
+        resources.append(DemoComplexResourceData(name="complex_%d" % index,
+                                                 demo1=demo1,
+                                                 demo2=demo2))
+
+    return ResourcesReply(request_id=0, resources=resources)
+
+
+def create_lock_resources(descriptors_number):
+    """Create a lock resources message of resource descriptors.
+
+    Args:
+        descriptors_number (number): number of descriptors in the message.
+
+    Returns:
+        LockResources. the lock resources message.
+    """
+    descriptors = [ResourceDescriptor(DemoResource,
+                                      name="resource_%d" % index,
+                                      ip_address="1.2.3.%d" % (index % 256),
+                                      version=index).encode()
+                   for index in range(descriptors_number)]
+
+    return LockResources(descriptors=descriptors, timeout=10)
+
+
+def create_start_test_run(tests_number):
+    """Create a start test run message of a tree of suites, flows and blocks.
+
+    Args:
+        tests_number (number): number of flows in the tree, each flow has
+            two blocks.
+
+    Returns:
+        StartTestRun. the start test run message.
+    """
+    identifiers = iter(range(1, 4 * tests_number))
+
+    def create_test(name, class_code, subtests=()):
+        return {"id": next(identifiers),
+                "name": name,
+                "class": class_code,
+                "subtests": list(subtests)}
+
+    suites = []
+    for suite_index in range(tests_number // 20):
+        flows = [create_test("Flow%d" % flow_index, "TestFlow",
+                             [create_test("Block%d" % block_index,
+                                          "TestBlock")
+                              for block_index in range(2)])
+                 for flow_index in range(20)]
+
+        suites.append(create_test("Suite%d" % suite_index, "TestSuite",
+                                  flows))
+
+    tests_tree = create_test("MainSuite", "TestSuite", suites)
+    return StartTestRun(tests=tests_tree,
+                        run_data={"run_name": "benchmark",
+                                  "config": {"timeout": 10.5,
+                                             "debug": False,
+                                             "outputs": ["dots", "db"]}})
+
+
+def decode_message(message_parser, encoded_message):
+    """Decode a copy of the encoded message, since decoding may modify it.
+
+    Args:
+        message_parser (AbstractParser): parser to decode the message with.
+        encoded_message (object): the encoded message.
+
+    Returns:
+        AbstractMessage. the decoded message.
+    """
+    return message_parser.decode(copy.copy(encoded_message))
+
+
+def measure(function, repeat, number):
+    """Return the best time of running the function, in milliseconds.
+
+    Args:
+        function (callable): function to measure.
+        repeat (number): number of measurements.
+        number (number): number of runs in each measurement.
+
+    Returns:
+        number. the best time of a single run, in milliseconds.
+    """
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / \
+        number * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=25,
+                        help="number of measurements of each operation")
+    parser.add_argument("--number", type=int, default=50,
+                        help="number of runs in each measurement")
+    arguments = parser.parse_args()
+
+    messages = (("ResourcesReply, 50 resource data",
+                 create_resources_reply(50)),
+                ("LockResources, 50 descriptors",
+                 create_lock_resources(50)),
+                ("StartTestRun, 200 tests tree",
+                 create_start_test_run(200)))
+
+    for parser_class in PARSERS:
+        message_parser = parser_class()
+        print(parser_class.__name__)
+        for description, message in messages:
+            message.msg_id = 1
+            encoded_message = message_parser.encode(message)
+            encode_time = measure(partial(message_parser.encode, message),
+                                  arguments.repeat, arguments.number)
+            decode_time = measure(partial(decode_message, message_parser,
+                                          encoded_message),
+                                  arguments.repeat, arguments.number)
+
+            print("  %-35s encode %.2fms, decode %.2fms" %
+                  (description, encode_time, decode_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 """Abstract Testing class for any kind of parser."""
 from __future__ import absolute_import
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 
 import six
 from django.test.testcases import TransactionTestCase
 
-from rotest.management.common.parsers import JSONParser
+from rotest.management.common.parsers import JSONParser, CompactParser
+from rotest.management.common.parsers.abstract_parser import ParsingError
 from rotest.management.models.ut_resources import DemoResource
 from rotest.management.common.resource_descriptor import ResourceDescriptor
 from rotest.management.models.ut_models import (DemoResourceData,
@@ -127,3 +129,28 @@ class TestJSONParser(AbstractTestParser):
     def setUpClass(cls):
         """Initialize the parser."""
         cls.PARSER = JSONParser()
+
+    def test_encoding_derived_types(self):
+        """Test encoding data whose types derive from the supported types."""
+        data = OrderedDict([("key", [True, 1.5, u"value", None])])
+        encoded_data = self.PARSER.recursive_encode(data)
+        self.assertEqual(self.PARSER.recursive_decode(encoded_data),
+                         dict(data))
+
+    def test_unsupported_types(self):
+        """Test that unsupported data and elements are rejected."""
+        with self.assertRaises(TypeError):
+            self.PARSER.recursive_encode(object())
+
+        with self.assertRaises(ParsingError):
+            self.PARSER.recursive_decode({"Unknown": []})
+
+
+class TestCompactParser(AbstractTestParser):
+    """Test the compact parser module."""
+    __test__ = True
+
+    @classmethod
+    def setUpClass(cls):
+        """Initialize the parser."""
+        cls.PARSER = CompactParser()
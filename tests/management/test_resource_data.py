@@ -0,0 +1,70 @@
+"""Test the saving of resource data models."""
+from __future__ import absolute_import
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from rotest.management.models.ut_models import (DemoResourceData,
+                                                DemoComplexResourceData)
+
+
+class TestResourceDataSave(TransactionTestCase):
+    """Test that saving resource data updates only the changed fields."""
+    fixtures = ['resource_ut.json']
+
+    def test_saving_changed_fields(self):
+        """Test that a single UPDATE of the changed field is issued."""
+        resource = DemoResourceData.objects.get(name="available_resource1")
+        resource.owner = "user1"
+
+        with CaptureQueriesContext(connection) as queries:
+            resource.save()
+
+        statements = [query["sql"] for query in queries
+                      if query["sql"] != "BEGIN"]
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith("UPDATE"))
+        self.assertIn("owner", statements[0])
+        self.assertNotIn("ip_address", statements[0])
+        self.assertEqual(
+            DemoResourceData.objects.get(name="available_resource1").owner,
+            "user1")
+
+        with CaptureQueriesContext(connection) as queries:
+            resource.save()
+
+        self.assertEqual(len(queries), 0)
+
+    def test_reserving_sub_resources(self):
+        """Test that reservation changes still reach the sub-resources."""
+        resource = DemoComplexResourceData.objects.get(
+            name="complex_resource1")
+        resource.reserved = "user1"
+        resource.save()
+
+        for name in ("available_resource1", "available_resource2"):
+            self.assertEqual(DemoResourceData.objects.get(name=name).reserved,
+                             "user1")
+
+        resource.reserved = ""
+        resource.save()
+
+        for name in ("available_resource1", "available_resource2"):
+            self.assertEqual(DemoResourceData.objects.get(name=name).reserved,
+                             "")
+
+    def test_saving_after_refresh(self):
+        """Test that refreshing from the DB updates the stored values."""
+        resource = DemoResourceData.objects.get(name="available_resource1")
+        DemoResourceData.objects.filter(name="available_resource1").update(
+            owner="user1")
+
+        resource.refresh_from_db()
+        self.assertEqual(resource.owner, "user1")
+
+        resource.owner = ""
+        resource.save()
+        self.assertEqual(
+            DemoResourceData.objects.get(name="available_resource1").owner,
+            "")
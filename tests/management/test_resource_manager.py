@@ -6,8 +6,10 @@ We test resource management behavior under different scenarios.
 # pylint: disable=invalid-name,too-many-public-methods,protected-access
 from __future__ import absolute_import
 
+import os
 import time
-
+import shutil
+import tempfile
 from threading import Thread
 from unittest import TestCase
 
@@ -29,7 +31,8 @@ from rotest.management.models.ut_models import (DemoResourceData,
 
 from rotest.management.models.ut_resources import (DemoService,
                                                    DemoResource,
-                                                   DemoComplexResource)
+                                                   DemoComplexResource,
+                                                   DemoComplexServiceRecursive)
 from rotest.management.common.errors import (ResourceReleaseError,
                                              ResourcePermissionError,
                                              ResourceUnavailableError,
@@ -1655,6 +1658,28 @@ class TestResourceManagement(BaseResourceManagementTest):
 
         self.client.release_resources(list(resources.values()), dirty=True)
 
+    def test_sub_resources_work_dirs(self):
+        """Validate sub resources create their work dirs on first use.
+
+        * Creates a resource with nested sub-resources.
+        * Validates no work directory was created.
+        * Validates the innermost sub-resource's work directory is created
+          under its parents' work directories.
+        """
+        base_work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, base_work_dir)
+
+        resource = DemoComplexServiceRecursive(base_work_dir=base_work_dir)
+        self.assertEqual(os.listdir(base_work_dir), [])
+
+        sub_service = resource.sub_complex_service.sub_service
+        self.assertTrue(os.path.isdir(sub_service.work_dir))
+        self.assertEqual(os.path.dirname(sub_service.work_dir),
+                         resource.sub_complex_service.work_dir)
+        self.assertEqual(
+            os.path.dirname(resource.sub_complex_service.work_dir),
+            resource.work_dir)
+
 
 class TestResourceManagementNotOwnable(BaseResourceManagementTest):
     """Resource requesting tests with not-ownable resources."""
@@ -7,14 +7,19 @@ from future.builtins import next
 from future.utils import itervalues
 from swaggapi.api.builder.client import requester
 
-from rotest.core.models import GeneralData
+from rotest.core.models import GeneralData, SuiteData
 from rotest.core.models.run_data import RunData
 from rotest.management.common.utils import LOCALHOST
 from rotest.common.django_utils.common import get_sub_model
 from rotest.core.models.case_data import TestOutcome, CaseData
 from rotest.management.models.ut_resources import DemoResource
 from rotest.management.models.ut_models import DemoResourceData
+from rotest.management.client.result_reporter import ResultReporter
 from rotest.management.client.result_client import ClientResultManager
+from rotest.management.common.utils import (START_TEST_EVENT,
+                                            STOP_TEST_EVENT,
+                                            START_COMPOSITE_EVENT,
+                                            STOP_COMPOSITE_EVENT)
 
 from tests.management.resource_base_test import BaseResourceManagementTest
 from tests.core.utils import (MockTestSuite, MockSuite1, MockSuite2, MockCase,
@@ -140,6 +145,21 @@ class TestResultManagement(BaseResourceManagementTest):
 
         self.assertEqual(db_run_data.run_name, run_data.run_name)
 
+    def test_tree_classes_table(self):
+        """Test that each test data class is encoded once in the tree."""
+        MockSuite1.components = (MockSuite2, MockTestSuite)
+        MockSuite2.components = (MockCase, MockCase1, MockCase2)
+        MockTestSuite.components = (SuccessCase,)
+
+        main_test = MockSuite1(run_data=RunData(run_name=None))
+        data_classes = {}
+        tests_tree = ClientResultManager._create_test_dict(main_test,
+                                                           data_classes)
+
+        self.assertEqual(data_classes, {SuiteData: 0, CaseData: 1})
+        self.assertEqual(tests_tree["class"], 0)
+        self.assertEqual(tests_tree["subtests"][0]["subtests"][0]["class"], 1)
+
     def test_start_test(self):
         """Test that the start_test method starts the test's data."""
         MockTestSuite.components = (SuccessCase,)
@@ -267,3 +287,104 @@ class TestResultManagement(BaseResourceManagementTest):
         self._validate_test_result(test_case, success=False,
                             error_tuple=(TestOutcome.ERROR, EXPECTED_STRING))
         self._validate_test_result(main_test, success=False)
+
+    def test_report_events(self):
+        """Test that a batch of events updates the tests' data in order."""
+        MockTestSuite.components = (SuccessCase,)
+
+        run_data = RunData(run_name=None)
+        main_test = MockTestSuite(run_data=run_data)
+        test_case = next(iter(main_test))
+        test_case.locked_resources = {'test_resource': DemoResource(
+            data=DemoResourceData.objects.get(name='available_resource1'))}
+
+        self.client.start_test_run(main_test)
+        self.client.report_events([
+            self.client.create_event(START_COMPOSITE_EVENT, main_test),
+            self.client.create_event(START_TEST_EVENT, test_case),
+            self.client.create_resources_event(test_case),
+            self.client.create_event(STOP_TEST_EVENT, test_case),
+            self.client.create_result_event(test_case, TestOutcome.ERROR,
+                                            'test error'),
+            self.client.create_event(STOP_COMPOSITE_EVENT, main_test)])
+
+        self._validate_has_times(test_case, start_time=True, end_time=True)
+        self._validate_has_times(main_test, start_time=True, end_time=True)
+        self._validate_test_result(test_case, success=False,
+                                   error_tuple=(TestOutcome.ERROR,
+                                                'ERROR: test error'))
+        self._validate_test_result(main_test, success=False)
+        test_data = CaseData.objects.get(name=test_case.data.name)
+        self.assertEqual(test_data.resources.get().name,
+                         'available_resource1')
+
+    def test_result_reporter(self):
+        """Test that the reporter sends all the events in batches."""
+        MockSuite2.components = (MockCase, MockCase1, MockCase2)
+
+        run_data = RunData(run_name=None)
+        main_test = MockSuite2(run_data=run_data)
+        self.client.start_test_run(main_test)
+
+        reporter = ResultReporter(self.client)
+        with mock.patch.object(self.client, "report_events",
+                               wraps=self.client.report_events) as report:
+            reporter.start()
+            for test_case in main_test:
+                reporter.report(self.client.create_event(START_TEST_EVENT,
+                                                         test_case))
+                reporter.report(self.client.create_event(STOP_TEST_EVENT,
+                                                         test_case))
+
+            reporter.stop()
+
+        sent_events = sum(len(call_args[0][0])
+                          for call_args in report.call_args_list)
+        self.assertEqual(sent_events, 2 * len(list(main_test)))
+        self.assertLess(report.call_count, sent_events)
+        for test_case in main_test:
+            self._validate_has_times(test_case, start_time=True,
+                                     end_time=True)
+
+    def test_result_reporter_failed_event(self):
+        """Test that an invalid event doesn't discard the rest of its batch."""
+        MockTestSuite.components = (SuccessCase,)
+
+        run_data = RunData(run_name=None)
+        main_test = MockTestSuite(run_data=run_data)
+        test_case = next(iter(main_test))
+        self.client.start_test_run(main_test)
+
+        logger = mock.MagicMock()
+        reporter = ResultReporter(self.client, logger=logger)
+        reporter.start()
+        reporter.report(self.client.create_event(START_TEST_EVENT, test_case))
+        reporter.report(self.client.create_event("no_such_event", test_case))
+        reporter.report(self.client.create_event(STOP_TEST_EVENT, test_case))
+        reporter.stop()
+
+        self._validate_has_times(test_case, start_time=True, end_time=True)
+        self.assertEqual(logger.error.call_count, 1)
+        self.assertEqual(logger.error.call_args[0][1]["event"],
+                         "no_such_event")
+
+    def test_get_batch_statistics(self):
+        """Test that the client gets the statistics of many tests at once."""
+        MockTestSuite.components = (SuccessCase,)
+
+        run_data = RunData(run_name=None)
+        main_test = MockTestSuite(run_data=run_data)
+        test_case = next(iter(main_test))
+
+        self.client.start_test_run(main_test)
+        self.client.start_test(test_case)
+        self.client.add_result(test_case, TestOutcome.SUCCESS)
+        self.client.stop_test(test_case)
+
+        statistics = self.client.get_batch_statistics(
+                                    [test_case.data.name, "NoSuchTest"],
+                                    min_duration_cut=0)
+
+        self.assertEqual(list(statistics.keys()), [test_case.data.name])
+        self.assertEqual(set(statistics[test_case.data.name].keys()),
+                         {"min", "avg", "max"})